@@ -22,7 +22,8 @@ from pathlib import Path
 import re
 
 # resolvedor (Tipo 3: variáveis, resoluções e substituições <...>)
-from core import load_quiz
+from core import load_quiz, stats
+from core.cancel import check_cancel, report_progress
 
 # --------------------------------------------------------------------
 # Helpers
@@ -107,6 +108,10 @@ def _label(i: int) -> str:
     abc = "abcdefghijklmnopqrstuvwxyz"
     return abc[i] + ")" if i < len(abc) else f"{i+1})"
 
+def _exists(p: Path) -> bool:
+    stats.count("imagens")
+    return p.exists()
+
 def _is_image_path(x: str) -> bool:
     p, _, _ = _parse_img_spec(x) if isinstance(x, str) else (x, None, None)
     return isinstance(p, str) and any(p.lower().endswith(ext) for ext in IMG_EXTS)
@@ -121,7 +126,7 @@ def render_images(imgs: List[str], base_dir: str | None = None) -> str:
     for img in imgs:
         spec_p, wmm, hmm = _parse_img_spec(img)
         p = Path(base_dir, spec_p) if base_dir else Path(spec_p)
-        if p.exists():
+        if _exists(p):
             if wmm and hmm:
                 lines.append(rf"\includegraphics[width={wmm}mm,height={hmm}mm]{{{p.as_posix()}}}")
             else:
@@ -173,7 +178,7 @@ def render_alts_images(alts: List[str], base_dir: str | None = None) -> str:
         if _is_image_path(alt or ""):
             spec_p, wmm, hmm = _parse_img_spec(alt)
             p = Path(base_dir, spec_p) if base_dir else Path(spec_p)
-            if p.exists():
+            if _exists(p):
                 if wmm and hmm:
                     lines.append(r"\item[" + label + "] " + rf"\includegraphics[width={wmm}mm,height={hmm}mm]{{{p.as_posix()}}}")
                 else:
@@ -216,7 +221,7 @@ def render_alts_grid_beamer_from_list(
         if _is_image_path(a or ""):
             spec_p, wmm, hmm = _parse_img_spec(a)
             p = Path(base_dir, spec_p) if base_dir else Path(spec_p)
-            if p.exists():
+            if _exists(p):
                 if wmm and hmm:
                     content = rf"\includegraphics[width={wmm}mm,height={hmm}mm]{{{p.as_posix()}}}"
                 else:
@@ -266,6 +271,10 @@ def json2beamer(
     resolve_vars=True,             # deixe True para core resolver variáveis
     seed_for_vars=None,            # se None, usa a mesma seed do shuffle
     vars_env=None,                 # dicionário extra para resolver variáveis, se precisar
+    cancel=None,                   # CancelToken opcional (verificado entre questões)
+    questions=None,                # questões já carregadas (cruas); input_json vira só a base das imagens
+    progress=None,                 # callback opcional progress(feitas, total)
+    variant=0,                     # variante (core.rng): mesma seed, outra ordem/valores
     **kwargs
 ) -> int:
     """
@@ -274,9 +283,24 @@ def json2beamer(
       OBS: o shuffle já aconteceu no CORE quando você passou shuffle_seed.
     - Caminhos de imagem relativos ao diretório do JSON.
     - A resolução de variáveis e o merge/shuffle das alternativas acontecem no CORE.
+    - Com `questions`, nada é lido do disco (a lista é normalizada in-place pelo CORE).
+    - Com um core.stats.collect() ativo, registra as etapas carga/latex/escrita e os contadores.
     """
+    seq = stats.sequence()
+    seq.next("carga")
     # Base dir para imagens (pega do primeiro JSON)
-    if isinstance(input_json, (list, tuple)):
+    if questions is not None:
+        first = input_json[0] if isinstance(input_json, (list, tuple)) and input_json else input_json
+        base_dir = str(Path(first).parent.resolve()) if first else None
+        ds = load_quiz(
+            questions,
+            shuffle_seed=shuffle_seed,
+            resolve_vars=resolve_vars,
+            cancel=cancel,
+            variant=variant,
+        )
+        qs = ds.get("questions", [])
+    elif isinstance(input_json, (list, tuple)):
         base_dir = str(Path(input_json[0]).parent.resolve()) if input_json else None
         # Carrega e concatena todas as questões já normalizadas pelo CORE
         all_qs: List[Dict[str, Any]] = []
@@ -285,6 +309,8 @@ def json2beamer(
                 p,
                 shuffle_seed=shuffle_seed,
                 resolve_vars=resolve_vars,
+                cancel=cancel,
+                variant=variant,
                 # seed_for_vars=(shuffle_seed if seed_for_vars is None else seed_for_vars),
                 # vars_env=vars_env
             )
@@ -296,6 +322,8 @@ def json2beamer(
             input_json,
             shuffle_seed=shuffle_seed,
             resolve_vars=resolve_vars,
+            cancel=cancel,
+            variant=variant,
             # seed_for_vars=(shuffle_seed if seed_for_vars is None else seed_for_vars),
             # vars_env=vars_env
         )
@@ -307,6 +335,7 @@ def json2beamer(
     except Exception:
         pass
 
+    seq.next("latex")
     # PREÂMBULO com widescreen e Unicode (inalterado)
     preamble = (
         "\\documentclass[aspectratio=169]{beamer}\n"
@@ -379,7 +408,10 @@ def json2beamer(
         f"\\newcommand{{\\BodySize}}{{\\{fsa}}}\n",
     ]
 
-    for q_res in qs:
+    total = len(qs)
+    for n_done, q_res in enumerate(qs):
+        check_cancel(cancel)
+        report_progress(progress, n_done, total)
         qid = q_res.get("id", "?")
         enun = (q_res.get("enunciado", "") or "").strip()
         enun_tex = latex_escape(enun)
@@ -479,9 +511,14 @@ def json2beamer(
             parts.append("}")
             parts.append("\\end{frame}\n")
 
+    report_progress(progress, total, total)
     parts.append("\\end{document}\n")
 
+    seq.next("escrita")
     out = Path(output_tex)
     out.parent.mkdir(parents=True, exist_ok=True)
     out.write_text("\n".join(parts), encoding="utf-8")
+    if stats.active() is not None:
+        stats.count("bytes", out.stat().st_size)
+    seq.end()
     return 0
@@ -0,0 +1,104 @@
+# -*- coding: utf-8 -*-
+"""
+Compilação .tex -> .pdf com pdflatex, transmitindo a saída linha a linha.
+- Cada passagem roda via Popen; uma thread leitora entrega as linhas a `on_line`
+  assim que o pdflatex as escreve (progresso página a página).
+- `cancel` (CancelToken) é verificado enquanto o processo roda; ao cancelar, o processo é encerrado.
+"""
+from __future__ import annotations
+from pathlib import Path
+from typing import Callable, Optional, Union
+import os, shutil, subprocess, threading
+
+from core import stats
+from core.cancel import CancelToken, JobCancelled
+
+PDFLATEX = "pdflatex"
+LOG_TAIL_LINES = 80
+
+
+class PdfLatexError(RuntimeError):
+    """pdflatex terminou com erro (ou não foi encontrado)."""
+    pass
+
+
+def find_pdflatex() -> Optional[str]:
+    return shutil.which(PDFLATEX)
+
+
+def _pump(stream, on_line: Callable[[str], None]) -> None:
+    for line in iter(stream.readline, ""):
+        on_line(line.rstrip("\r\n"))
+    stream.close()
+
+
+def _run_pass(cmd, workdir: Path, env, on_line: Callable[[str], None], cancel: Optional[CancelToken]) -> int:
+    proc = subprocess.Popen(
+        cmd,
+        cwd=str(workdir),
+        env=env,
+        stdin=subprocess.DEVNULL,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.STDOUT,
+        text=True,
+        encoding="utf-8",   # <- não usar CP-1252 no Windows
+        errors="replace",   # <- nunca quebrar por byte inválido (ex.: 0x81)
+        bufsize=1,
+    )
+    reader = threading.Thread(target=_pump, args=(proc.stdout, on_line), daemon=True)
+    reader.start()
+    try:
+        while True:
+            try:
+                rc = proc.wait(timeout=0.1)
+                break
+            except subprocess.TimeoutExpired:
+                if cancel is not None and cancel.cancelled:
+                    proc.kill()
+                    proc.wait()
+                    raise JobCancelled("Compilação cancelada.")
+    finally:
+        reader.join(timeout=2)
+    return rc
+
+
+def compile_pdf(
+    tex_path: Union[str, Path],
+    *,
+    passes: int = 2,
+    on_line: Optional[Callable[[str], None]] = None,
+    cancel: Optional[CancelToken] = None,
+) -> Path:
+    """Compila `tex_path` no próprio diretório e retorna o caminho do .pdf."""
+    exe = find_pdflatex()
+    if exe is None:
+        raise PdfLatexError("pdflatex não encontrado no PATH. Verifique a instalação do LaTeX.")
+    tex_path = Path(tex_path).resolve()
+    workdir = tex_path.parent
+    emit = on_line or (lambda _line: None)
+
+    cmd = [exe, "-interaction=nonstopmode", "-halt-on-error", tex_path.name]
+    env = os.environ.copy()
+    env.setdefault("PYTHONIOENCODING", "utf-8")
+
+    for i in range(passes):
+        if cancel is not None:
+            cancel.check()
+        emit(f"Compilando (passagem {i+1}/{passes})…")
+        with stats.stage("pdflatex"):
+            rc = _run_pass(cmd, workdir, env, emit, cancel)
+        if rc != 0:
+            # mostra o fim do .log do LaTeX (ajuda a debugar)
+            log_path = tex_path.with_suffix(".log")
+            try:
+                if log_path.exists():
+                    with open(log_path, "r", encoding="utf-8", errors="ignore") as f:
+                        tail_lines = f.readlines()[-LOG_TAIL_LINES:]
+                    emit("[pdflatex .log - últimas linhas]")
+                    for line in tail_lines:
+                        emit(line.rstrip("\r\n"))
+            except Exception as e:
+                emit(f"(não consegui ler o .log: {e})")
+            raise PdfLatexError(f"pdflatex retornou código {rc}")
+
+    return tex_path.with_suffix(".pdf")
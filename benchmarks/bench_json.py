@@ -0,0 +1,85 @@
+# -*- coding: utf-8 -*-
+"""
+Benchmark dos backends JSON do core.jsonio (stdlib json x orjson, se instalado) sobre bancos
+sintéticos (benchmarks/synth.py).
+Operações (cada uma medida `--repeat` vezes; vale o melhor tempo):
+- loads:        bytes do arquivo -> objetos (o que _read_json_file/_read_zip fazem)
+- dumps:        objetos -> bytes, compacto (caches, servidor)
+- dumps_pretty: objetos -> bytes com indentação de 2 (o que o editor grava)
+- clone:        cópia profunda de cada questão (json_clone, chamado por questão em resolve_all)
+
+Uso (na raiz do projeto):
+    python benchmarks/bench_json.py [--sizes 1000,10000,100000] [--repeat 5] [--json saida.json]
+"""
+from __future__ import annotations
+from pathlib import Path
+from typing import Any, Callable, Dict
+import argparse, gc, sys, time
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from benchmarks.synth import synthetic_bank  # noqa: E402
+from core import jsonio  # noqa: E402
+
+OPS = ("loads", "dumps", "dumps_pretty", "clone")
+
+
+def _best(fn: Callable[[], Any], repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        gc.collect()
+        t0 = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - t0)
+    return best
+
+
+def run_size(n: int, repeat: int) -> Dict[str, Dict[str, float]]:
+    bank = synthetic_bank(n)
+    out: Dict[str, Dict[str, float]] = {}
+    previous = jsonio.backend()
+    try:
+        for name in jsonio.BACKENDS:
+            jsonio.use(name)
+            data = jsonio.dumps_bytes(bank)
+            ops = {
+                "loads": lambda: jsonio.loads(data),
+                "dumps": lambda: jsonio.dumps_bytes(bank),
+                "dumps_pretty": lambda: jsonio.dumps_bytes(bank, pretty=True),
+                "clone": lambda: [jsonio.clone(q) for q in bank],
+            }
+            out[name] = {op: _best(ops[op], repeat) for op in OPS}
+    finally:
+        jsonio.use(previous)
+    return out
+
+
+def main(argv=None) -> int:
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("--sizes", default="1000,10000", help="tamanhos dos bancos, separados por vírgula")
+    ap.add_argument("--repeat", type=int, default=5, help="repetições por operação (vale o melhor tempo)")
+    ap.add_argument("--json", dest="json_out", default=None, help="grava os resultados neste arquivo")
+    args = ap.parse_args(argv)
+
+    results: Dict[str, Any] = {
+        "python": sys.version.split()[0],
+        "backends": list(jsonio.BACKENDS),
+        "default": jsonio.backend(),
+        "sizes": {},
+    }
+    for n in (int(s) for s in args.sizes.split(",") if s.strip()):
+        res = results["sizes"][str(n)] = run_size(n, args.repeat)
+        print(f"== {n} questões ==")
+        base = res["json"]
+        for name, ops in res.items():
+            cells = "  ".join(f"{op} {ops[op] * 1000:8.1f} ms ({base[op] / ops[op]:4.1f}x)" for op in OPS)
+            print(f"  {name:7s} {cells}")
+
+    if args.json_out:
+        jsonio.write(args.json_out, results, pretty=True)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,90 @@
+# -*- coding: utf-8 -*-
+"""
+Benchmark de memória das representações de um banco de questões.
+- dicts:  lista de dicts como sai do json.loads (o que circula hoje pelo load_quiz)
+- dicts_interned: os mesmos dicts com os textos repetidos passados por um StringPool
+- Question: dataclasses com __slots__, congeladas, com sentinelas compartilhadas para coleções vazias
+Cada representação é construída a partir de um json.loads novo (strings não são compartilhadas)
+e medida com tracemalloc depois de descartar os dicts intermediários.
+
+Uso (na raiz do projeto):
+    python benchmarks/bench_memory.py [--n 100000] [--json saida.json]
+"""
+from __future__ import annotations
+from pathlib import Path
+from typing import Any, Callable, Dict, List
+import argparse, gc, json, random, sys, time, tracemalloc
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from core.models import Question  # noqa: E402
+from core.strpool import StringPool  # noqa: E402
+
+DIFS = ("fácil", "média", "difícil")
+
+
+def synthetic_bank(n: int, seed: int = 0) -> List[Dict[str, Any]]:
+    rnd = random.Random(seed)
+    out = []
+    for i in range(1, n + 1):
+        q: Dict[str, Any] = {
+            "id": i,
+            "dificuldade": rnd.choice(DIFS),
+            "enunciado": f"Questão {i}: calcule o valor de x na expressão {rnd.randint(1, 99)}x + {rnd.randint(1, 99)} = 0.",
+            "imagens": [],
+            "alternativas": [f"{rnd.randint(-99, 99)}" for _ in range(4)],
+            "obs": [],
+            "variaveis": {},
+        }
+        q["correta"] = q["alternativas"][0]
+        if i % 10 == 0:
+            q["imagens"] = [f"img/q{i}.png;60x40"]
+        out.append(q)
+    return out
+
+
+def _measure(text: str, build: Callable[[List[Dict[str, Any]]], Any]) -> Dict[str, float]:
+    gc.collect()
+    tracemalloc.start()
+    t0 = time.perf_counter()
+    raw = json.loads(text)
+    obj = build(raw)
+    del raw
+    gc.collect()
+    current, peak = tracemalloc.get_traced_memory()
+    elapsed = time.perf_counter() - t0
+    tracemalloc.stop()
+    del obj
+    return {"bytes": current, "peak_bytes": peak, "build_s": elapsed}
+
+
+def main(argv=None) -> int:
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("--n", type=int, default=100_000, help="nº de questões sintéticas")
+    ap.add_argument("--json", dest="json_out", default=None, help="grava os resultados neste arquivo")
+    args = ap.parse_args(argv)
+
+    text = json.dumps(synthetic_bank(args.n), ensure_ascii=False)
+    results: Dict[str, Any] = {
+        "python": sys.version.split()[0],
+        "n": args.n,
+        "dicts": _measure(text, lambda raw: raw),
+        "dicts_interned": _measure(text, lambda raw: StringPool().intern_all(raw)),
+        "question_slots": _measure(text, lambda raw: [Question.from_dict(q) for q in raw]),
+    }
+
+    base = results["dicts"]["bytes"]
+    print(f"== {args.n} questões ==")
+    for name in ("dicts", "dicts_interned", "question_slots"):
+        r = results[name]
+        print(f"  {name:16s} {r['bytes']/2**20:8.1f} MiB  ({base / max(r['bytes'], 1):4.1f}x menor que dicts)"
+              f"  pico {r['peak_bytes']/2**20:8.1f} MiB  construção {r['build_s']*1000:7.0f} ms")
+
+    if args.json_out:
+        Path(args.json_out).write_text(json.dumps(results, ensure_ascii=False, indent=2), encoding="utf-8")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
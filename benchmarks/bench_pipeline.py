@@ -0,0 +1,132 @@
+# -*- coding: utf-8 -*-
+"""
+Benchmark ponta a ponta das etapas do pipeline sobre bancos sintéticos (benchmarks/synth.py).
+Etapas (cada uma medida `--repeat` vezes; vale o melhor tempo):
+- load_quiz:    leitura + normalização + resolução de variáveis (arquivo no disco)
+- resolve_all:  só as questões tipo 3, já carregadas
+- json2beamer:  gera o .tex (sem pdflatex)
+- json2docx:    gera a prova .docx (template de assets/); pulada sem python-docx
+- preview_text: preview textual do banco inteiro
+Os resultados saem em JSON (--json) e podem ser comparados com uma execução anterior (--compare),
+ex.: antes e depois de uma mudança, ou entre duas versões.
+
+Uso (na raiz do projeto):
+    python benchmarks/bench_pipeline.py [--sizes 1000,10000,100000] [--repeat 3] [--json novo.json] [--compare antigo.json]
+"""
+from __future__ import annotations
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+import argparse, gc, json, platform, statistics, sys, tempfile, time
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from benchmarks.synth import write_bank  # noqa: E402
+from core.loader import load_quiz  # noqa: E402
+from core.variables import resolve_all  # noqa: E402
+
+STAGES = ("load_quiz", "resolve_all", "json2beamer", "json2docx", "preview_text")
+TEMPLATE = ROOT / "assets" / "template_prova.docx"
+
+
+def _time(fn: Callable[[], Any], repeat: int) -> Dict[str, float]:
+    times = []
+    for _ in range(repeat):
+        gc.collect()
+        t0 = time.perf_counter()
+        fn()
+        times.append(time.perf_counter() - t0)
+    return {"best_s": min(times), "mean_s": statistics.fmean(times)}
+
+
+def _stages(bank: Path, out_dir: Path) -> Dict[str, Callable[[], Any]]:
+    from beamer.generator import json2beamer
+    from editor.preview import preview_text
+    raw = json.loads(bank.read_text(encoding="utf-8"))
+    tipo3 = [q for q in raw if q.get("tipo") == 3]
+
+    def docx():
+        from testgen.generator import json2docx
+        json2docx([str(bank)], str(TEMPLATE), str(out_dir / "prova.docx"), seed=1)
+
+    return {
+        "load_quiz": lambda: load_quiz(str(bank), shuffle_seed=1),
+        "resolve_all": lambda: [resolve_all(q, seed=1) for q in tipo3],
+        "json2beamer": lambda: json2beamer(input_json=str(bank), output_tex=str(out_dir / "slides.tex"), shuffle_seed=1),
+        "json2docx": docx,
+        "preview_text": lambda: preview_text(raw, seed=1),
+    }
+
+
+def _skip_reason(stage: str) -> Optional[str]:
+    if stage == "json2docx":
+        try:
+            import docx  # noqa: F401
+        except ImportError:
+            return "python-docx não instalado"
+    return None
+
+
+def run_size(n: int, repeat: int, stages: List[str]) -> Dict[str, Any]:
+    with tempfile.TemporaryDirectory() as tmp:
+        bank = write_bank(Path(tmp) / "banco.json", n, images=True)
+        funcs = _stages(bank, Path(tmp))
+        n_tipo3 = sum(1 for q in json.loads(bank.read_text(encoding="utf-8")) if q.get("tipo") == 3)
+        out: Dict[str, Any] = {}
+        for stage in stages:
+            reason = _skip_reason(stage)
+            if reason:
+                out[stage] = {"skipped": reason}
+                continue
+            r = _time(funcs[stage], repeat)
+            per = n_tipo3 if stage == "resolve_all" else n
+            r["per_q_us"] = r["best_s"] / max(per, 1) * 1e6
+            out[stage] = r
+        return out
+
+
+def _print(results: Dict[str, Any], baseline: Optional[Dict[str, Any]]) -> None:
+    for size, stages in results["sizes"].items():
+        print(f"== {size} questões ==")
+        for stage, r in stages.items():
+            if "skipped" in r:
+                print(f"  {stage:13s} pulada ({r['skipped']})")
+                continue
+            line = f"  {stage:13s} {r['best_s']*1000:9.1f} ms  {r['per_q_us']:8.1f} µs/questão"
+            old = ((baseline or {}).get("sizes", {}).get(size) or {}).get(stage) or {}
+            if old.get("best_s"):
+                line += f"  ({old['best_s'] / max(r['best_s'], 1e-12):4.2f}x vs. anterior)"
+            print(line)
+
+
+def main(argv=None) -> int:
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("--sizes", default="1000,10000", help="tamanhos dos bancos, separados por vírgula")
+    ap.add_argument("--repeat", type=int, default=3, help="repetições por etapa (vale o melhor tempo)")
+    ap.add_argument("--stages", default=",".join(STAGES), help="etapas a medir, separadas por vírgula")
+    ap.add_argument("--json", dest="json_out", default=None, help="grava os resultados neste arquivo")
+    ap.add_argument("--compare", default=None, help="resultados anteriores (--json) para comparar")
+    args = ap.parse_args(argv)
+
+    stages = [s.strip() for s in args.stages.split(",") if s.strip()]
+    unknown = sorted(set(stages) - set(STAGES))
+    if unknown:
+        ap.error(f"etapas desconhecidas: {', '.join(unknown)}")
+    results: Dict[str, Any] = {
+        "python": sys.version.split()[0],
+        "platform": platform.platform(),
+        "repeat": args.repeat,
+        "sizes": {},
+    }
+    for n in (int(s) for s in args.sizes.split(",") if s.strip()):
+        results["sizes"][str(n)] = run_size(n, args.repeat, stages)
+
+    baseline = json.loads(Path(args.compare).read_text(encoding="utf-8")) if args.compare else None
+    _print(results, baseline)
+    if args.json_out:
+        Path(args.json_out).write_text(json.dumps(results, ensure_ascii=False, indent=2), encoding="utf-8")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
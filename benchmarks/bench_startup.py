@@ -0,0 +1,147 @@
+# -*- coding: utf-8 -*-
+"""
+Benchmark de inicialização da GUI.
+- Tempo de importação por módulo (cada um num interpretador novo, a frio).
+- Módulos carregados por `import gui.app_window` (via -X importtime), os mais caros primeiro.
+- Tempo até a primeira janela: Tk() + App(root) + primeiro update() (requer display).
+
+Uso (na raiz do projeto):
+    python benchmarks/bench_startup.py [--repeat 3] [--json saida.json]
+"""
+from __future__ import annotations
+from pathlib import Path
+from typing import Any, Dict, List
+import argparse, json, re, statistics, subprocess, sys
+
+ROOT = Path(__file__).resolve().parent.parent
+
+MODULES = [
+    "config.preferences",
+    "core",
+    "beamer.generator",
+    "testgen.generator",
+    "editor.question_editor",
+    "gui.app_window",
+    "docx",
+    "lxml.etree",
+    "PIL.Image",
+]
+
+_IMPORT_SNIPPET = """
+import sys, time
+sys.path.insert(0, {root!r})
+t0 = time.perf_counter()
+try:
+    import {mod}
+except Exception as e:
+    print("ERR", type(e).__name__, e)
+    raise SystemExit(0)
+print("OK", time.perf_counter() - t0)
+"""
+
+_WINDOW_SNIPPET = """
+import sys, time
+t0 = time.perf_counter()
+sys.path.insert(0, {root!r})
+import tkinter as tk
+try:
+    root = tk.Tk()
+except tk.TclError as e:
+    print("ERR", "TclError", e)
+    raise SystemExit(0)
+t_tk = time.perf_counter()
+from gui.app_window import App
+t_imp = time.perf_counter()
+app = App(root)
+root.update()
+t_win = time.perf_counter()
+print("OK", t_tk - t0, t_imp - t_tk, t_win - t0)
+root.destroy()
+"""
+
+IMPORTTIME_RE = re.compile(r"import time:\s+(\d+)\s+\|\s+(\d+)\s+\|\s*(\S.*)$")
+
+
+def _run(snippet: str) -> List[str]:
+    proc = subprocess.run([sys.executable, "-c", snippet], cwd=str(ROOT),
+                          capture_output=True, text=True, encoding="utf-8", errors="replace")
+    return (proc.stdout.strip().splitlines() or ["ERR exit " + str(proc.returncode) + " " + proc.stderr[-200:]])[-1].split(" ")
+
+
+def bench_imports(repeat: int) -> Dict[str, Any]:
+    out: Dict[str, Any] = {}
+    for mod in MODULES:
+        samples = []
+        for _ in range(repeat):
+            res = _run(_IMPORT_SNIPPET.format(root=str(ROOT), mod=mod))
+            if res[0] != "OK":
+                out[mod] = {"error": " ".join(res[1:])}
+                break
+            samples.append(float(res[1]))
+        if samples:
+            out[mod] = {"median_s": statistics.median(samples), "min_s": min(samples)}
+    return out
+
+
+def bench_importtime(top: int = 25) -> List[Dict[str, Any]]:
+    """Módulos mais caros (cumulativo) ao importar gui.app_window."""
+    proc = subprocess.run([sys.executable, "-X", "importtime", "-c", "import gui.app_window"],
+                          cwd=str(ROOT), capture_output=True, text=True, encoding="utf-8", errors="replace")
+    rows = []
+    for line in proc.stderr.splitlines():
+        m = IMPORTTIME_RE.match(line)
+        if m:
+            rows.append({"module": m.group(3).strip(), "self_us": int(m.group(1)), "cumulative_us": int(m.group(2))})
+    rows.sort(key=lambda r: r["cumulative_us"], reverse=True)
+    return rows[:top]
+
+
+def bench_first_window(repeat: int) -> Dict[str, Any]:
+    samples = []
+    for _ in range(repeat):
+        res = _run(_WINDOW_SNIPPET.format(root=str(ROOT)))
+        if res[0] != "OK":
+            return {"error": " ".join(res[1:])}
+        samples.append(tuple(float(x) for x in res[1:4]))
+    return {
+        "tk_init_s": statistics.median(s[0] for s in samples),
+        "import_app_s": statistics.median(s[1] for s in samples),
+        "time_to_first_window_s": statistics.median(s[2] for s in samples),
+    }
+
+
+def main(argv=None) -> int:
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("--repeat", type=int, default=3)
+    ap.add_argument("--top", type=int, default=25)
+    ap.add_argument("--json", dest="json_out", default=None, help="grava os resultados neste arquivo")
+    args = ap.parse_args(argv)
+
+    results = {
+        "python": sys.version.split()[0],
+        "imports": bench_imports(args.repeat),
+        "importtime_app_window": bench_importtime(args.top),
+        "first_window": bench_first_window(args.repeat),
+    }
+
+    print("== Importação a frio (mediana) ==")
+    for mod, r in results["imports"].items():
+        print(f"  {mod:28s} " + (f"{r['median_s']*1000:8.1f} ms" if "median_s" in r else f"indisponível ({r['error']})"))
+    print("== import gui.app_window: mais caros (cumulativo) ==")
+    for r in results["importtime_app_window"]:
+        print(f"  {r['module']:40s} {r['cumulative_us']/1000:8.1f} ms")
+    fw = results["first_window"]
+    print("== Primeira janela ==")
+    if "error" in fw:
+        print(f"  indisponível ({fw['error']})")
+    else:
+        print(f"  Tk(): {fw['tk_init_s']*1000:.1f} ms | import App: {fw['import_app_s']*1000:.1f} ms | "
+              f"total até a janela: {fw['time_to_first_window_s']*1000:.1f} ms")
+
+    if args.json_out:
+        Path(args.json_out).write_text(json.dumps(results, ensure_ascii=False, indent=2), encoding="utf-8")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
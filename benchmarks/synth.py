@@ -0,0 +1,148 @@
+# -*- coding: utf-8 -*-
+"""
+Gerador de bancos sintéticos para testes de carga e benchmarks.
+Mistura realista (determinística pela seed):
+- tipo 1 (~50%): texto, 4 alternativas; parte usa a chave "alternativas;K" (K por linha)
+- tipo 2 (~15%): alternativas que são imagens ("img/....png;LxA")
+- tipo 3 (~20%): 2–3 variáveis, resoluções encadeadas, alternativas <...>; parte com "distratores"
+- tipo 4 (~15%): afirmações I–IV com as alternativas repetitivas de sempre ("Apenas I e II", ...)
+- ~10% das questões com imagens no enunciado; dificuldade, obs
+As imagens não existem no disco (os geradores usam o placeholder); com --images, um PNG
+mínimo é gravado para cada caminho citado.
+
+Uso (na raiz do projeto):
+    python benchmarks/synth.py --n 10000 --out build/banco_10k.json [--images]
+"""
+from __future__ import annotations
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Union
+import argparse, json, random, struct, sys, zlib
+
+DIFS = ("fácil", "média", "difícil")
+WORDS = ("sensor", "pressão", "temperatura", "corrente", "tensão", "resistência", "sinal", "medição",
+         "calibração", "processo", "controle", "vazão", "nível", "válvula", "malha", "erro", "ganho",
+         "transmissor", "faixa", "escala", "linear", "resposta", "sistema", "variável", "instrumento")
+TIPO4_ALTS = ("Apenas I e II", "Apenas I e III", "Apenas II e III", "Apenas I, II e IV", "Todas estão corretas")
+TIPO_WEIGHTS = ((1, 50), (2, 15), (3, 20), (4, 15))
+
+
+def _sentence(rnd: random.Random, n_words: int) -> str:
+    words = [rnd.choice(WORDS) for _ in range(n_words)]
+    return " ".join(words).capitalize()
+
+
+def _tipo1(rnd: random.Random, i: int) -> Dict[str, Any]:
+    q: Dict[str, Any] = {
+        "enunciado": f"{_sentence(rnd, rnd.randint(12, 30))}. Qual alternativa está correta? (#{i})",
+        "correta": _sentence(rnd, rnd.randint(6, 14)) + ".",
+    }
+    alts = [_sentence(rnd, rnd.randint(6, 14)) + "." for _ in range(4)]
+    if rnd.random() < 0.1:
+        q[f"alternativas;{rnd.choice((2, 4))}"] = alts
+    else:
+        q["alternativas"] = alts
+    return q
+
+
+def _tipo2(rnd: random.Random, i: int) -> Dict[str, Any]:
+    return {
+        "enunciado": f"{_sentence(rnd, rnd.randint(10, 20))}. Qual gráfico representa a relação? (#{i})",
+        "alternativas": [f"img/q{i}_{k}.png;40x30" for k in range(1, 4)] + ["Nenhuma das anteriores."],
+        "correta": f"img/q{i}_0.png;40x30",
+    }
+
+
+def _tipo3(rnd: random.Random, i: int) -> Dict[str, Any]:
+    names = ["A", "B", "C"][:rnd.randint(2, 3)]
+    variaveis = {}
+    for n in names:
+        lo = rnd.randint(1, 50)
+        step = rnd.choice((1, 0.5, 0.1))
+        variaveis[n] = {"min": lo, "max": lo + rnd.randint(5, 100), "step": step}
+    resolucoes = {"R": " + ".join(names), "S": f"R * {rnd.randint(2, 9)} / {names[0]}"}
+    q: Dict[str, Any] = {
+        "enunciado": f"{_sentence(rnd, rnd.randint(8, 16))}: " + ", ".join(f"{n} = <{n}>" for n in names)
+                     + f". Quanto vale S? (#{i})",
+        "variaveis": variaveis,
+        "resolucoes": resolucoes,
+        "alternativas": ["<S + 1>", "<S * 2>", "<S - 2.5>", "<S / 3>"],
+        "correta": "<S>",
+    }
+    if rnd.random() < 0.3:
+        q["distratores"] = 4
+    return q
+
+
+def _tipo4(rnd: random.Random, i: int) -> Dict[str, Any]:
+    alts = list(TIPO4_ALTS)
+    rnd.shuffle(alts)
+    return {
+        "enunciado": f"{_sentence(rnd, rnd.randint(8, 16))}. Analise as afirmações: (#{i})",
+        "afirmacoes": {k: _sentence(rnd, rnd.randint(6, 12)) + "." for k in ("I", "II", "III", "IV")},
+        "alternativas": alts[1:],
+        "correta": alts[0],
+    }
+
+
+BUILDERS = {1: _tipo1, 2: _tipo2, 3: _tipo3, 4: _tipo4}
+
+
+def synthetic_bank(n: int, seed: int = 0) -> List[Dict[str, Any]]:
+    rnd = random.Random(seed)
+    tipos = [t for t, _ in TIPO_WEIGHTS]
+    weights = [w for _, w in TIPO_WEIGHTS]
+    out = []
+    for i in range(1, n + 1):
+        tipo = rnd.choices(tipos, weights)[0]
+        q: Dict[str, Any] = {"id": i, "tipo": tipo, "dificuldade": rnd.choice(DIFS)}
+        q.update(BUILDERS[tipo](rnd, i))
+        q["imagens"] = [f"img/fig{i}.png;60x40"] if rnd.random() < 0.1 else []
+        q["obs"] = [_sentence(rnd, rnd.randint(6, 12)) + "."] if rnd.random() < 0.5 else []
+        out.append(q)
+    return out
+
+
+def _tiny_png() -> bytes:
+    def chunk(kind: bytes, data: bytes) -> bytes:
+        return struct.pack(">I", len(data)) + kind + data + struct.pack(">I", zlib.crc32(kind + data))
+    ihdr = struct.pack(">IIBBBBB", 1, 1, 8, 0, 0, 0, 0)
+    return b"\x89PNG\r\n\x1a\n" + chunk(b"IHDR", ihdr) + chunk(b"IDAT", zlib.compress(b"\x00\x80")) + chunk(b"IEND", b"")
+
+
+def image_paths(questions: List[Dict[str, Any]]) -> List[str]:
+    out = []
+    for q in questions:
+        for v in [*(q.get("imagens") or []), *(q.get("alternativas") or []), q.get("correta")]:
+            if isinstance(v, str) and v.split(";", 1)[0].lower().endswith(".png"):
+                out.append(v.split(";", 1)[0])
+    return out
+
+
+def write_bank(path: Union[str, Path], n: int, seed: int = 0, images: bool = False) -> Path:
+    """Grava o banco em `path` (JSON); com images=True grava também os PNGs citados, ao lado."""
+    p = Path(path)
+    p.parent.mkdir(parents=True, exist_ok=True)
+    qs = synthetic_bank(n, seed)
+    p.write_text(json.dumps(qs, ensure_ascii=False), encoding="utf-8")
+    if images:
+        png = _tiny_png()
+        for rel in set(image_paths(qs)):
+            img = p.parent / rel
+            img.parent.mkdir(parents=True, exist_ok=True)
+            img.write_bytes(png)
+    return p
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("--n", type=int, default=1000, help="nº de questões")
+    ap.add_argument("--seed", type=int, default=0)
+    ap.add_argument("--out", required=True, help="arquivo .json de saída")
+    ap.add_argument("--images", action="store_true", help="grava PNGs mínimos para as imagens citadas")
+    args = ap.parse_args(argv)
+    print(write_bank(args.out, args.n, args.seed, args.images))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,306 @@
+# -*- coding: utf-8 -*-
+"""
+Interface de linha de comando (sem Tk) para rodar a geração em servidor/cron.
+
+Subcomandos:
+    json2beamer  bancos -> .tex (slides), opcionalmente compilando o PDF (--pdf)
+    json2docx    bancos -> .docx (prova) a partir do template
+    preview      bancos -> .txt com o preview em texto
+    pdf          .tex -> .pdf (pdflatex)
+    watch        regera as saídas quando os arquivos mudam (ver watch.py)
+    duplicates   relatório JSON de questões quase duplicadas entre os bancos (core.neardup)
+
+Cada banco vira uma tarefa independente (ou uma só com --merge). Com --jobs N as tarefas rodam
+num pool de processos. Ao final, imprime em stdout um resumo JSON com tempo e código de saída
+de cada tarefa; o código de saída do processo é 0 se todas deram certo e 1 caso contrário.
+
+Uso (na raiz do projeto):
+    python -m cli json2beamer cursos/*.json --out-dir build --jobs 8 --pdf
+    python -m cli json2docx banco.json --template assets/template_prova.docx --num 10 --seed 42
+    python -m cli json2docx banco.json --seed 42 --variants 30 --jobs 8   # uma prova por aluno
+"""
+from __future__ import annotations
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+import argparse, sys, time, traceback
+
+EXIT_OK = 0
+EXIT_FAILED = 1
+
+DEFAULT_TITLE = "Exercícios – Apresentação"
+
+
+# ----------------- tarefas (rodam no processo do pool; precisam ser picklable) -----------------
+def _out_path(inputs: List[str], out_dir: Optional[str], suffix: str) -> str:
+    first = Path(inputs[0])
+    stem = first.stem + ("_combined" if len(inputs) > 1 else "")
+    return str(Path(out_dir or first.parent) / (stem + suffix))
+
+
+def _questions(inputs: List[str], renumber: bool, dedup: bool = False) -> Optional[List[Dict[str, Any]]]:
+    """Vários bancos numa tarefa: concatena (e renumera nos slides), como faz a GUI."""
+    if len(inputs) < 2 and not dedup:
+        return None
+    from core.cache import DatasetCache
+    return DatasetCache().merged_questions(inputs, renumber=renumber and len(inputs) > 1, dedup_questions=dedup)
+
+
+def _job_json2beamer(spec: Dict[str, Any]) -> str:
+    from beamer.generator import json2beamer
+    inputs, out = spec["inputs"], spec["output"]
+    json2beamer(input_json=inputs if len(inputs) > 1 else inputs[0], output_tex=out,
+                shuffle_seed=spec.get("seed"), title=spec.get("title") or DEFAULT_TITLE,
+                questions=_questions(inputs, renumber=True, dedup=spec.get("dedup_questions")), variant=spec.get("variant") or 0)
+    if spec.get("pdf"):
+        from beamer.pdflatex import compile_pdf
+        return str(compile_pdf(out, passes=spec.get("passes", 2)))
+    return out
+
+
+def _job_json2docx(spec: Dict[str, Any]) -> str:
+    from testgen.generator import json2docx
+    inputs, out = spec["inputs"], spec["output"]
+    json2docx(inputs, spec["template"], out, title=spec.get("title") or "Prova",
+              num=spec.get("num"), seed=spec.get("seed"), shuffle=not spec.get("no_shuffle"),
+              questions=_questions(inputs, renumber=False, dedup=spec.get("dedup_questions")), variant=spec.get("variant") or 0,
+              exclude_duplicates=bool(spec.get("exclude_duplicates")),
+              unique_variants=bool(spec.get("unique_variants")))
+    return out
+
+
+def _job_preview(spec: Dict[str, Any]) -> str:
+    from core.cache import DatasetCache
+    from editor.preview import preview_text
+    inputs, out = spec["inputs"], spec["output"]
+    qs = DatasetCache().merged_questions(inputs, renumber=len(inputs) > 1, dedup_questions=bool(spec.get("dedup_questions")))
+    Path(out).write_text(preview_text(qs, title=spec.get("title"), seed=spec.get("seed"),
+                                             variant=spec.get("variant") or 0), encoding="utf-8")
+    return out
+
+
+def _job_pdf(spec: Dict[str, Any]) -> str:
+    from beamer.pdflatex import compile_pdf
+    return str(compile_pdf(spec["inputs"][0], passes=spec.get("passes", 2)))
+
+
+JOBS = {
+    "json2beamer": _job_json2beamer,
+    "json2docx": _job_json2docx,
+    "preview": _job_preview,
+    "pdf": _job_pdf,
+}
+
+
+def run_job(spec: Dict[str, Any]) -> Dict[str, Any]:
+    """Executa uma tarefa e devolve seu registro no resumo (nunca levanta).
+    Com spec["stats"], o registro leva também as etapas e contadores (core.stats); com
+    spec["memory_profile"], também a memória por etapa (core.memprof), gravada ainda em
+    <saída>.memoria.txt; com spec["profile"] (diretório), a tarefa roda sob cProfile e o registro
+    aponta o .pstats gravado (core.profiling)."""
+    from contextlib import nullcontext
+    from core import memprof, stats
+    from core.profiling import profile, profile_path
+    t0 = time.perf_counter()
+    rec = {"command": spec["command"], "inputs": spec["inputs"], "output": spec.get("output")}
+    if spec.get("memory_profile"):
+        collector = memprof.collect_memory()
+    else:
+        collector = stats.collect() if spec.get("stats") else nullcontext()
+    name = f"{spec['command']}_{Path(spec.get('output') or spec['inputs'][0]).stem}"
+    profiler = profile(profile_path(spec["profile"], name)) if spec.get("profile") else nullcontext()
+    with profiler as prof, collector as report:
+        try:
+            rec["output"] = JOBS[spec["command"]](spec)
+            rec.update(exit_code=EXIT_OK, status="ok")
+        except Exception as e:
+            rec.update(exit_code=EXIT_FAILED, status="error", error=f"{type(e).__name__}: {e}")
+            if spec.get("verbose"):
+                traceback.print_exc(file=sys.stderr)
+    rec["seconds"] = round(time.perf_counter() - t0, 4)
+    if prof is not None and prof.skipped:
+        rec["profile_skipped"] = prof.skipped
+    elif prof is not None:
+        rec["profile"] = str(prof.path)
+    if report is not None:
+        rec["stats"] = report.to_dict()
+        path = memprof.report_path(rec["output"])
+        if isinstance(report, memprof.MemoryReport) and path is not None:
+            rec["memory_report"] = str(report.save(path))
+    return rec
+
+
+# ----------------- montagem das tarefas e execução -----------------
+_SUFFIX = {"json2beamer": "_slides.tex", "json2docx": "_prova.docx", "preview": "_preview.txt"}
+
+
+def build_specs(args: argparse.Namespace) -> List[Dict[str, Any]]:
+    groups = [list(args.inputs)] if getattr(args, "merge", False) else [[p] for p in args.inputs]
+    common = {k: v for k, v in vars(args).items() if k not in ("inputs", "func", "jobs", "json_out", "variants")}
+    # --variants N: uma tarefa por variante (cada uma calculável sozinha, então paralelizam com -j)
+    first = getattr(args, "variant", 0) or 0
+    n_variants = max(1, getattr(args, "variants", 1) or 1)
+    specs = []
+    for inputs in groups:
+        for variant in range(first, first + n_variants):
+            spec = dict(common, inputs=inputs, variant=variant)
+            if args.command in _SUFFIX:
+                suffix = _SUFFIX[args.command]
+                if n_variants > 1:
+                    stem, ext = suffix.rsplit(".", 1)
+                    suffix = f"{stem}_v{variant}.{ext}"
+                spec["output"] = _out_path(inputs, args.out_dir, suffix)
+            else:
+                spec["output"] = str(Path(inputs[0]).with_suffix(".pdf"))
+            specs.append(spec)
+    return specs
+
+
+def run_specs(specs: List[Dict[str, Any]], jobs: int = 1) -> List[Dict[str, Any]]:
+    """Executa as tarefas (em processos se jobs > 1), mantendo a ordem da entrada."""
+    if jobs <= 1 or len(specs) <= 1:
+        return [run_job(s) for s in specs]
+    with ProcessPoolExecutor(max_workers=min(jobs, len(specs))) as pool:
+        return list(pool.map(run_job, specs))
+
+
+def _check_unique_variants(args: argparse.Namespace) -> None:
+    """--unique-variants: a grade de cada questão tipo 3 precisa comportar a maior variante pedida.
+    Verificado uma vez, antes de disparar as tarefas (GridExhausted nomeia a questão)."""
+    from core import QuizLoadError, load_quiz
+    from core.grid import check_unique_capacity
+    n = (getattr(args, "variant", 0) or 0) + max(1, getattr(args, "variants", 1) or 1)
+    for p in args.inputs:
+        try:
+            qs = load_quiz(p, resolve_vars=False)["questions"]
+        except QuizLoadError:
+            continue  # a própria tarefa relata o erro de leitura no resumo
+        check_unique_capacity(qs, n)
+
+
+def _run_batch(args: argparse.Namespace) -> int:
+    if getattr(args, "out_dir", None):
+        Path(args.out_dir).mkdir(parents=True, exist_ok=True)
+    if getattr(args, "unique_variants", False):
+        try:
+            _check_unique_variants(args)
+        except ValueError as e:
+            print(f"erro: {e}", file=sys.stderr)
+            return EXIT_FAILED
+    t0 = time.perf_counter()
+    results = run_specs(build_specs(args), jobs=args.jobs)
+    failed = sum(1 for r in results if r["exit_code"] != EXIT_OK)
+    summary = {
+        "command": args.command,
+        "jobs": args.jobs,
+        "total": len(results),
+        "ok": len(results) - failed,
+        "failed": failed,
+        "seconds": round(time.perf_counter() - t0, 4),
+        "exit_code": EXIT_FAILED if failed else EXIT_OK,
+        "results": results,
+    }
+    from core import jsonio
+    text = jsonio.dumps(summary, pretty=True)
+    if args.json_out:
+        Path(args.json_out).write_text(text, encoding="utf-8")
+    print(text, flush=True)
+    return summary["exit_code"]
+
+
+def _run_duplicates(args: argparse.Namespace) -> int:
+    from core.neardup import scan_banks
+    t0 = time.perf_counter()
+    opts = {"threshold": args.threshold} if args.threshold is not None else {}
+    questions, sources, clusters = scan_banks(args.inputs, **opts)
+    summary = {
+        "command": "duplicates",
+        "questions": len(questions),
+        "clusters": [
+            {"similarity": c.similarity,
+             "members": [{"file": sources[i], "id": questions[i].get("id")} for i in c.members]}
+            for c in clusters
+        ],
+        "seconds": round(time.perf_counter() - t0, 4),
+    }
+    from core import jsonio
+    text = jsonio.dumps(summary, pretty=True)
+    if args.json_out:
+        Path(args.json_out).write_text(text, encoding="utf-8")
+    print(text, flush=True)
+    return EXIT_OK
+
+
+def _run_watch(args: argparse.Namespace) -> int:
+    import watch
+    return watch.run_from_args(args)
+
+
+def build_parser() -> argparse.ArgumentParser:
+    ap = argparse.ArgumentParser(prog="python -m cli", description=__doc__,
+                                 formatter_class=argparse.RawDescriptionHelpFormatter)
+    sub = ap.add_subparsers(dest="command", required=True)
+
+    def batch(name: str, help_: str, inputs_help: str) -> argparse.ArgumentParser:
+        p = sub.add_parser(name, help=help_)
+        p.add_argument("inputs", nargs="+", help=inputs_help)
+        p.add_argument("-j", "--jobs", type=int, default=1, help="tarefas em paralelo (processos)")
+        p.add_argument("--json-out", default=None, help="também grava o resumo JSON neste arquivo")
+        p.add_argument("-v", "--verbose", action="store_true", help="traceback dos erros em stderr")
+        p.add_argument("--stats", action="store_true", help="tempo por etapa e contadores no resumo de cada tarefa")
+        p.add_argument("--memory-profile", action="store_true",
+                       help="tracemalloc por etapa (pico e principais alocações) em <saída>.memoria.txt")
+        p.add_argument("--profile", metavar="DIR", default=None,
+                       help="roda cada tarefa sob cProfile e grava DIR/<tarefa>_<data>.pstats")
+        p.set_defaults(func=_run_batch)
+        return p
+
+    def bank_opts(p: argparse.ArgumentParser, title: Optional[str]) -> None:
+        p.add_argument("--out-dir", default=None, help="diretório de saída (padrão: o do banco)")
+        p.add_argument("--merge", action="store_true", help="junta todos os bancos numa única saída")
+        p.add_argument("--dedup-questions", action="store_true", help="descarta questões repetidas (conteúdo idêntico)")
+        p.add_argument("--seed", type=int, default=None)
+        p.add_argument("--variant", type=int, default=0, help="variante (mesma seed, outra ordem/valores)")
+        p.add_argument("--title", default=title)
+
+    p = batch("json2beamer", "gera slides .tex", "bancos JSON/ZIP")
+    bank_opts(p, DEFAULT_TITLE)
+    p.add_argument("--pdf", action="store_true", help="compila o .tex com pdflatex")
+    p.add_argument("--passes", type=int, default=2, help="passagens do pdflatex")
+
+    p = batch("json2docx", "gera a prova .docx", "bancos JSON/ZIP")
+    bank_opts(p, "Prova")
+    p.add_argument("--template", default="assets/template_prova.docx")
+    p.add_argument("--num", type=int, default=None, help="nº de questões")
+    p.add_argument("--no-shuffle", action="store_true", help="mantém a ordem das questões")
+    p.add_argument("--variants", type=int, default=1, help="gera N variantes (…_prova_v0.docx, _v1, …)")
+    p.add_argument("--exclude-duplicates", action="store_true", help="no máximo uma questão por grupo de quase duplicatas")
+    p.add_argument("--unique-variants", action="store_true",
+                   help="variantes nunca repetem a combinação de variáveis do tipo 3 (erro se a grade esgotar)")
+
+    p = batch("preview", "gera o preview em texto", "bancos JSON/ZIP")
+    bank_opts(p, None)
+
+    p = batch("pdf", "compila .tex com pdflatex", "arquivos .tex")
+    p.add_argument("--passes", type=int, default=2)
+
+    p = sub.add_parser("duplicates", help="procura questões quase duplicadas entre os bancos")
+    p.add_argument("inputs", nargs="+", help="bancos JSON")
+    p.add_argument("--threshold", type=float, default=None, help="similaridade de Jaccard mínima (0–1; padrão 0.6)")
+    p.add_argument("--json-out", default=None, help="também grava o relatório JSON neste arquivo")
+    p.set_defaults(func=_run_duplicates)
+
+    p = sub.add_parser("watch", help="regera as saídas quando os arquivos mudam")
+    import watch
+    watch.build_parser(p)
+    p.set_defaults(func=_run_watch)
+    return ap
+
+
+def main(argv=None) -> int:
+    args = build_parser().parse_args(argv)
+    return args.func(args)
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -1,3 +1,14 @@
 __all__ = ['models','loader','variables','strategies','pipeline']
 
-from .loader import load_quiz, QuizLoadError
+# load_quiz/QuizLoadError vêm de core.loader (que puxa models, prepare, variables...): só são
+# importados no primeiro acesso, para `from core import stats` (GUI, pdflatex) não pagar o loader.
+_LAZY = {"load_quiz": "loader", "QuizLoadError": "loader"}
+
+
+def __getattr__(name):
+    if name in _LAZY:
+        from importlib import import_module
+        value = getattr(import_module(f".{_LAZY[name]}", __name__), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,118 @@
+# -*- coding: utf-8 -*-
+"""
+Cache de sessão para bancos de questões.
+- Guarda o JSON decodificado por caminho, validado por (mtime, tamanho): cada arquivo é lido
+  e decodificado uma única vez enquanto não mudar no disco.
+- O conteúdo em cache NUNCA é entregue diretamente: load_quiz normaliza/resolve in-place,
+  então quem consome recebe cópias.
+- Na leitura, os textos repetitivos do banco passam por um StringPool (core.strpool): o cache e
+  todas as cópias (deepcopy não duplica str) compartilham uma instância de cada texto.
+"""
+from __future__ import annotations
+from copy import deepcopy
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Union
+import os, threading
+
+from .fingerprint import FINGERPRINT_KEY, compute_fingerprint
+from .loader import QuizLoadError, _ensure_questions, _read_json_file, load_quiz
+from .prepare import normalize_alternativas_inplace
+from .strpool import StringPool
+
+Stamp = Tuple[int, int]  # (mtime_ns, tamanho)
+
+
+def file_stamp(path: Union[str, Path]) -> Stamp:
+    st = os.stat(path)
+    return st.st_mtime_ns, st.st_size
+
+
+def _first_time(seen: set, key: str) -> bool:
+    if key in seen:
+        return False
+    seen.add(key)
+    return True
+
+
+class DatasetCache:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._entries: Dict[str, Tuple[Stamp, Any]] = {}
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def _key(path: Union[str, Path]) -> str:
+        return str(Path(path).resolve())
+
+    def raw(self, path: Union[str, Path]) -> Any:
+        """JSON decodificado (compartilhado — não modificar)."""
+        key = self._key(path)
+        try:
+            stamp = file_stamp(key)
+        except OSError as e:
+            raise QuizLoadError(f"Arquivo não encontrado: {path}") from e
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] == stamp:
+                self.hits += 1
+                return entry[1]
+        data = _read_json_file(Path(key))
+        StringPool().intern_all(_ensure_questions(data))
+        with self._lock:
+            self._entries[key] = (stamp, data)
+            self.misses += 1
+        return data
+
+    def is_fresh(self, path: Union[str, Path]) -> bool:
+        """True se o arquivo está em cache e não mudou desde a leitura."""
+        key = self._key(path)
+        entry = self._entries.get(key)
+        try:
+            return entry is not None and entry[0] == file_stamp(key)
+        except OSError:
+            return False
+
+    def questions(self, path: Union[str, Path]) -> List[Dict[str, Any]]:
+        """Cópia das questões cruas do arquivo (pode ser modificada à vontade)."""
+        return deepcopy(_ensure_questions(self.raw(path)))
+
+    def merged_questions(self, paths: Iterable[Union[str, Path]], *, renumber: bool = False,
+                         dedup_questions: bool = False) -> List[Dict[str, Any]]:
+        """
+        Concatena as questões de vários arquivos; `renumber` ordena por id e renumera 1..N.
+        `dedup_questions` descarta repetições exatas entre os arquivos (mesma impressão digital).
+        Como no load_quiz, a impressão digital é calculada (e gravada em q["_fingerprint"]) depois
+        de normalizar as alternativas;K: "alternativas;2" e "alternativas" + firstrow 2 são a mesma questão.
+        """
+        out: List[Dict[str, Any]] = []
+        for p in paths:
+            out.extend(self.questions(p))
+        if dedup_questions:
+            seen = set()
+            kept = []
+            for q in out:
+                if isinstance(q, dict):
+                    normalize_alternativas_inplace(q)
+                    fp = q[FINGERPRINT_KEY] = compute_fingerprint(q)
+                    if not _first_time(seen, fp):
+                        continue
+                kept.append(q)
+            out = kept
+        if renumber:
+            out.sort(key=lambda q: q.get("id", 0))
+            for i, q in enumerate(out, start=1):
+                q["id"] = i
+        return out
+
+    def load(self, path: Union[str, Path], **kwargs) -> Dict[str, Any]:
+        """Equivalente a load_quiz(path, intern_strings=True, **kwargs), sem reler o arquivo."""
+        kwargs.setdefault("intern_strings", True)
+        return load_quiz(deepcopy(self.raw(path)), **kwargs)
+
+    def invalidate(self, path: Optional[Union[str, Path]] = None) -> None:
+        with self._lock:
+            if path is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(self._key(path), None)
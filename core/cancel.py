@@ -0,0 +1,43 @@
+# -*- coding: utf-8 -*-
+"""
+Cancelamento cooperativo de tarefas longas.
+Os laços do core (carga, geração .tex/.docx) chamam `check_cancel(token)` entre questões;
+quem dispara a tarefa (GUI, CLI) chama `token.cancel()`.
+"""
+from __future__ import annotations
+from typing import Callable, Optional
+import threading
+
+
+class JobCancelled(Exception):
+    """Tarefa interrompida a pedido do usuário."""
+    pass
+
+
+class CancelToken:
+    def __init__(self):
+        self._event = threading.Event()
+
+    def cancel(self) -> None:
+        self._event.set()
+
+    @property
+    def cancelled(self) -> bool:
+        return self._event.is_set()
+
+    def check(self) -> None:
+        if self._event.is_set():
+            raise JobCancelled("Tarefa cancelada.")
+
+
+ProgressFn = Callable[[int, int], None]
+
+
+def check_cancel(token: Optional[CancelToken]) -> None:
+    if token is not None:
+        token.check()
+
+
+def report_progress(progress: Optional[ProgressFn], done: int, total: int) -> None:
+    if progress is not None:
+        progress(done, total)
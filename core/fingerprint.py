@@ -0,0 +1,49 @@
+# -*- coding: utf-8 -*-
+"""
+Impressão digital canônica de uma questão.
+- Hash estável (blake2b, 128 bits) do conteúdo normalizado: textos em Unicode NFC com espaços
+  colapsados, ordem das chaves ignorada. Campos de controle (id, chaves "_...") não entram:
+  a mesma questão copiada para outro arquivo, com outro id, tem a mesma impressão digital.
+- Calculada uma vez no load_quiz (antes de resolver variáveis/embaralhar) e guardada em
+  q["_fingerprint"]; serve de chave para caches por questão e para a deduplicação exata.
+"""
+from __future__ import annotations
+from hashlib import blake2b
+from typing import Any, Dict
+import unicodedata
+
+from .jsonio import canonical
+
+FINGERPRINT_KEY = "_fingerprint"
+IGNORED_KEYS = frozenset({"id"})
+
+
+def _canon(v: Any) -> Any:
+    if isinstance(v, str):
+        return " ".join(unicodedata.normalize("NFC", v).split())
+    if isinstance(v, dict):
+        return {_canon(str(k)): _canon(x) for k, x in v.items()}
+    if isinstance(v, (list, tuple)):
+        return [_canon(x) for x in v]
+    return v
+
+
+def compute_fingerprint(q: Dict[str, Any]) -> str:
+    """Impressão digital do conteúdo atual de `q` (sempre recalcula)."""
+    body = {k: _canon(v) for k, v in q.items()
+            if k not in IGNORED_KEYS and not (isinstance(k, str) and k.startswith("_"))}
+    text = canonical(body, default=str)
+    return blake2b(text.encode("utf-8"), digest_size=16).hexdigest()
+
+
+def fingerprint(q: Dict[str, Any]) -> str:
+    """A impressão digital guardada na questão (ou calculada, se ela não veio do load_quiz)."""
+    fp = q.get(FINGERPRINT_KEY)
+    return fp if isinstance(fp, str) else compute_fingerprint(q)
+
+
+def strip_fingerprint(q: Dict[str, Any]) -> Dict[str, Any]:
+    """Cópia rasa sem a impressão digital (para gravar o JSON de volta)."""
+    if FINGERPRINT_KEY not in q:
+        return q
+    return {k: v for k, v in q.items() if k != FINGERPRINT_KEY}
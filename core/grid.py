@@ -0,0 +1,112 @@
+# -*- coding: utf-8 -*-
+"""
+Grade de variáveis do tipo 3 como espaço de índices virtual.
+- O produto cartesiano de todas as `variaveis` (cada uma: min..max em passos de step) nunca é
+  materializado: o índice i vira uma combinação por decomposição em base mista, em O(nº de variáveis).
+- Uma permutação de Feistel sobre o tamanho da grade (core.permute), com chave da seed e da
+  questão (id + enunciado), entrega combinações DISTINTAS: a variante v recebe grade[perm[v]]. N alunos custam O(N),
+  sem sorteio com reposição (e sem colisões).
+- Cada eixo tem só os valores distintos de min..max (min, min+step, ... sem passar de max). Não se
+  usa o ajuste round(v/step)*step de choose_value: com min fora do passo ele repete valores
+  (0.1..0.5 passo 0.2 -> 0.0, 0.4, 0.4) ou sai do intervalo (0..11 passo 3 -> 12).
+- Pedir mais variantes do que a grade tem levanta GridExhausted.
+"""
+from __future__ import annotations
+from typing import Any, Dict, Iterator, List, Mapping, Optional, Tuple
+
+from .permute import FeistelPermutation
+from .rng import rng_for
+
+
+class GridExhausted(ValueError):
+    """Mais variantes pedidas do que combinações distintas na grade."""
+
+
+_EPS = 1e-9                 # tolerância de ponto flutuante ao contar os passos até max
+_DIGITS = 12                # casas mantidas em min + j*step (tira o ruído de 0.1 + 0.2)
+
+
+def _axis(name: str, spec: Mapping[str, Any]) -> Tuple[float, float, int]:
+    """(min, step, nº de valores distintos em [min, max]); ValueError se step <= 0."""
+    min_v, max_v, step = float(spec["min"]), float(spec["max"]), float(spec["step"])
+    if not step > 0:
+        raise ValueError(f"Variável '{name}': step deve ser > 0 (recebido {spec['step']!r}).")
+    if max_v < min_v:
+        return min_v, step, 0
+    return min_v, step, int((max_v - min_v) / step + _EPS) + 1
+
+
+def _exhausted(qid: Any, n: int, size: int) -> GridExhausted:
+    return GridExhausted(f"Questão {qid}: {n} variantes pedidas, mas as variáveis só têm {size} combinações distintas.")
+
+
+class VariableGrid:
+    """grade[i] -> {variável: valor}. Use .size: len() não comporta grades maiores que 2^63."""
+    __slots__ = ("names", "_axes", "size")
+
+    def __init__(self, variaveis: Mapping[str, Mapping[str, Any]]):
+        self.names: Tuple[str, ...] = tuple(variaveis)
+        self._axes: List[Tuple[float, float, int]] = [_axis(n, variaveis[n]) for n in self.names]
+        size = 1
+        for _, _, count in self._axes:
+            size *= max(count, 0)
+        self.size = size
+
+    def __len__(self) -> int:
+        return self.size
+
+    def __getitem__(self, i: int) -> Dict[str, float]:
+        if not 0 <= i < self.size:
+            raise IndexError(i)
+        env: Dict[str, float] = {}
+        # a última variável varia mais rápido (como itertools.product)
+        for name, (min_v, step, count) in zip(reversed(self.names), reversed(self._axes)):
+            i, j = divmod(i, count)
+            env[name] = round(min_v + j * step, _DIGITS)
+        return {n: env[n] for n in self.names}
+
+    def __iter__(self) -> Iterator[Dict[str, float]]:
+        for i in range(self.size):
+            yield self[i]
+
+
+class UniqueSampler:
+    """Combinações distintas da grade, endereçadas pela variante (0, 1, 2, ...)."""
+    __slots__ = ("grid", "qid", "_perm")
+
+    def __init__(self, variaveis: Mapping[str, Mapping[str, Any]], seed: Optional[int], qid: Any = None,
+                 key: Any = None):
+        """`key`: identidade da questão na chave da permutação (core.rng.question_key); padrão: qid."""
+        self.grid = VariableGrid(variaveis)
+        self.qid = qid
+        key = rng_for(seed, 0, qid if key is None else key, "grade").getrandbits(64)
+        self._perm = FeistelPermutation(self.grid.size, key)
+
+    def __len__(self) -> int:
+        return self.grid.size
+
+    def check(self, n: int) -> None:
+        if n > self.grid.size:
+            raise _exhausted(self.qid, n, self.grid.size)
+
+    def __getitem__(self, variant: int) -> Dict[str, float]:
+        self.check(variant + 1)
+        return self.grid[self._perm[variant]]
+
+    def take(self, n: int) -> Iterator[Dict[str, float]]:
+        """As n primeiras combinações (variantes 0..n-1), sem repetir; GridExhausted se não houver n."""
+        self.check(n)
+        for v in range(n):
+            yield self.grid[self._perm[v]]
+
+
+def check_unique_capacity(questions, n: int) -> None:
+    """
+    Levanta GridExhausted se alguma questão com variáveis não comporta n variantes distintas.
+    Chamada antes de gerar (cli.py, json2docx): o erro sai já na carga, não no meio do lote.
+    """
+    for q in questions:
+        if isinstance(q, dict) and q.get("variaveis"):
+            size = VariableGrid(q["variaveis"]).size
+            if n > size:
+                raise _exhausted(q.get("id"), n, size)
@@ -0,0 +1,143 @@
+# -*- coding: utf-8 -*-
+"""
+Codec JSON único do projeto: toda leitura/escrita/cópia de JSON passa por aqui.
+- Backend: orjson quando instalado (parser/serializador em Rust, várias vezes mais rápido),
+  senão o json da stdlib. `backend()` diz qual está ativo; `use(nome)` troca (benchmarks, testes).
+- Dois modos de saída: compacto (padrão: caches, rede, cópias) e `pretty=True` (indentação de 2,
+  para arquivos que pessoas editam — o editor salva assim). Sempre UTF-8, sem escapes \\uXXXX.
+- `canonical()` é o texto estável para hashes/chaves de cache (impressões digitais, cache do
+  servidor): usa SEMPRE a stdlib, para o resultado não mudar conforme o backend instalado.
+- Erros de leitura levantam JSONDecodeError (a do orjson é subclasse da da stdlib).
+- O resultado não depende do backend: o que o orjson recusa ou mudaria cai para a stdlib.
+  · leitura: NaN/Infinity (a stdlib aceita) e inteiros acima de 64 bits -> json.loads;
+  · escrita/clone: o orjson grava NaN/inf como null em silêncio; se a saída tem "null" e o objeto
+    tem float não finito, usa-se a stdlib (que grava NaN/Infinity). Inteiros > 64 bits idem.
+"""
+from __future__ import annotations
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional, Union
+import json, math
+
+try:
+    import orjson
+    _HAS_ORJSON = True
+except ImportError:  # orjson é opcional
+    orjson = None
+    _HAS_ORJSON = False
+
+JSONDecodeError = json.JSONDecodeError
+_BOM = b"\xef\xbb\xbf"
+
+
+def _has_nonfinite(obj: Any) -> bool:
+    stack = [obj]
+    while stack:
+        v = stack.pop()
+        if isinstance(v, float):
+            if not math.isfinite(v):
+                return True
+        elif isinstance(v, dict):
+            stack.extend(v.values())
+        elif isinstance(v, (list, tuple)):
+            stack.extend(v)
+    return False
+
+
+class _Stdlib:
+    name = "json"
+
+    @staticmethod
+    def loads(data: Union[str, bytes]) -> Any:
+        return json.loads(data)
+
+    @staticmethod
+    def dumps(obj: Any, pretty: bool = False, sort_keys: bool = False, default: Optional[Callable] = None) -> bytes:
+        if pretty:
+            text = json.dumps(obj, ensure_ascii=False, indent=2, sort_keys=sort_keys, default=default)
+        else:
+            text = json.dumps(obj, ensure_ascii=False, separators=(",", ":"), sort_keys=sort_keys, default=default)
+        return text.encode("utf-8")
+
+
+class _Orjson:
+    name = "orjson"
+
+    @staticmethod
+    def loads(data: Union[str, bytes]) -> Any:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            return json.loads(data)     # NaN/Infinity, inteiros enormes; se inválido, o erro é da stdlib
+
+    @staticmethod
+    def dumps(obj: Any, pretty: bool = False, sort_keys: bool = False, default: Optional[Callable] = None) -> bytes:
+        opts = orjson.OPT_NON_STR_KEYS
+        if pretty:
+            opts |= orjson.OPT_INDENT_2
+        if sort_keys:
+            opts |= orjson.OPT_SORT_KEYS
+        try:
+            out = orjson.dumps(obj, default=default, option=opts)
+        except TypeError:
+            return _Stdlib.dumps(obj, pretty, sort_keys, default)
+        if b"null" in out and _has_nonfinite(obj):     # só percorre o objeto se houver null na saída
+            return _Stdlib.dumps(obj, pretty, sort_keys, default)
+        return out
+
+
+BACKENDS: Dict[str, Any] = {"json": _Stdlib}
+if _HAS_ORJSON:
+    BACKENDS["orjson"] = _Orjson
+
+_backend = BACKENDS["orjson" if _HAS_ORJSON else "json"]
+
+
+def backend() -> str:
+    return _backend.name
+
+
+def use(name: str) -> str:
+    """Troca o backend ("json" ou "orjson") e devolve o anterior; ValueError se não instalado."""
+    global _backend
+    if name not in BACKENDS:
+        raise ValueError(f"Backend JSON '{name}' indisponível (instalados: {', '.join(BACKENDS)})")
+    previous, _backend = _backend.name, BACKENDS[name]
+    return previous
+
+
+def loads(data: Union[str, bytes, bytearray]) -> Any:
+    if isinstance(data, (bytes, bytearray)) and data[:3] == _BOM:
+        data = data[3:]
+    elif isinstance(data, str) and data[:1] == "\ufeff":
+        data = data[1:]
+    return _backend.loads(data)
+
+
+def dumps_bytes(obj: Any, *, pretty: bool = False, sort_keys: bool = False,
+                default: Optional[Callable] = None) -> bytes:
+    return _backend.dumps(obj, pretty, sort_keys, default)
+
+
+def dumps(obj: Any, *, pretty: bool = False, sort_keys: bool = False,
+          default: Optional[Callable] = None) -> str:
+    return _backend.dumps(obj, pretty, sort_keys, default).decode("utf-8")
+
+
+def read(path: Union[str, Path]) -> Any:
+    return loads(Path(path).read_bytes())
+
+
+def write(path: Union[str, Path], obj: Any, *, pretty: bool = False) -> Path:
+    p = Path(path)
+    p.write_bytes(dumps_bytes(obj, pretty=pretty))
+    return p
+
+
+def clone(obj: Any) -> Any:
+    """Cópia profunda de dados JSON (dict/list/str/números), ida e volta pelo codec."""
+    return _backend.loads(_backend.dumps(obj))
+
+
+def canonical(obj: Any, default: Optional[Callable] = None) -> str:
+    """Texto estável (chaves ordenadas, compacto, stdlib) para hashes e chaves de cache."""
+    return json.dumps(obj, ensure_ascii=False, sort_keys=True, separators=(",", ":"), default=default)
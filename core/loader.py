@@ -2,9 +2,14 @@
 # -*- coding: utf-8 -*-
 from __future__ import annotations
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Union
-import json, zipfile, logging
+from typing import Any, Dict, List, Optional, Set, Union
+import zipfile, logging
 
+from . import jsonio, stats
+from .cancel import CancelToken, check_cancel
+from .fingerprint import FINGERPRINT_KEY, compute_fingerprint
+from .models import Question
+from .strpool import StringPool
 from .prepare import (
     normalize_alternativas_inplace,
     resolve_question_inplace,
@@ -21,14 +26,15 @@ def _coerce_to_data(obj: Union[str, bytes, Dict[str, Any], List[Any]]) -> Union[
     if isinstance(obj, (dict, list)): return obj
     if isinstance(obj, (str, bytes)):
         try:
-            return json.loads(obj)
+            return jsonio.loads(obj)
         except Exception as e:
             raise QuizLoadError(f"JSON inválido: {e}") from e
     raise QuizLoadError(f"Tipo não suportado: {type(obj).__name__}")
 
 def _read_json_file(p: Path) -> Union[Dict[str, Any], List[Any]]:
     try:
-        return json.loads(p.read_text(encoding="utf-8"))
+        with stats.stage("leitura"):
+            return jsonio.read(p)
     except Exception as e:
         raise QuizLoadError(f"Erro lendo '{p}': {e}") from e
 
@@ -38,7 +44,7 @@ def _read_zip(p: Path) -> List[Union[Dict[str, Any], List[Any]]]:
         with zipfile.ZipFile(p, "r") as z:
             for name in z.namelist():
                 if name.lower().endswith(".json"):
-                    out.append(json.loads(z.read(name).decode("utf-8")))
+                    out.append(jsonio.loads(z.read(name)))
         return out
     except zipfile.BadZipFile as e:
         raise QuizLoadError(f"Arquivo ZIP inválido '{p}': {e}") from e
@@ -53,24 +59,49 @@ def _ensure_questions(data: Union[Dict[str, Any], List[Any]]) -> List[Dict[str,
                 return [q for q in v if isinstance(q, dict)]
     return []
 
+def question_from_raw(q: Dict[str, Any]) -> Question:
+    """Question imutável a partir do dict cru (sem modificar o dict de quem chamou)."""
+    c = dict(q)
+    normalize_alternativas_inplace(c)
+    return Question.from_dict(c)
+
+def load_questions(source: Union[bytes, Dict[str, Any], List[Any]]) -> List[Question]:
+    """Questões cruas (lista/dict/JSON) -> List[Question], sem resolver variáveis nem embaralhar."""
+    return [question_from_raw(q) for q in _ensure_questions(_coerce_to_data(source))]
+
 def _normalize_dataset(
     data: Union[Dict[str, Any], List[Any]],
     *,
     shuffle_seed: Optional[int],
     resolve_vars: bool,
     merge_correct: bool,
-    dedup: bool
+    dedup: bool,
+    cancel: Optional[CancelToken] = None,
+    pool: Optional[StringPool] = None,
+    variant: int = 0,
+    seen: Optional[Set[str]] = None,
 ) -> Dict[str, Any]:
     qs = _ensure_questions(data)
     norm_qs: List[Dict[str, Any]] = []
-    for q in qs:
-        if not isinstance(q, dict):
-            continue
-        normalize_alternativas_inplace(q)
-        if resolve_vars:
-            resolve_question_inplace(q, seed_for_vars=shuffle_seed)
-        prepare_alternativas_inplace(q, merge_correct=merge_correct, dedup=dedup, shuffle_seed=shuffle_seed)
-        norm_qs.append(q)
+    with stats.stage("normalização"):
+        for q in qs:
+            if not isinstance(q, dict):
+                continue
+            check_cancel(cancel)
+            normalize_alternativas_inplace(q)
+            fp = q[FINGERPRINT_KEY] = compute_fingerprint(q)
+            if seen is not None:
+                if fp in seen:
+                    continue
+                seen.add(fp)
+            if resolve_vars:
+                with stats.stage("resolução"):
+                    resolve_question_inplace(q, seed_for_vars=shuffle_seed, variant=variant)
+            if pool is not None:
+                pool.intern_question(q)
+            prepare_alternativas_inplace(q, merge_correct=merge_correct, dedup=dedup, shuffle_seed=shuffle_seed, pool=pool, variant=variant)
+            norm_qs.append(q)
+    stats.count("questoes", len(norm_qs))
 
     meta: Dict[str, Any] = {}
     if isinstance(data, dict):
@@ -86,6 +117,10 @@ def load_quiz(
     resolve_vars: bool = True,
     merge_correct: bool = True,
     dedup: bool = True,
+    cancel: Optional[CancelToken] = None,
+    intern_strings: Union[bool, StringPool] = False,
+    variant: int = 0,
+    dedup_questions: bool = False,
 ) -> Dict[str, Any]:
     """
     Fonte ÚNICA para carregar questionários já prontos para renderização.
@@ -93,8 +128,19 @@ def load_quiz(
     - (Opcional) resolve variáveis
     - Mescla correta, deduplica e embaralha (determinístico por questão)
     - Expõe correct_index
+    - `cancel` (opcional) é verificado entre questões
+    - `intern_strings`: True cria um StringPool para o banco (textos repetidos viram uma única
+      instância e as chaves da deduplicação são calculadas uma vez); um StringPool pode ser
+      passado para compartilhar o pool entre vários bancos
+    - `variant`: nº da variante (ex.: uma prova por aluno); com a mesma seed, cada variante tem
+      seus próprios valores/embaralhamentos, calculáveis de forma independente (core.rng)
+    - Cada questão recebe q["_fingerprint"] (core.fingerprint), calculada antes de resolver;
+      `dedup_questions=True` descarta as repetições exatas (mesmo conteúdo, qualquer id), inclusive
+      entre os arquivos de um diretório/ZIP, mantendo a primeira
     Retorna sempre: {"questions":[...], "meta": {...}}
     """
+    pool = intern_strings if isinstance(intern_strings, StringPool) else (StringPool() if intern_strings else None)
+    seen: Optional[Set[str]] = set() if dedup_questions else None
     if isinstance(source, (str, Path)):
         p = Path(source)
         if p.exists():
@@ -102,26 +148,26 @@ def load_quiz(
                 if p.suffix.lower()==".zip":
                     merged={"questions": [], "meta": {}}
                     for ds in _read_zip(p):
-                        nd=_normalize_dataset(ds, shuffle_seed=shuffle_seed, resolve_vars=resolve_vars, merge_correct=merge_correct, dedup=dedup)
+                        nd=_normalize_dataset(ds, shuffle_seed=shuffle_seed, resolve_vars=resolve_vars, merge_correct=merge_correct, dedup=dedup, cancel=cancel, pool=pool, variant=variant, seen=seen)
                         merged["questions"].extend(nd["questions"])
                         merged["meta"].update(nd["meta"] or {})
                     return merged
                 else:
                     ds=_read_json_file(p)
-                    return _normalize_dataset(ds, shuffle_seed=shuffle_seed, resolve_vars=resolve_vars, merge_correct=merge_correct, dedup=dedup)
+                    return _normalize_dataset(ds, shuffle_seed=shuffle_seed, resolve_vars=resolve_vars, merge_correct=merge_correct, dedup=dedup, cancel=cancel, pool=pool, variant=variant, seen=seen)
             else:
                 files=sorted(p.glob("*.json"))
                 if not files:
                     raise QuizLoadError(f"Nenhum .json no diretório '{p}'")
                 merged={"questions": [], "meta": {}}
                 for fp in files:
-                    nd=_normalize_dataset(_read_json_file(fp), shuffle_seed=shuffle_seed, resolve_vars=resolve_vars, merge_correct=merge_correct, dedup=dedup)
+                    nd=_normalize_dataset(_read_json_file(fp), shuffle_seed=shuffle_seed, resolve_vars=resolve_vars, merge_correct=merge_correct, dedup=dedup, cancel=cancel, pool=pool, variant=variant, seen=seen)
                     merged["questions"].extend(nd["questions"])
                     merged["meta"].update(nd["meta"] or {})
                 return merged
         # se não existe como path, tentar string JSON
         data=_coerce_to_data(str(source))
-        return _normalize_dataset(data, shuffle_seed=shuffle_seed, resolve_vars=resolve_vars, merge_correct=merge_correct, dedup=dedup)
+        return _normalize_dataset(data, shuffle_seed=shuffle_seed, resolve_vars=resolve_vars, merge_correct=merge_correct, dedup=dedup, cancel=cancel, pool=pool, variant=variant, seen=seen)
     # bytes / dict / list
     data=_coerce_to_data(source)
-    return _normalize_dataset(data, shuffle_seed=shuffle_seed, resolve_vars=resolve_vars, merge_correct=merge_correct, dedup=dedup)
+    return _normalize_dataset(data, shuffle_seed=shuffle_seed, resolve_vars=resolve_vars, merge_correct=merge_correct, dedup=dedup, cancel=cancel, pool=pool, variant=variant, seen=seen)
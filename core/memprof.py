@@ -0,0 +1,126 @@
+# -*- coding: utf-8 -*-
+"""
+Perfil de memória de uma geração com tracemalloc, nas mesmas fronteiras de etapa do core.stats
+(carga/leitura/normalização/resolução, latex/docx, escrita, ...).
+- `with collect_memory() as rep:` liga o tracemalloc (se ainda não estava ligado) e coleta, por
+  etapa: tempo, pico de memória dentro da etapa, variação da memória viva e os principais locais
+  de alocação (diferença entre snapshots no início e no fim da etapa).
+- Snapshots custam caro: só são tirados na PRIMEIRA execução de cada etapa até a profundidade
+  SNAPSHOT_DEPTH; etapas repetidas por questão (ex.: carga/normalização/resolução) ficam só com
+  pico e variação, que custam pouco.
+- O tracemalloc é global ao processo: coletas simultâneas (duas tarefas da GUI) são serializadas
+  por um lock, para que os números de uma não se misturem aos da outra.
+"""
+from __future__ import annotations
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Union
+import threading, tracemalloc
+
+from . import stats
+
+TOP_SITES = 10
+SNAPSHOT_DEPTH = 1          # 0 = só etapas de primeiro nível; 1 = também as filhas diretas
+_MiB = 2 ** 20
+_LOCK = threading.Lock()
+_FILTERS = (
+    tracemalloc.Filter(False, tracemalloc.__file__),
+    tracemalloc.Filter(False, __file__),
+    tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+    tracemalloc.Filter(False, "<frozen importlib._bootstrap_external>"),
+    tracemalloc.Filter(False, "<unknown>"),
+)
+
+
+def _snapshot() -> tracemalloc.Snapshot:
+    return tracemalloc.take_snapshot().filter_traces(_FILTERS)
+
+
+class MemoryReport(stats.StageReport):
+    """StageReport que também mede memória: .memory[etapa] = {peak_bytes, delta_bytes, top}."""
+    __slots__ = ("memory", "top", "peak_bytes", "_peaks")
+
+    def __init__(self, top: int = TOP_SITES):
+        super().__init__()
+        self.memory: Dict[str, Dict[str, Any]] = {}
+        self.top = top
+        self.peak_bytes = 0
+        self._peaks: List[int] = []          # pico já visto por etapa aberta (reset_peak é global)
+
+    def _fold_peak(self) -> int:
+        """Pico desde o último reset, repassado à etapa aberta; zera o pico do tracemalloc."""
+        peak = tracemalloc.get_traced_memory()[1]
+        if self._peaks:
+            self._peaks[-1] = max(self._peaks[-1], peak)
+        self.peak_bytes = max(self.peak_bytes, peak)
+        tracemalloc.reset_peak()
+        return peak
+
+    @contextmanager
+    def stage(self, name: str) -> Iterator[None]:
+        path = f"{self._stack[-1]}/{name}" if self._stack else name
+        first = path not in self.stages
+        before = _snapshot() if first and path.count("/") <= SNAPSHOT_DEPTH else None
+        rec = self.memory.setdefault(path, {"peak_bytes": 0, "delta_bytes": 0, "top": []})
+        self._fold_peak()
+        current0 = tracemalloc.get_traced_memory()[0]
+        self._peaks.append(current0)
+        try:
+            with super().stage(name):
+                yield
+        finally:
+            self._fold_peak()
+            peak = self._peaks.pop()
+            if self._peaks:
+                self._peaks[-1] = max(self._peaks[-1], peak)
+            rec["peak_bytes"] = max(rec["peak_bytes"], peak)
+            rec["delta_bytes"] += tracemalloc.get_traced_memory()[0] - current0
+            if before is not None:
+                rec["top"] = [
+                    {"site": f"{s.traceback[0].filename}:{s.traceback[0].lineno}",
+                     "size_diff": s.size_diff, "count_diff": s.count_diff}
+                    for s in _snapshot().compare_to(before, "lineno")[:self.top] if s.size_diff > 0
+                ]
+
+    def to_dict(self) -> Dict[str, Any]:
+        d = super().to_dict()
+        d["memory"] = {"peak_bytes": self.peak_bytes, "stages": self.memory}
+        return d
+
+    def format(self) -> str:
+        lines = [super().format(), f"Memória (tracemalloc): pico {self.peak_bytes / _MiB:.1f} MiB"]
+        for path, rec in self.memory.items():
+            depth = path.count("/")
+            name = path.rsplit("/", 1)[-1]
+            lines.append(f"  {'  ' * depth}{name:<{24 - 2 * depth}} pico {rec['peak_bytes'] / _MiB:8.1f} MiB"
+                         f"  Δ {rec['delta_bytes'] / _MiB:+8.1f} MiB")
+            for site in rec["top"]:
+                lines.append(f"  {'  ' * depth}    {site['size_diff'] / 1024:+10.1f} KiB  {site['count_diff']:+7d}  {site['site']}")
+        return "\n".join(lines)
+
+    def save(self, path: Union[str, Path]) -> Path:
+        p = Path(path)
+        p.write_text(self.format() + "\n", encoding="utf-8")
+        return p
+
+
+@contextmanager
+def collect_memory(top: int = TOP_SITES, frames: int = 1) -> Iterator[MemoryReport]:
+    """core.stats.collect() com um MemoryReport; liga/desliga o tracemalloc em volta do bloco."""
+    with _LOCK:
+        started = not tracemalloc.is_tracing()
+        if started:
+            tracemalloc.start(frames)
+        rep = MemoryReport(top)
+        try:
+            with stats.collect(rep):
+                yield rep
+        finally:
+            rep._fold_peak()
+            if started:
+                tracemalloc.stop()
+
+
+def report_path(output: Optional[Union[str, Path]]) -> Optional[Path]:
+    """Onde gravar o relatório de uma tarefa: ao lado da saída (<saída>.memoria.txt)."""
+    return Path(f"{output}.memoria.txt") if output else None
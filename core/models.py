@@ -1,7 +1,43 @@
 from __future__ import annotations
 from dataclasses import dataclass, field
-from enum import IntEnum
-from typing import List, Dict, Any, Optional
+from enum import Enum, IntEnum
+from collections.abc import Mapping
+from typing import Dict, Any, List, Optional, Sequence, Tuple
+
+class _EmptyMap(Mapping):
+    """Mapping vazio e imutável; o pickle devolve a mesma instância (EMPTY_MAP)."""
+    __slots__ = ()
+
+    def __getitem__(self, key):
+        raise KeyError(key)
+
+    def __iter__(self):
+        return iter(())
+
+    def __len__(self) -> int:
+        return 0
+
+    def __repr__(self) -> str:
+        return "EMPTY_MAP"
+
+    def __reduce__(self):
+        return "EMPTY_MAP"
+
+# Sentinelas compartilhadas para coleções ausentes (uma única instância para todas as questões).
+EMPTY: Tuple[Any, ...] = ()
+EMPTY_MAP: Mapping[str, Any] = _EmptyMap()
+
+
+def _empty_map() -> Mapping[str, Any]:
+    return EMPTY_MAP  # default_factory que devolve sempre a mesma instância
+
+
+def _tuple(v: Any) -> Tuple[Any, ...]:
+    return tuple(v) if v else EMPTY
+
+
+def _map(v: Any) -> Mapping[str, Any]:
+    return dict(v) if v else EMPTY_MAP
 
 class QuestionType(IntEnum):
     TYPE1 = 1  # alternativas texto
@@ -9,19 +45,20 @@ class QuestionType(IntEnum):
     TYPE3 = 3  # parametrizada (variáveis e resoluções)
     TYPE4 = 4  # afirmativas (I, II, III...)
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Question:
+    """Questão imutável e compacta: sem __dict__; coleções vazias apontam para EMPTY/EMPTY_MAP."""
     id: int
     enunciado: str
     dificuldade: str = "média"
-    imagens: List[str] = field(default_factory=list)
-    alternativas: List[str] = field(default_factory=list)
+    imagens: Tuple[str, ...] = EMPTY
+    alternativas: Tuple[str, ...] = EMPTY
     correta: str = ""
     tipo: QuestionType = QuestionType.TYPE1
-    variaveis: Dict[str, Any] = field(default_factory=dict)
-    resolucoes: Dict[str, str] = field(default_factory=dict)
-    afirmacoes: Dict[str, str] = field(default_factory=dict)
-    obs: List[str] = field(default_factory=list)
+    variaveis: Mapping[str, Any] = field(default_factory=_empty_map)
+    resolucoes: Mapping[str, str] = field(default_factory=_empty_map)
+    afirmacoes: Mapping[str, str] = field(default_factory=_empty_map)
+    obs: Tuple[str, ...] = EMPTY
 
     @staticmethod
     def infer_tipo(data: Dict[str, Any]) -> QuestionType:
@@ -44,14 +81,14 @@ class Question:
             id = int(data.get("id", 0)),
             enunciado = str(data.get("enunciado","")).strip(),
             dificuldade = (data.get("dificuldade") or "média").strip(),
-            imagens = list(data.get("imagens") or []),
-            alternativas = list(data.get("alternativas") or []),
+            imagens = _tuple(data.get("imagens")),
+            alternativas = _tuple(data.get("alternativas")),
             correta = str(data.get("correta") or ""),
             tipo = tipo,
-            variaveis = dict(data.get("variaveis") or {}),
-            resolucoes = dict(data.get("resolucoes") or {}),
-            afirmacoes = dict(data.get("afirmacoes") or {}),
-            obs = list(data.get("obs") or []),
+            variaveis = _map(data.get("variaveis")),
+            resolucoes = _map(data.get("resolucoes")),
+            afirmacoes = _map(data.get("afirmacoes")),
+            obs = _tuple(data.get("obs")),
         )
 
     def to_dict(self) -> Dict[str, Any]:
@@ -64,10 +101,10 @@ class Question:
             "correta": self.correta,
             "tipo": int(self.tipo),
         }
-        if self.variaveis: d["variaveis"] = self.variaveis
-        if self.resolucoes: d["resolucoes"] = self.resolucoes
-        if self.afirmacoes: d["afirmacoes"] = self.afirmacoes
-        if self.obs: d["obs"] = self.obs
+        if self.variaveis: d["variaveis"] = dict(self.variaveis)
+        if self.resolucoes: d["resolucoes"] = dict(self.resolucoes)
+        if self.afirmacoes: d["afirmacoes"] = dict(self.afirmacoes)
+        if self.obs: d["obs"] = [*self.obs]
         return d
 
 @dataclass
@@ -76,13 +113,49 @@ class RenderOptions:
     shuffle_questions: bool = False
     shuffle_alternatives: bool = False
     seed: Optional[int] = None  # deterministic shuffling
+    variant: int = 0  # exam variant under the same seed (core.rng)
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class RenderedQuestion:
+    """Resultado imutável; para trocar um campo use dataclasses.replace(rq, ...)."""
     id: int
     tipo: QuestionType
     enunciado: str
-    imagens: List[str]
-    alternativas: List[str]
-    correta: str
-    extra: Dict[str, Any] = field(default_factory=dict)
+    imagens: Tuple[str, ...] = EMPTY
+    alternativas: Tuple[str, ...] = EMPTY
+    correta: str = ""
+    extra: Mapping[str, Any] = field(default_factory=_empty_map)
+
+# ---------- IR (representação intermediária usada por core.parsers / core.types) ----------
+
+class QuestionKind(str, Enum):
+    TYPE1 = "type1"
+    TYPE2 = "type2"
+    TYPE3 = "type3"
+    TYPE4 = "type4"
+
+@dataclass(frozen=True, slots=True)
+class Choice:
+    text: str
+    is_correct: bool = False
+    meta: Mapping[str, Any] = field(default_factory=_empty_map)
+
+@dataclass(frozen=True, slots=True)
+class Asset:
+    kind: str  # "image"
+    src: str
+
+@dataclass(frozen=True, slots=True)
+class QuestionIR:
+    id: int
+    kind: QuestionKind
+    prompt: str
+    choices: Sequence[Choice] = EMPTY
+    solution: Optional[str] = None
+    assets: Sequence[Asset] = EMPTY
+    metadata: Mapping[str, Any] = field(default_factory=_empty_map)
+
+@dataclass(slots=True)
+class QuizIR:
+    title: str
+    questions: List[QuestionIR] = field(default_factory=list)
@@ -0,0 +1,207 @@
+# -*- coding: utf-8 -*-
+"""
+Detecção de questões quase duplicadas entre bancos (MinHash + LSH).
+- Cada questão vira um conjunto de shingles (pares de palavras normalizadas: minúsculas, sem
+  acentos/pontuação) do enunciado, da correta e de cada alternativa. A ordem das alternativas
+  não importa; uma palavra trocada aqui e ali mantém quase todos os shingles.
+- Assinatura MinHash de "uma permutação" (one-permutation hashing): cada shingle é hasheado uma
+  única vez e cai num dos `num_perm` compartimentos, que guardam o menor valor. Custo O(shingles)
+  por questão, em vez de O(shingles × num_perm) do MinHash clássico. Compartimentos vazios são
+  preenchidos pelo vizinho (densificação), para questões curtas continuarem comparáveis.
+- LSH por bandas: só questões que coincidem numa banda inteira viram candidatas; os candidatos
+  são confirmados pela similaridade de Jaccard exata dos shingles. Nada é comparado par a par
+  com o banco inteiro — o custo cresce com o nº de questões, não com o seu quadrado.
+"""
+from __future__ import annotations
+from dataclasses import dataclass
+from typing import Any, Dict, FrozenSet, Iterable, List, Optional, Sequence, Tuple, Union
+import re, unicodedata, zlib
+
+NUM_PERM = 128
+BANDS = 32                  # 32 bandas × 4 linhas: pares com Jaccard 0,6 viram candidatos em ~99% dos casos
+THRESHOLD = 0.6
+SHINGLE = 2                 # palavras por shingle
+MAX_BUCKET = 200            # baldes maiores que isso (textos-padrão) não geram candidatos
+
+_WORD_RE = re.compile(r"\w+")
+_EMPTY_BIN = 1 << 32
+
+
+def _words(text: str) -> List[str]:
+    text = text.lower()
+    if not text.isascii():
+        text = "".join(c for c in unicodedata.normalize("NFKD", text) if not unicodedata.combining(c))
+    return _WORD_RE.findall(text)
+
+
+def shingles(q: Dict[str, Any], k: int = SHINGLE) -> FrozenSet[int]:
+    """Hashes (crc32, estáveis entre processos) dos shingles de palavras da questão."""
+    parts: List[Any] = [q.get("enunciado"), q.get("correta")]
+    alts = q.get("alternativas")
+    parts.extend(alts if isinstance(alts, list) else [alts])
+    afirm = q.get("afirmacoes")
+    if isinstance(afirm, dict):
+        parts.extend(afirm.values())
+    out = set()
+    for part in parts:
+        if not isinstance(part, str):
+            continue
+        words = _words(part)
+        if len(words) <= k:
+            if words:
+                out.add(zlib.crc32(" ".join(words).encode("utf-8")))
+            continue
+        for i in range(len(words) - k + 1):
+            out.add(zlib.crc32(" ".join(words[i:i + k]).encode("utf-8")))
+    return frozenset(out)
+
+
+def signature(sh: Iterable[int], num_perm: int = NUM_PERM) -> Tuple[int, ...]:
+    """MinHash de uma permutação (com densificação) sobre os hashes dos shingles."""
+    bins = [_EMPTY_BIN] * num_perm
+    for h in sh:
+        b, v = h % num_perm, h // num_perm
+        if v < bins[b]:
+            bins[b] = v
+    first = next((i for i, v in enumerate(bins) if v != _EMPTY_BIN), None)
+    if first is None:
+        return tuple(bins)
+    # densificação: o compartimento vazio copia o próximo preenchido (circular), marcado pela distância
+    nxt = first + num_perm
+    for i in range(num_perm - 1, -1, -1):
+        if bins[i] != _EMPTY_BIN:
+            nxt = i
+        else:
+            j = nxt % num_perm
+            bins[i] = bins[j] + (nxt - i) * _EMPTY_BIN
+    return tuple(bins)
+
+
+def jaccard(a: FrozenSet[int], b: FrozenSet[int]) -> float:
+    if not a and not b:
+        return 1.0
+    return len(a & b) / len(a | b)
+
+
+@dataclass(frozen=True, slots=True)
+class DuplicateCluster:
+    members: Tuple[int, ...]        # índices na lista analisada (o primeiro é o "original")
+    similarity: float               # menor Jaccard confirmado entre membros ligados
+
+
+class _UnionFind:
+    __slots__ = ("parent",)
+
+    def __init__(self, n: int):
+        self.parent = list(range(n))
+
+    def find(self, x: int) -> int:
+        p = self.parent
+        while p[x] != x:
+            p[x] = p[p[x]]
+            x = p[x]
+        return x
+
+    def union(self, a: int, b: int) -> None:
+        ra, rb = self.find(a), self.find(b)
+        if ra != rb:
+            self.parent[max(ra, rb)] = min(ra, rb)
+
+
+def find_near_duplicates(
+    questions: Sequence[Dict[str, Any]],
+    *,
+    threshold: float = THRESHOLD,
+    num_perm: int = NUM_PERM,
+    bands: int = BANDS,
+) -> List[DuplicateCluster]:
+    """Grupos (2+ questões) com similaridade de Jaccard >= threshold, na ordem da entrada."""
+    if num_perm % bands:
+        raise ValueError("num_perm deve ser múltiplo de bands")
+    rows = num_perm // bands
+    sets = [shingles(q) if isinstance(q, dict) else frozenset() for q in questions]
+
+    buckets: List[Dict[Tuple[int, ...], List[int]]] = [{} for _ in range(bands)]
+    for i, sh in enumerate(sets):
+        if not sh:
+            continue
+        sig = signature(sh, num_perm)
+        for b in range(bands):
+            buckets[b].setdefault(sig[b * rows:(b + 1) * rows], []).append(i)
+
+    uf = _UnionFind(len(sets))
+    checked = set()
+    edges: List[Tuple[int, float]] = []       # (questão, similaridade) de cada ligação aceita
+    for table in buckets:
+        for members in table.values():
+            if len(members) < 2 or len(members) > MAX_BUCKET:
+                continue
+            for pos, j in enumerate(members[1:], start=1):
+                for i in members[:pos]:
+                    if uf.find(i) == uf.find(j) or (i, j) in checked:
+                        continue
+                    checked.add((i, j))
+                    s = jaccard(sets[i], sets[j])
+                    if s >= threshold:
+                        uf.union(i, j)
+                        edges.append((j, s))
+                        break
+
+    groups: Dict[int, List[int]] = {}
+    for i in range(len(sets)):
+        groups.setdefault(uf.find(i), []).append(i)
+    sims: Dict[int, float] = {}
+    for j, s in edges:
+        root = uf.find(j)
+        sims[root] = min(s, sims.get(root, 1.0))
+    out = [DuplicateCluster(tuple(m), round(sims.get(root, 1.0), 3)) for root, m in groups.items() if len(m) > 1]
+    out.sort(key=lambda c: c.members[0])
+    return out
+
+
+def cluster_labels(n: int, clusters: Iterable[DuplicateCluster]) -> List[int]:
+    """Rótulo por questão: o índice do primeiro membro do seu grupo (ou o próprio índice)."""
+    labels = list(range(n))
+    for c in clusters:
+        for i in c.members:
+            labels[i] = c.members[0]
+    return labels
+
+
+def drop_near_duplicates(questions: Sequence[Dict[str, Any]], clusters: Optional[Iterable[DuplicateCluster]] = None,
+                         **kwargs) -> List[Dict[str, Any]]:
+    """Mantém só o primeiro de cada grupo de quase duplicatas."""
+    if clusters is None:
+        clusters = find_near_duplicates(questions, **kwargs)
+    labels = cluster_labels(len(questions), clusters)
+    return [q for i, q in enumerate(questions) if labels[i] == i]
+
+
+def format_clusters(questions: Sequence[Dict[str, Any]], clusters: List[DuplicateCluster],
+                    sources: Optional[Sequence[str]] = None, limit: int = 20) -> str:
+    """Relatório legível: um bloco por grupo, com arquivo de origem (se dado), id e início do enunciado."""
+    lines = []
+    for c in clusters[:limit]:
+        lines.append(f"Quase duplicatas (similaridade ≥ {c.similarity:.2f}):")
+        for i in c.members:
+            q = questions[i]
+            where = f"{sources[i]} " if sources else ""
+            text = " ".join(str(q.get("enunciado") or "").split())
+            lines.append(f"   {where}#{q.get('id', '?')}: {text[:70]}{'…' if len(text) > 70 else ''}")
+    if len(clusters) > limit:
+        lines.append(f"… e mais {len(clusters) - limit} grupo(s).")
+    return "\n".join(lines)
+
+
+def scan_banks(paths: Iterable[Union[str, Any]], *, datasets=None, **kwargs) -> Tuple[List[Dict[str, Any]], List[str], List[DuplicateCluster]]:
+    """Lê vários bancos e procura quase duplicatas entre (e dentro de) todos eles."""
+    from pathlib import Path
+    from .loader import _ensure_questions, _read_json_file
+    questions: List[Dict[str, Any]] = []
+    sources: List[str] = []
+    for p in paths:
+        data = datasets.raw(p) if datasets is not None else _read_json_file(Path(p))
+        qs = [q for q in _ensure_questions(data) if isinstance(q, dict)]
+        questions.extend(qs)
+        sources.extend([Path(p).name] * len(qs))
+    return questions, sources, find_near_duplicates(questions, **kwargs)
@@ -1,6 +1,7 @@
-import json
+from __future__ import annotations
 from typing import List, Dict, Any, Iterable, Union
 from pathlib import Path
+from core import jsonio
 from core.models import QuestionIR, QuizIR, QuestionKind
 # apenas ao import, registre builders:
 from core.types.type1 import Type1Builder
@@ -8,9 +9,6 @@ from core.types.type2 import Type2Builder
 from core.types.type3 import Type3Builder
 from core.types.type4 import Type4Builder
 from core.registry import register, get_builder
-from __future__ import annotations
-# (mantenha os demais imports que você já tem)
-
 
 # registra uma vez (poderia ser em core/__init__)
 register(Type1Builder())
@@ -77,8 +75,7 @@ def load_jsons(paths: Union[str, Path, Iterable[Union[str, Path]]]) -> List[Dict
     out: List[Dict[str, Any]] = []
     for p in paths:
         p = Path(p)
-        with p.open("r", encoding="utf-8") as f:
-            data = json.load(f)
+        data = jsonio.read(p)
         if not isinstance(data, list):
             raise ValueError(f"{p}: conteúdo deve ser um array de questões (list).")
 
@@ -94,34 +91,38 @@ def load_jsons(paths: Union[str, Path, Iterable[Union[str, Path]]]) -> List[Dict
     return out
 
 
+_KIND_BY_TIPO = {
+    1: QuestionKind.TYPE1,
+    2: QuestionKind.TYPE2,
+    3: QuestionKind.TYPE3,
+    4: QuestionKind.TYPE4,
+}
+
+
+def _kind_of(q: Dict[str, Any]) -> QuestionKind:
+    # NOVO: aceitar vários jeitos de indicar o tipo
+    kind_val = q.get("type") or q.get("kind") or q.get("questionType")
+
+    if not kind_val and "tipo" in q:
+        # mapeia 1/2/3/4 -> enums
+        try:
+            tipo_int = int(q["tipo"])
+        except Exception:
+            raise ValueError(f"Campo 'tipo' inválido: {q.get('tipo')}")
+        kind = _KIND_BY_TIPO.get(tipo_int)
+        if not kind:
+            raise ValueError(f"Tipo numérico não suportado: {tipo_int}")
+        return kind
+    # aceita "type": "type1" (string)
+    if not kind_val:
+        raise ValueError(f"Questão sem 'type'/'tipo': {q}")
+    return QuestionKind(str(kind_val))
+
+
 def to_ir(raw_questions: List[Dict[str, Any]], title="Quiz") -> QuizIR:
     out: List[QuestionIR] = []
     for i, q in enumerate(raw_questions, start=1):
-        # NOVO: aceitar vários jeitos de indicar o tipo
-        kind_val = q.get("type") or q.get("kind") or q.get("questionType")
-
-        if not kind_val and "tipo" in q:
-            # mapeia 1/2/3/4 -> enums
-            try:
-                tipo_int = int(q["tipo"])
-            except Exception:
-                raise ValueError(f"Campo 'tipo' inválido: {q.get('tipo')}")
-            mapa = {
-                1: QuestionKind.TYPE1,
-                2: QuestionKind.TYPE2,
-                3: QuestionKind.TYPE3,
-                4: QuestionKind.TYPE4,
-            }
-            kind = mapa.get(tipo_int)
-            if not kind:
-                raise ValueError(f"Tipo numérico não suportado: {tipo_int}")
-        else:
-            # aceita "type": "type1" (string)
-            if not kind_val:
-                raise ValueError(f"Questão sem 'type'/'tipo': {q}")
-            kind = QuestionKind(str(kind_val))
-
-        builder = get_builder(kind)
+        builder = get_builder(_kind_of(q))
         out.append(builder.build_ir(q, new_id=i))
 
     return QuizIR(title=title, questions=out)
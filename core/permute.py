@@ -0,0 +1,53 @@
+# -*- coding: utf-8 -*-
+"""
+Permutação pseudoaleatória de range(n) sem materializar a lista.
+Rede de Feistel balanceada sobre 2^(2k) >= n com "cycle walking": índice -> posição em O(1)
+de memória, determinística pela chave. Serve para embaralhar por índice (sem copiar a lista
+de questões) e para percorrer um espaço grande sem repetir elementos.
+"""
+from __future__ import annotations
+from typing import Iterator
+
+from .rng import MASK64 as _MASK64, mix64
+
+ROUNDS = 4
+
+
+class FeistelPermutation:
+    """perm[i] para i em range(n): uma permutação de range(n) definida por `key`."""
+    __slots__ = ("n", "key", "_half", "_mask", "_keys")
+
+    def __init__(self, n: int, key: int = 0):
+        if n < 0:
+            raise ValueError("n deve ser >= 0")
+        self.n = n
+        self.key = key
+        bits = max(2, (n - 1).bit_length())
+        self._half = (bits + 1) // 2
+        self._mask = (1 << self._half) - 1
+        self._keys = tuple(mix64((key & _MASK64) ^ mix64(r)) for r in range(ROUNDS))
+
+    def __len__(self) -> int:
+        return self.n
+
+    def _encrypt(self, x: int) -> int:
+        half, mask = self._half, self._mask
+        left, right = x >> half, x & mask
+        for k in self._keys:
+            left, right = right, left ^ (mix64(right ^ k) & mask)
+        return (left << half) | right
+
+    def __getitem__(self, i: int) -> int:
+        n = self.n
+        if i < 0:
+            i += n
+        if not 0 <= i < n:
+            raise IndexError(i)
+        y = self._encrypt(i)
+        while y >= n:          # cycle walking: domínio 2^(2k) < 4n, poucas voltas em média
+            y = self._encrypt(y)
+        return y
+
+    def __iter__(self) -> Iterator[int]:
+        for i in range(self.n):
+            yield self[i]
@@ -1,29 +1,43 @@
 
 from __future__ import annotations
-from typing import List, Dict, Any
-import random
+from typing import Any, Dict, List
+from dataclasses import replace
 from .models import Question, RenderOptions, RenderedQuestion
-from .loader import load_questions
+from .loader import _ensure_questions
+from .prepare import normalize_alternativas_inplace
+from .rng import rng_for, rng_for_question
 from .strategies import HANDLERS
 
 def render_all(raw_questions: List[Dict[str, Any]], options: RenderOptions) -> List[RenderedQuestion]:
-    qs = load_questions(raw_questions)
-    rnd = random.Random(options.seed)
+    """
+    Cada questão tem o seu RNG (seed, variante, id + enunciado): o resultado de uma questão não depende
+    das que vieram antes, e a variante k sai igual gerada sozinha ou em lote.
+    Os handlers recebem em ctx["source"] a cópia normalizada do dict cru (a Type 3 resolve sobre ela,
+    como o load_quiz): valores, distratores e ordem das alternativas saem iguais aos do load_quiz.
+    """
+    qs = _ensure_questions(raw_questions) if isinstance(raw_questions, dict) else raw_questions
+    seed, variant = options.seed, options.variant
+    ctx = {"target": options.target, "seed": seed, "variant": variant}
 
     # shuffle questions depending on target
+    order = list(range(len(qs)))
     if options.shuffle_questions:
-        qs = qs[:]
-        rnd.shuffle(qs)
+        rng_for(seed, variant, None, "ordem").shuffle(order)
 
     rendered: List[RenderedQuestion] = []
-    for q in qs:
-        handler = HANDLERS[q.tipo]
-        rq = handler.render(q, {"rnd": rnd, "target": options.target})
+    for i in order:
+        raw = qs[i]
+        if not isinstance(raw, dict):
+            continue
+        src = ctx["source"] = dict(raw)
+        normalize_alternativas_inplace(src)
+        q = Question.from_dict(src)
+        rq = HANDLERS[q.tipo].render(q, ctx)
         # shuffle alternatives if requested (beamer keeps original order)
         if options.shuffle_alternatives:
-            alts = rq.alternativas[:]
-            rnd.shuffle(alts)
-            rq.alternativas = alts
+            alts = list(rq.alternativas)
+            rng_for_question(seed, variant, src, "alternativas").shuffle(alts)
+            rq = replace(rq, alternativas=tuple(alts))
         rendered.append(rq)
 
     return rendered
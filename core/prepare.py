@@ -1,8 +1,11 @@
 
 # -*- coding: utf-8 -*-
 from __future__ import annotations
-from typing import Any, Dict, List, Tuple, Optional, Union
-import logging, hashlib, random
+from typing import Any, Callable, Dict, List, Tuple, Optional, Union
+import logging, random
+
+from .rng import rng_for_question
+from .strpool import StringPool
 
 logger = logging.getLogger(__name__)
 
@@ -50,34 +53,35 @@ def normalize_alternativas_inplace(q: Dict[str, Any]) -> None:
 
 # ---------- variables resolution ----------
 
-def resolve_question_inplace(q: Dict[str, Any], *, seed_for_vars: Optional[int]=None) -> None:
+def resolve_question_inplace(q: Dict[str, Any], *, seed_for_vars: Optional[int]=None, variant: int=0) -> None:
     """
     Centraliza a resolução de variáveis chamando core.variables.resolve_all.
     A assinatura local não expõe envs extras enquanto o projeto não suportar.
     """
     from core.variables import resolve_all
-    res = resolve_all(q, seed=seed_for_vars)
+    res = resolve_all(q, seed=seed_for_vars, variant=variant)
     q_res = res[0] if isinstance(res, tuple) else res
     q.clear()
     q.update(q_res)
 
 # ---------- answers: merge + dedup + shuffle ----------
 
-def _dedup_preserving_first(items: List[Any]) -> List[Any]:
+def _strip_key(a: Any) -> Any:
+    return a.strip() if isinstance(a,str) else a
+
+def _dedup_preserving_first(items: List[Any], key_of: Callable[[Any], Any] = _strip_key) -> List[Any]:
     seen=set(); out=[]
     for a in items:
-        key=a.strip() if isinstance(a,str) else a
+        key=key_of(a)
         if key in seen: 
             continue
         seen.add(key)
         out.append(a)
     return out
 
-def _rng_for_question(seed: int, q: Dict[str, Any]) -> random.Random:
-    base=str(seed)
-    salt=f"{q.get('id','')}|{q.get('enunciado','')}|{len(q.get(ALT_KEY,[]) or [])}"
-    h=hashlib.sha256((base+'|'+salt).encode('utf-8')).hexdigest()
-    return random.Random(int(h[:16],16))
+def _rng_for_question(seed: int, q: Dict[str, Any], variant: int=0) -> random.Random:
+    """RNG contador-based da questão (id + enunciado), independente das demais."""
+    return rng_for_question(seed, variant, q, ALT_KEY)
 
 def prepare_alternativas_inplace(
     q: Dict[str, Any],
@@ -85,9 +89,13 @@ def prepare_alternativas_inplace(
     merge_correct: bool=True,
     dedup: bool=True,
     shuffle_seed: Optional[int]=None,
+    pool: Optional[StringPool]=None,
+    variant: int=0,
 ) -> None:
+    """`pool` (opcional): chaves stripped pré-calculadas do banco, em vez de strip() a cada comparação."""
     if not isinstance(q, dict):
         return
+    key_of = pool.key if pool is not None else _strip_key
     alts = q.get(ALT_KEY) or []
     if not isinstance(alts, list):
         alts = []
@@ -97,7 +105,7 @@ def prepare_alternativas_inplace(
     if merge_correct and cor not in (None,""):
         merged.append(cor)
     if dedup:
-        merged = _dedup_preserving_first(merged)
+        merged = _dedup_preserving_first(merged, key_of)
 
     correct_idx = None
     if cor not in (None,"") and isinstance(merged, list):
@@ -105,13 +113,13 @@ def prepare_alternativas_inplace(
             correct_idx = merged.index(cor)
         except ValueError:
             if isinstance(cor,str):
-                cs=cor.strip()
+                cs=key_of(cor)
                 for i,a in enumerate(merged):
-                    if isinstance(a,str) and a.strip()==cs:
+                    if isinstance(a,str) and key_of(a)==cs:
                         correct_idx=i; break
 
     if shuffle_seed is not None and len(merged)>1:
-        rng=_rng_for_question(shuffle_seed, q)
+        rng=_rng_for_question(shuffle_seed, q, variant)
         idxs=list(range(len(merged)))
         rng.shuffle(idxs)
         merged_shuf=[merged[i] for i in idxs]
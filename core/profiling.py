@@ -0,0 +1,96 @@
+# -*- coding: utf-8 -*-
+"""
+Captura com cProfile de uma ação (tarefa da GUI ou da CLI, preview do editor) para anexar a
+relatos de lentidão sem ninguém precisar rodar Python à mão.
+- `with profile(caminho.pstats) as res:` perfila o bloco; ao sair grava o .pstats e preenche
+  res.summary com as TOP_N funções por tempo cumulativo.
+- Alcance: até o Python 3.11 o cProfile registra só a thread que chamou enable(); a partir do
+  3.12 ele usa sys.monitoring, que vale para o processo inteiro (thread da Tk e outras tarefas
+  que estiverem rodando entram no arquivo) e recusa um segundo perfilador ativo.
+- Por isso há uma captura por vez no processo: se outra já está em andamento (ou outra
+  ferramenta ocupa o sys.monitoring), o bloco roda SEM perfil e res.skipped diz o motivo.
+- `ProfileNext` é o "perfilar a próxima ação" da GUI: armado com um diretório, é consumido (uma
+  única vez) por quem iniciar a próxima tarefa/preview.
+Abrir o arquivo depois: `python -m pstats arquivo.pstats` ou snakeviz/tuna.
+"""
+from __future__ import annotations
+from contextlib import contextmanager
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Iterator, Optional, Union
+import cProfile, io, pstats, re, threading
+
+TOP_N = 25
+_LOCK = threading.Lock()        # uma captura por vez no processo (ver docstring)
+
+
+@dataclass
+class ProfileResult:
+    path: Path
+    summary: str = ""
+    skipped: str = ""           # motivo, quando o bloco rodou sem perfil (nada foi gravado)
+
+
+def profile_path(directory: Union[str, Path], name: str) -> Path:
+    """<diretório>/<nome>_AAAAMMDD-HHMMSS.pstats (nome simplificado para caber em qualquer FS)."""
+    slug = re.sub(r"[^\w]+", "_", name, flags=re.ASCII).strip("_").lower() or "acao"
+    return Path(directory) / f"{slug}_{datetime.now():%Y%m%d-%H%M%S}.pstats"
+
+
+def summarize(stats: Union[str, Path, cProfile.Profile], top: int = TOP_N) -> str:
+    buf = io.StringIO()
+    pstats.Stats(stats if isinstance(stats, cProfile.Profile) else str(stats), stream=buf) \
+        .sort_stats(pstats.SortKey.CUMULATIVE).print_stats(top)
+    return buf.getvalue().strip("\n")
+
+
+@contextmanager
+def profile(path: Union[str, Path], top: int = TOP_N) -> Iterator[ProfileResult]:
+    res = ProfileResult(Path(path))
+    if not _LOCK.acquire(blocking=False):
+        res.skipped = "outra captura de cProfile já está em andamento"
+        yield res
+        return
+    try:
+        prof = cProfile.Profile()
+        try:
+            prof.enable()
+        except ValueError as e:     # 3.12+: depurador/coverage/outro perfilador já ativo
+            res.skipped = f"cProfile indisponível ({e})"
+            yield res
+            return
+        try:
+            yield res
+        finally:
+            prof.disable()
+            res.path.parent.mkdir(parents=True, exist_ok=True)
+            prof.dump_stats(str(res.path))
+            res.summary = summarize(prof, top)
+    finally:
+        _LOCK.release()
+
+
+class ProfileNext:
+    """Interruptor de uso único (thread-safe): arm(dir) -> a próxima take() devolve dir e desarma."""
+
+    def __init__(self):
+        self._dir: Optional[Path] = None
+        self._lock = threading.Lock()
+
+    def arm(self, directory: Union[str, Path]) -> None:
+        with self._lock:
+            self._dir = Path(directory)
+
+    def disarm(self) -> None:
+        with self._lock:
+            self._dir = None
+
+    @property
+    def armed(self) -> bool:
+        return self._dir is not None
+
+    def take(self) -> Optional[Path]:
+        with self._lock:
+            d, self._dir = self._dir, None
+            return d
@@ -0,0 +1,118 @@
+# -*- coding: utf-8 -*-
+"""
+Gerador aleatório baseado em contador (estilo splitmix64).
+A saída n é mix64(chave + n·γ): não há estado a "reproduzir" — qualquer posição do fluxo,
+de qualquer (seed, variante, questão), sai em O(1) e de forma independente (inclusive em
+paralelo). A chave é derivada de (seed, variante, questão, fluxo); a questão entra por
+question_key(): id + enunciado.
+
+CounterRandom herda de random.Random: shuffle/choice/randrange/sample funcionam iguais.
+"""
+from __future__ import annotations
+from functools import lru_cache
+from hashlib import blake2b
+from typing import Any, Mapping, Optional, Tuple
+import os, random
+
+MASK64 = (1 << 64) - 1
+GAMMA = 0x9E3779B97F4A7C15
+_KEY0 = 0x6A09E667F3BCC909
+
+
+def mix64(x: int) -> int:
+    """Finalizador do splitmix64: bijeção em 64 bits com boa difusão."""
+    x = (x + GAMMA) & MASK64
+    x = ((x ^ (x >> 30)) * 0xBF58476D1CE4E5B9) & MASK64
+    x = ((x ^ (x >> 27)) * 0x94D049BB133111EB) & MASK64
+    return x ^ (x >> 31)
+
+
+@lru_cache(maxsize=4096)
+def _text_key(s: str) -> int:
+    return int.from_bytes(blake2b(s.encode("utf-8"), digest_size=8).digest(), "little")
+
+
+def derive_key(*parts: Any) -> int:
+    """Chave de 64 bits estável entre processos/execuções (hash() de str não é)."""
+    k = _KEY0
+    for p in parts:
+        if p is None:
+            v = 0
+        elif isinstance(p, int):
+            v = p & MASK64
+        elif isinstance(p, str):
+            v = _text_key(p)
+        else:
+            v = _text_key(repr(p))
+        k = mix64(k ^ mix64(v))
+    return k
+
+
+class CounterRandom(random.Random):
+    """random.Random cujo fluxo é mix64(chave + n·γ), n = 1, 2, ... (endereçável via jump/counter)."""
+
+    def __init__(self, key: Optional[int] = None, counter: int = 0):
+        super().__init__(key)   # chama self.seed(key)
+        self._ctr = counter
+
+    def seed(self, a: Any = None, version: int = 2) -> None:
+        if a is None:
+            a = int.from_bytes(os.urandom(8), "little")
+        self._key = (a & MASK64) if isinstance(a, int) else derive_key(a)
+        self._ctr = 0
+        self.gauss_next = None
+
+    @property
+    def counter(self) -> int:
+        return self._ctr
+
+    def jump(self, n: int) -> None:
+        """Avança n saídas sem gerá-las."""
+        self._ctr += n
+
+    def _next64(self) -> int:
+        self._ctr += 1
+        return mix64((self._key + self._ctr * GAMMA) & MASK64)
+
+    def random(self) -> float:
+        return (self._next64() >> 11) * (1.0 / (1 << 53))
+
+    def getrandbits(self, k: int) -> int:
+        if k <= 64:
+            if k < 0:
+                raise ValueError("número de bits deve ser >= 0")
+            return self._next64() >> (64 - k) if k else 0
+        out, bits = 0, 0
+        while bits < k:
+            out |= self._next64() << bits
+            bits += 64
+        return out & ((1 << k) - 1)
+
+    def getstate(self) -> Tuple[int, int, Any]:
+        return self._key, self._ctr, self.gauss_next
+
+    def setstate(self, state: Tuple[int, int, Any]) -> None:
+        self._key, self._ctr, self.gauss_next = state
+
+
+def rng_for(seed: Optional[int], variant: int = 0, qid: Any = None, stream: str = "") -> random.Random:
+    """
+    RNG da posição (seed, variante, questão, fluxo). Sem seed: aleatório (como random.Random(None)).
+    `stream` separa usos independentes da mesma questão (ex.: "variaveis" x "alternativas").
+    """
+    if seed is None:
+        return CounterRandom()
+    return CounterRandom(derive_key(seed, variant, qid, stream))
+
+
+def question_key(q: Mapping[str, Any]) -> str:
+    """
+    Identidade da questão nos fluxos: id + enunciado (derive_key faz o hash; custo ~1 µs).
+    Só o id colide: questões sem id (o validador aceita) e o mesmo id em bancos diferentes
+    (json2docx com merge, sem renumerar) teriam o mesmo embaralhamento e os mesmos valores.
+    """
+    return f"{q.get('id')}\x1f{q.get('enunciado', '')}"
+
+
+def rng_for_question(seed: Optional[int], variant: int, q: Mapping[str, Any], stream: str) -> random.Random:
+    return rng_for(seed, variant, question_key(q), stream)
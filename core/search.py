@@ -0,0 +1,152 @@
+# -*- coding: utf-8 -*-
+"""
+Índice invertido em memória para busca textual nas questões.
+- Campos indexados: enunciado, alternativas, afirmacoes e obs.
+- Dobra de acentos/caixa (ex.: "Pressão" casa com "pressao").
+- Consulta: todos os termos precisam casar (AND); cada termo casa por prefixo.
+- Filtros opcionais por tipo/dificuldade.
+- Atualização incremental por chave (add/update/remove); seguro para construir em thread.
+"""
+from __future__ import annotations
+from bisect import bisect_left, insort
+from typing import Any, Dict, FrozenSet, Hashable, Iterable, List, Optional, Set, Tuple
+import re, threading, unicodedata
+
+TOKEN_RE = re.compile(r"\w+", re.UNICODE)
+INDEXED_FIELDS = ("enunciado", "alternativas", "afirmacoes", "obs")
+
+
+def fold(text: str) -> str:
+    """Remove acentos e normaliza caixa: 'Ação' -> 'acao'."""
+    decomposed = unicodedata.normalize("NFKD", text)
+    return "".join(ch for ch in decomposed if not unicodedata.combining(ch)).casefold()
+
+
+def tokenize(text: str) -> List[str]:
+    return TOKEN_RE.findall(fold(text))
+
+
+def _iter_texts(value: Any) -> Iterable[str]:
+    if isinstance(value, str):
+        yield value
+    elif isinstance(value, (list, tuple)):
+        for v in value:
+            yield from _iter_texts(v)
+    elif isinstance(value, dict):
+        for v in value.values():
+            yield from _iter_texts(v)
+
+
+def question_tokens(q: Dict[str, Any]) -> FrozenSet[str]:
+    out: Set[str] = set()
+    for field in INDEXED_FIELDS:
+        for text in _iter_texts(q.get(field)):
+            out.update(tokenize(text))
+    return frozenset(out)
+
+
+def _question_meta(q: Dict[str, Any]) -> Tuple[Optional[int], str]:
+    try:
+        from core.models import Question
+        tipo: Optional[int] = int(Question.infer_tipo(q))
+    except Exception:
+        tipo = None
+    return tipo, str(q.get("dificuldade") or "")
+
+
+class SearchIndex:
+    """
+    Índice invertido: termo -> conjunto de chaves. A chave é escolhida por quem indexa
+    (ex.: id(q) no editor), o que permite reordenar/renumerar questões sem reindexar.
+    """
+
+    def __init__(self):
+        self._lock = threading.RLock()
+        self._postings: Dict[str, Set[Hashable]] = {}
+        self._vocab: List[str] = []          # termos ordenados (busca por prefixo via bisect)
+        self._doc_tokens: Dict[Hashable, FrozenSet[str]] = {}
+        self._meta: Dict[Hashable, Tuple[Optional[int], str]] = {}
+
+    def __len__(self) -> int:
+        return len(self._doc_tokens)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._doc_tokens
+
+    # ----------------- atualização -----------------
+    def build(self, items: Iterable[Tuple[Hashable, Dict[str, Any]]]) -> None:
+        for key, q in items:
+            self.update(key, q)
+
+    def update(self, key: Hashable, q: Dict[str, Any]) -> None:
+        """Indexa (ou reindexa) uma questão; só os termos que mudaram são tocados."""
+        tokens = question_tokens(q)
+        meta = _question_meta(q)
+        with self._lock:
+            old = self._doc_tokens.get(key, frozenset())
+            for tok in old - tokens:
+                self._discard(tok, key)
+            for tok in tokens - old:
+                bucket = self._postings.get(tok)
+                if bucket is None:
+                    bucket = self._postings[tok] = set()
+                    insort(self._vocab, tok)
+                bucket.add(key)
+            self._doc_tokens[key] = tokens
+            self._meta[key] = meta
+
+    add = update
+
+    def remove(self, key: Hashable) -> None:
+        with self._lock:
+            for tok in self._doc_tokens.pop(key, frozenset()):
+                self._discard(tok, key)
+            self._meta.pop(key, None)
+
+    def _discard(self, tok: str, key: Hashable) -> None:
+        bucket = self._postings.get(tok)
+        if bucket is None:
+            return
+        bucket.discard(key)
+        if not bucket:
+            del self._postings[tok]
+            i = bisect_left(self._vocab, tok)
+            if i < len(self._vocab) and self._vocab[i] == tok:
+                del self._vocab[i]
+
+    # ----------------- consulta -----------------
+    def _prefix_keys(self, prefix: str) -> Set[Hashable]:
+        out: Set[Hashable] = set()
+        vocab = self._vocab
+        i = bisect_left(vocab, prefix)
+        while i < len(vocab) and vocab[i].startswith(prefix):
+            out |= self._postings[vocab[i]]
+            i += 1
+        return out
+
+    def search(
+        self,
+        query: str,
+        *,
+        tipo: Optional[int] = None,
+        dificuldade: Optional[str] = None,
+    ) -> Set[Hashable]:
+        """Retorna as chaves cujas questões contêm todos os termos (por prefixo)."""
+        terms = sorted(set(tokenize(query or "")), key=len, reverse=True)
+        with self._lock:
+            if terms:
+                result: Optional[Set[Hashable]] = None
+                for term in terms:   # termos longos primeiro: conjuntos menores
+                    keys = self._prefix_keys(term)
+                    result = keys if result is None else (result & keys)
+                    if not result:
+                        return set()
+            else:
+                result = set(self._doc_tokens)
+            if tipo is None and not dificuldade:
+                return result
+            meta = self._meta
+            return {
+                k for k in result
+                if (tipo is None or meta[k][0] == tipo) and (not dificuldade or meta[k][1] == dificuldade)
+            }
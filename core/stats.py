@@ -0,0 +1,129 @@
+# -*- coding: utf-8 -*-
+"""
+Tempo por etapa e contadores de uma geração (carga, resolução, LaTeX, docx, pdflatex, ...).
+- `with collect() as rep:` liga a coleta para tudo o que roda dentro do bloco, no mesmo contexto
+  (ContextVar: cada thread de tarefa da GUI e cada processo da CLI tem o seu relatório).
+- Desligado (nenhum collect() ativo), `stage()` devolve um contexto nulo compartilhado e `count()`
+  é só uma leitura de ContextVar: os geradores podem ficar instrumentados o tempo todo.
+- Etapas aninhadas viram "pai/filho"; a mesma etapa repetida (ex.: por questão) acumula o tempo.
+- Em funções longas e lineares (json2beamer, json2docx), `seq = sequence()` marca as fronteiras
+  sem reindentar o código: seq.next("carga") ... seq.next("latex") ... seq.end().
+- Contadores usados pelos geradores: questoes, imagens (verificadas no disco), expressoes
+  (avaliadas na resolução), bytes (escritos na saída).
+"""
+from __future__ import annotations
+from contextlib import contextmanager, nullcontext
+from contextvars import ContextVar
+from typing import Any, ContextManager, Dict, Iterator, List, Optional
+import time
+
+_ACTIVE: ContextVar[Optional["StageReport"]] = ContextVar("stage_report", default=None)
+_NULL = nullcontext()
+
+
+class StageReport:
+    """Tempos (s) por etapa, nº de vezes que cada etapa rodou e contadores, na ordem em que apareceram."""
+    __slots__ = ("stages", "calls", "counters", "_stack")
+
+    def __init__(self):
+        self.stages: Dict[str, float] = {}
+        self.calls: Dict[str, int] = {}
+        self.counters: Dict[str, int] = {}
+        self._stack: List[str] = []
+
+    @contextmanager
+    def stage(self, name: str) -> Iterator[None]:
+        path = f"{self._stack[-1]}/{name}" if self._stack else name
+        self._stack.append(path)
+        self.stages.setdefault(path, 0.0)     # pai antes dos filhos no relatório
+        t0 = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.stages[path] += time.perf_counter() - t0
+            self.calls[path] = self.calls.get(path, 0) + 1
+            self._stack.pop()
+
+    def count(self, name: str, n: int = 1) -> None:
+        self.counters[name] = self.counters.get(name, 0) + n
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "stages": {k: {"seconds": round(v, 6), "calls": self.calls[k]} for k, v in self.stages.items()},
+            "counters": dict(self.counters),
+        }
+
+    def format(self) -> str:
+        """Texto para o log: uma linha por etapa (recuada pelo aninhamento) e uma com os contadores."""
+        lines = ["Etapas:"]
+        for path, secs in self.stages.items():
+            depth = path.count("/")
+            name = path.rsplit("/", 1)[-1]
+            calls = self.calls[path]
+            lines.append(f"  {'  ' * depth}{name:<{24 - 2 * depth}} {secs * 1000:9.1f} ms" + (f"  ({calls}x)" if calls > 1 else ""))
+        if self.counters:
+            lines.append("Contadores: " + ", ".join(f"{k}={v}" for k, v in self.counters.items()))
+        return "\n".join(lines)
+
+
+class _Sequence:
+    """Etapas consecutivas: next() fecha a etapa aberta e abre a seguinte; end() fecha a última."""
+    __slots__ = ("rep", "_open")
+
+    def __init__(self, rep: StageReport):
+        self.rep = rep
+        self._open: Optional[ContextManager[None]] = None
+
+    def next(self, name: str) -> None:
+        self.end()
+        self._open = self.rep.stage(name)
+        self._open.__enter__()
+
+    def end(self) -> None:
+        if self._open is not None:
+            cm, self._open = self._open, None
+            cm.__exit__(None, None, None)
+
+
+class _NullSequence:
+    __slots__ = ()
+
+    def next(self, name: str) -> None:
+        pass
+
+    def end(self) -> None:
+        pass
+
+
+_NULL_SEQUENCE = _NullSequence()
+
+
+@contextmanager
+def collect(report: Optional[StageReport] = None) -> Iterator[StageReport]:
+    """Ativa a coleta no contexto atual (aninhável: o bloco interno usa o próprio relatório)."""
+    rep = report if report is not None else StageReport()
+    token = _ACTIVE.set(rep)
+    try:
+        yield rep
+    finally:
+        _ACTIVE.reset(token)
+
+
+def active() -> Optional[StageReport]:
+    return _ACTIVE.get()
+
+
+def stage(name: str) -> ContextManager[None]:
+    rep = _ACTIVE.get()
+    return _NULL if rep is None else rep.stage(name)
+
+
+def sequence() -> Any:
+    rep = _ACTIVE.get()
+    return _NULL_SEQUENCE if rep is None else _Sequence(rep)
+
+
+def count(name: str, n: int = 1) -> None:
+    rep = _ACTIVE.get()
+    if rep is not None:
+        rep.count(name, n)
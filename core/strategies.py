@@ -1,21 +1,13 @@
 
 # -*- coding: utf-8 -*-
 from __future__ import annotations
+from dataclasses import replace
 from typing import Dict, Any, List, Tuple
-from dataclasses import dataclass
+from .models import EMPTY_MAP, Question, QuestionType, RenderedQuestion
+from .prepare import _dedup_preserving_first
 
 ROMAN = ["I","II","III","IV","V","VI","VII","VIII","IX","X"]
 
-@dataclass
-class RenderedQuestion:
-    id: int
-    tipo: int
-    enunciado: str
-    imagens: List[str]
-    alternativas: List[str]
-    correta: str
-    extra: Dict[str, Any]
-
 def render_type4(q: Dict[str, Any]) -> Dict[str, Any]:
     afirm = q.get("afirmacoes") or {}
     # mantém a ordem natural I, II, III...
@@ -26,3 +18,59 @@ def render_type4(q: Dict[str, Any]) -> Dict[str, Any]:
     q["extra"]["afirmacoes_labeled"] = labeled
     q["extra"]["afirmacoes_line"] = line
     return q
+
+# ---------- handlers por tipo (usados por core.pipeline) ----------
+
+def _with_correct(alts: List[str], correta: str) -> Tuple[str, ...]:
+    """Alternativas na ordem original, com a correta incluída (se faltar) e sem duplicatas."""
+    merged = list(alts)
+    if correta:
+        merged.append(correta)
+    return tuple(_dedup_preserving_first(merged))
+
+class _BaseHandler:
+    def render(self, q: Question, ctx: Dict[str, Any]) -> RenderedQuestion:
+        return RenderedQuestion(
+            id=q.id,
+            tipo=q.tipo,
+            enunciado=q.enunciado,
+            imagens=q.imagens,
+            alternativas=_with_correct(list(q.alternativas), q.correta),
+            correta=q.correta,
+        )
+
+class _Type3Handler(_BaseHandler):
+    """
+    Resolve variáveis/resoluções e as substituições <...> (mesma seed do restante da geração).
+    Resolve sobre ctx["source"] (dict cru normalizado, resolvido in-place como no load_quiz): o
+    to_dict() da Question apara o enunciado (outra chave de RNG) e não tem "distratores".
+    """
+    def render(self, q: Question, ctx: Dict[str, Any]) -> RenderedQuestion:
+        from .variables import resolve_all
+        src = ctx.get("source") or q.to_dict()
+        q_res, env = resolve_all(src, seed=ctx.get("seed"), variant=ctx.get("variant", 0))
+        # in-place: a pipeline embaralha as alternativas com a chave da questão já resolvida
+        src.clear()
+        src.update(q_res)
+        correta = str(q_res.get("correta") or "")
+        return RenderedQuestion(
+            id=q.id,
+            tipo=q.tipo,
+            enunciado=str(q_res.get("enunciado") or "").strip(),
+            imagens=q.imagens,
+            alternativas=_with_correct(list(q_res.get("alternativas") or []), correta),
+            correta=correta,
+            extra={"env": env} if env else EMPTY_MAP,
+        )
+
+class _Type4Handler(_BaseHandler):
+    def render(self, q: Question, ctx: Dict[str, Any]) -> RenderedQuestion:
+        extra = render_type4({"afirmacoes": dict(q.afirmacoes)})["extra"]
+        return replace(super().render(q, ctx), extra=extra)
+
+HANDLERS: Dict[QuestionType, _BaseHandler] = {
+    QuestionType.TYPE1: _BaseHandler(),
+    QuestionType.TYPE2: _BaseHandler(),
+    QuestionType.TYPE3: _Type3Handler(),
+    QuestionType.TYPE4: _Type4Handler(),
+}
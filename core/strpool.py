@@ -0,0 +1,65 @@
+# -*- coding: utf-8 -*-
+"""
+Pool de strings por banco (interning).
+Bancos repetem as mesmas alternativas ("Apenas I e II", "Todas estão corretas"), dificuldades e
+caminhos de imagem milhares de vezes; depois do json.loads cada ocorrência é um str separado.
+O pool guarda uma única instância de cada texto e a sua chave "stripped" (calculada uma vez),
+usada pela deduplicação de alternativas.
+Diferente de sys.intern, o pool pertence ao banco e é liberado junto com ele.
+"""
+from __future__ import annotations
+from typing import Any, Dict, List
+
+# campos de texto curto e repetitivo (strings ou listas de strings)
+POOLED_FIELDS = ("dificuldade", "correta", "alternativas", "imagens", "obs")
+
+
+class StringPool:
+    __slots__ = ("_strings", "_keys", "hits")
+
+    def __init__(self):
+        self._strings: Dict[str, str] = {}
+        self._keys: Dict[str, str] = {}
+        self.hits = 0
+
+    def __len__(self) -> int:
+        return len(self._strings)
+
+    def intern(self, s: Any) -> Any:
+        """Instância canônica de `s` (não-strings passam direto)."""
+        if not isinstance(s, str):
+            return s
+        canon = self._strings.get(s)
+        if canon is None:
+            self._strings[s] = s
+            return s
+        self.hits += 1
+        return canon
+
+    def key(self, s: Any) -> Any:
+        """Chave de deduplicação (s.strip()), calculada uma vez por texto distinto."""
+        if not isinstance(s, str):
+            return s
+        k = self._keys.get(s)
+        if k is None:
+            k = self.intern(s.strip())
+            self._keys[self.intern(s)] = k
+        return k
+
+    def intern_question(self, q: Dict[str, Any]) -> None:
+        """Troca, in-place, os textos repetitivos da questão pelas instâncias do pool."""
+        for field in POOLED_FIELDS:
+            v = q.get(field)
+            if isinstance(v, str):
+                q[field] = self.intern(v)
+            elif isinstance(v, list):
+                q[field] = [self.intern(x) for x in v]
+        afirm = q.get("afirmacoes")
+        if isinstance(afirm, dict):
+            q["afirmacoes"] = {self.intern(k): self.intern(v) for k, v in afirm.items()}
+
+    def intern_all(self, questions: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        for q in questions:
+            if isinstance(q, dict):
+                self.intern_question(q)
+        return questions
@@ -1,10 +1,20 @@
 from abc import ABC, abstractmethod
-from typing import Dict, Any
+from typing import Dict, Any, Sequence
 from core.models import QuestionIR, QuestionKind
 
+
+def answer_index(options: Sequence[Any]) -> Dict[str, int]:
+    """Texto da opção (stripped) -> índice da primeira ocorrência; montado uma vez por questão."""
+    index: Dict[str, int] = {}
+    for i, opt in enumerate(options):
+        index.setdefault(str(opt).strip(), i)
+    return index
+
+
 class QuestionTypeBuilder(ABC):
     kind: QuestionKind
 
     @abstractmethod
     def build_ir(self, raw: Dict[str, Any], new_id: int) -> QuestionIR:
         """Converte o dict da questão daquele tipo em QuestionIR."""
+
@@ -1,7 +1,7 @@
 # core/types/type1.py
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional
 from ..models import QuestionIR, QuestionKind, Choice
-from .base import QuestionTypeBuilder
+from .base import QuestionTypeBuilder, answer_index
 
 class Type1Builder(QuestionTypeBuilder):
     """
@@ -44,28 +44,30 @@ class Type1Builder(QuestionTypeBuilder):
             correta_txt = raw.get("correta")
 
             correct_idx: List[int] = []
+            index = answer_index(options) if options else {}
 
             # 1) múltiplas pelo campo "answers"
             if isinstance(answers, list) and options:
                 for a in answers:
-                    idx = self._norm_index_or_text(a, options)
+                    idx = self._norm_index_or_text(a, options, index)
                     if idx >= 0:
                         correct_idx.append(idx)
 
             # 2) única pelo campo "answer"
             elif answer is not None and options:
-                idx = self._norm_index_or_text(answer, options)
+                idx = self._norm_index_or_text(answer, options, index)
                 if idx >= 0:
                     correct_idx.append(idx)
 
             # 3) antiga: "correta" (texto da alternativa ou letra/índice)
             if not correct_idx and correta_txt and options:
-                idx = self._norm_index_or_text(correta_txt, options)
+                idx = self._norm_index_or_text(correta_txt, options, index)
                 if idx >= 0:
                     correct_idx.append(idx)
 
+            correct_set = set(correct_idx)
             for i, txt in enumerate(options):
-                choices.append(Choice(text=str(txt), is_correct=(i in set(correct_idx))))
+                choices.append(Choice(text=str(txt), is_correct=(i in correct_set)))
 
             if sol is None and correct_idx:
                 # monta solução por letra (a,b,c,...) ou texto
@@ -81,16 +83,16 @@ class Type1Builder(QuestionTypeBuilder):
             metadata={ **(raw.get("meta") or {}), "obs": raw.get("obs", []) }
         )
 
-    def _norm_index_or_text(self, x, options: List[str]) -> int:
-        """Aceita 0/1-based, letras (a,b,...) OU texto igual a uma opção."""
+    def _norm_index_or_text(self, x, options: List[str], index: Optional[Dict[str, int]] = None) -> int:
+        """Aceita 0/1-based, letras (a,b,...) OU texto igual a uma opção (`index` = answer_index(options))."""
         n = len(options)
         # texto igual?
         if isinstance(x, str):
             s = x.strip()
-            # match por texto exato
-            for i, opt in enumerate(options):
-                if s == str(opt).strip():
-                    return i
+            # match por texto exato (mapa pré-calculado em vez de varrer as opções)
+            i = (index if index is not None else answer_index(options)).get(s)
+            if i is not None:
+                return i
             # letra (a,b,...)
             ch = s.lower()
             if ch.isalpha() and len(ch) == 1:
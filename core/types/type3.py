@@ -13,9 +13,11 @@ class Type3Builder(QuestionTypeBuilder):
         # alternativas + correta vindas do JSON (independente da matemática)
         alts = list(raw.get("alternativas") or raw.get("options") or [])
         correta_txt = (raw.get("correta") or raw.get("answer") or "").strip()
-        if correta_txt and (correta_txt not in [str(a).strip() for a in alts]):
+        keys = [str(a).strip() for a in alts]   # calculado uma vez por questão
+        if correta_txt and correta_txt not in keys:
             alts.append(correta_txt)
-        choices = [Choice(text=str(t), is_correct=(str(t).strip() == correta_txt)) for t in alts]
+            keys.append(correta_txt)
+        choices = [Choice(text=str(t), is_correct=(k == correta_txt)) for t, k in zip(alts, keys)]
 
         # imagens / obs
         imagens = raw.get("imagens") or raw.get("imagem")
@@ -29,10 +29,12 @@ class Type4Builder(QuestionTypeBuilder):
         correta_txt = (raw.get("correta") or raw.get("answer") or "").strip()
 
         # garante que a correta esteja na lista (se for texto que não esteja lá)
-        if correta_txt and (correta_txt not in [str(a).strip() for a in alts]):
+        keys = [str(a).strip() for a in alts]   # calculado uma vez por questão
+        if correta_txt and correta_txt not in keys:
             alts.append(correta_txt)
+            keys.append(correta_txt)
 
-        choices = [Choice(text=str(t), is_correct=(str(t).strip() == correta_txt)) for t in alts]
+        choices = [Choice(text=str(t), is_correct=(k == correta_txt)) for t, k in zip(alts, keys)]
 
         # --- imagens / obs ---
         imagens = raw.get("imagens") or raw.get("imagem")
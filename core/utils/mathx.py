@@ -16,3 +16,150 @@ def round_sig(x: float, sig: int = 3) -> float:
     if x == 0:
         return 0.0
     return round(x, sig - int(floor(log10(abs(x)))) - 1)
+
+# ---------- distratores numéricos (tipo 3) ----------
+# Candidatos = transformações do valor correto (erros comuns, sinal, unidade, arredondamento).
+# Com NumPy, tudo é calculado de uma vez para as N variantes (matriz N × candidatos), sem laço
+# Python por variante; sem NumPy, o mesmo algoritmo roda linha a linha, com o mesmo arredondamento
+# (_round_disp/_rint reproduzem o np.round).
+# A ordem de preferência entre os candidatos é sorteada pelo RNG por contador (core.rng), com uma
+# chave por linha: a variante v recebe os mesmos distratores gerada sozinha ou num lote.
+
+try:
+    import numpy as np
+    _HAS_NUMPY = True
+except ImportError:  # NumPy está no requirements.txt; sem ele, o caminho puro-Python dá o mesmo resultado
+    np = None
+    _HAS_NUMPY = False
+
+from math import floor, log10
+
+from ..rng import GAMMA, MASK64, CounterRandom
+
+DISPLAY_DECIMALS = 2   # mesma precisão de exibição de core.variables._fmt
+
+
+def _rint(y: float) -> float:
+    """np.rint para um float: inteiro mais próximo, empate para o par (inf/nan passam direto)."""
+    return float(round(y)) if y - y == 0 else y
+
+
+def _round_disp(x: float) -> float:
+    """np.round(x, DISPLAY_DECIMALS) para um float: x * 10**d, rint, / 10**d — não o round(x, d)
+    do Python, que arredonda o decimal exato e difere nos empates (ex.: 303.195 * 100)."""
+    scale = 10.0 ** DISPLAY_DECIMALS
+    return _rint(x * scale) / scale
+
+
+def _round_sig_any(x, sig: int):
+    if _HAS_NUMPY and isinstance(x, np.ndarray):
+        with np.errstate(divide="ignore", invalid="ignore"):
+            mag = np.floor(np.log10(np.abs(x)))
+            scale = 10.0 ** (sig - 1 - np.where(np.isfinite(mag), mag, 0))
+            return np.round(x * scale) / scale
+    # mesma conta do ramo NumPy, para os dois caminhos darem os mesmos distratores
+    mag = floor(log10(abs(x))) if x and x - x == 0 else 0
+    scale = 10.0 ** (sig - 1 - mag)
+    return _rint(x * scale) / scale
+
+
+DISTRACTOR_STRATEGIES = {
+    "erro_comum": (lambda x: x + 1, lambda x: x - 1, lambda x: x * 2, lambda x: x / 2),
+    "sinal": (lambda x: -x,),
+    "unidade": (lambda x: x * 10, lambda x: x / 10, lambda x: x * 100, lambda x: x / 100,
+                lambda x: x * 1000, lambda x: x / 1000),
+    "arredondamento": (lambda x: _round_sig_any(x * 1.1, 2), lambda x: _round_sig_any(x * 0.9, 2),
+                       lambda x: _round_sig_any(x * 1.25, 2), lambda x: _round_sig_any(x * 0.75, 2)),
+}
+
+
+def _transforms(strategies):
+    names = DISTRACTOR_STRATEGIES if strategies is None else strategies
+    try:
+        return [f for name in names for f in DISTRACTOR_STRATEGIES[name]]
+    except KeyError as e:
+        raise ValueError(f"Estratégia de distrator desconhecida: {e.args[0]}") from None
+
+
+def _mix64_np(x):
+    x = x + np.uint64(GAMMA)
+    x = (x ^ (x >> np.uint64(30))) * np.uint64(0xBF58476D1CE4E5B9)
+    x = (x ^ (x >> np.uint64(27))) * np.uint64(0x94D049BB133111EB)
+    return x ^ (x >> np.uint64(31))
+
+
+def _distractors_np(correct, k, transforms, keys):
+    x = np.asarray(correct, dtype=np.float64)
+    n = x.shape[0]
+    r = np.round(x, DISPLAY_DECIMALS)
+    offsets = np.array([s * j for j in range(1, k + 1) for s in (1, -1)], dtype=np.float64)
+    with np.errstate(all="ignore"):
+        cand = np.column_stack([np.broadcast_to(f(x), (n,)) for f in transforms] + [r[:, None] + offsets])
+        cand = np.round(cand, DISPLAY_DECIMALS)
+    m_main = len(transforms)
+    m = cand.shape[1]
+
+    # prioridade = camada (0: estratégias, 1: reserva r±j) + sorteio em [0, 1) por linha/coluna
+    ctr = np.arange(1, m + 1, dtype=np.uint64)
+    key = np.array([kk & MASK64 for kk in keys], dtype=np.uint64)
+    with np.errstate(over="ignore"):
+        bits = _mix64_np(key[:, None] + ctr[None, :] * np.uint64(GAMMA))
+    prio = (bits >> np.uint64(11)).astype(np.float64) * (1.0 / (1 << 53))
+    prio[:, m_main:] += 1.0
+    prio[~np.isfinite(cand) | (cand == r[:, None])] = np.inf
+
+    # valores repetidos na linha: fica só o de menor prioridade
+    order = np.lexsort((prio, cand), axis=-1)
+    sorted_c = np.take_along_axis(cand, order, axis=1)
+    sorted_p = np.take_along_axis(prio, order, axis=1)
+    dup = np.zeros_like(sorted_c, dtype=bool)
+    dup[:, 1:] = sorted_c[:, 1:] == sorted_c[:, :-1]
+    np.put_along_axis(prio, order, np.where(dup, np.inf, sorted_p), axis=1)
+
+    pick = np.argsort(prio, axis=1, kind="stable")[:, :k]
+    return np.take_along_axis(cand, pick, axis=1).tolist()
+
+
+def _distractors_py(correct, k, transforms, keys):
+    out = []
+    offsets = [s * j for j in range(1, k + 1) for s in (1, -1)]
+    for x, key in zip(correct, keys):
+        x = float(x)
+        r = _round_disp(x)
+        cand = []
+        for f in transforms:
+            try:
+                cand.append(_round_disp(f(x)))
+            except (ArithmeticError, ValueError):
+                cand.append(float("nan"))
+        cand.extend(_round_disp(r + o) for o in offsets)
+        rnd = CounterRandom(key)
+        best = {}
+        for j, c in enumerate(cand):
+            p = rnd.random() + (1.0 if j >= len(transforms) else 0.0)
+            if c != c or c in (float("inf"), float("-inf")) or c == r:
+                continue
+            if c not in best or p < best[c]:
+                best[c] = p
+        out.append(sorted(best, key=best.get)[:k])
+    return out
+
+
+def distractors(correct, k: int = 4, *, strategies=None, keys=None):
+    """
+    K respostas erradas distintas (na precisão de exibição) para cada valor correto.
+    - `correct`: sequência com o valor correto de cada variante (N valores)
+    - `strategies`: nomes de DISTRACTOR_STRATEGIES (padrão: todas)
+    - `keys`: chave de 64 bits por linha (ex.: core.rng.derive_key(seed, variante, id)); padrão 0..N-1
+    Retorna N listas de k floats. Se as estratégias não rendem k valores válidos, completa com
+    correto ± 1, ± 2, ... (sempre distintos), então a garantia de k distratores vale sempre.
+    """
+    if k < 1 or not len(correct):
+        return [[] for _ in correct]
+    transforms = _transforms(strategies)
+    keys = list(range(len(correct))) if keys is None else list(keys)
+    if len(keys) != len(correct):
+        raise ValueError("keys deve ter um item por valor correto")
+    if _HAS_NUMPY:
+        return _distractors_np(correct, k, transforms, keys)
+    return _distractors_py(correct, k, transforms, keys)
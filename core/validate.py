@@ -0,0 +1,364 @@
+# -*- coding: utf-8 -*-
+"""
+Validação de bancos de questões com relatório completo (arquivo / id / campo).
+- As verificações são montadas uma vez por tipo (CHECKS[tipo] = tupla de funções); validar uma
+  questão é só percorrer a tupla do tipo dela.
+- Expressões <...> são analisadas uma vez por texto distinto (cache), então revalidar a cada
+  tecla (com debounce) custa pouco.
+- Nada levanta exceção: tudo vira Issue. Severidade "erro" impede a geração; "aviso" não.
+- ValidationCache guarda o resultado por arquivo com a marca (mtime, tamanho) do JSON: validar de
+  novo um banco que não mudou é só um os.stat. (Avisos de imagem ausente só são refeitos quando o
+  JSON muda.)
+"""
+from __future__ import annotations
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Callable, Dict, FrozenSet, Iterable, Iterator, List, Optional, Tuple, Union
+import ast, re, threading
+
+from .cache import file_stamp
+from .fingerprint import fingerprint
+from .models import Question
+from .prepare import _extract_k_from_key
+from .variables import ANGLE_RE, compile_resolucoes
+
+ERROR = "erro"
+WARNING = "aviso"
+SUMMARY_WARNINGS = 10       # avisos listados por summarize_issues (os demais só entram na contagem)
+
+IMG_EXTS = ('.png', '.jpg', '.jpeg', '.gif', '.bmp', '.svg', '.pdf')
+SIZE_RE = re.compile(r'^\s*(\d+(?:\.\d+)?)x(\d+(?:\.\d+)?)\s*$')
+
+
+@dataclass(frozen=True, slots=True)
+class Issue:
+    file: str
+    qid: Any
+    field: str
+    message: str
+    severity: str = ERROR
+
+    def __str__(self) -> str:
+        where = Path(self.file).name if self.file else "—"
+        qid = f" #{self.qid}" if self.qid not in (None, "") else ""
+        return f"[{self.severity}] {where}{qid} [{self.field}]: {self.message}"
+
+
+Found = Tuple[str, str, str]            # (campo, mensagem, severidade)
+Check = Callable[[Dict[str, Any], Optional[Path]], Iterable[Found]]
+
+
+# ----------------- análise de expressões (com cache) -----------------
+@lru_cache(maxsize=8192)
+def expr_names(expr: str) -> Union[FrozenSet[str], str]:
+    """Nomes usados pela expressão; ou a mensagem de erro de sintaxe (str)."""
+    try:
+        node = ast.parse(expr.strip(), mode="eval")
+    except SyntaxError as e:
+        return f"expressão inválida '{expr.strip()}': {e.msg}"
+    return frozenset(n.id for n in ast.walk(node) if isinstance(n, ast.Name))
+
+
+@lru_cache(maxsize=8192)
+def placeholders(text: str) -> Tuple[str, ...]:
+    return tuple((m.group(1) or "").strip() for m in ANGLE_RE.finditer(text))
+
+
+def _texts(v: Any) -> Iterator[str]:
+    if isinstance(v, str):
+        yield v
+    elif isinstance(v, list):
+        for x in v:
+            if isinstance(x, str):
+                yield x
+    elif isinstance(v, dict):
+        for x in v.values():
+            if isinstance(x, str):
+                yield x
+
+
+def _image_specs(v: Any) -> List[str]:
+    if isinstance(v, str):
+        return [v] if v.strip() else []
+    return [x for x in (v or []) if isinstance(x, str) and x.strip()]
+
+
+def _is_image(spec: str) -> bool:
+    return spec.split(";", 1)[0].strip().lower().endswith(IMG_EXTS)
+
+
+def _check_image(spec: str, field: str, base_dir: Optional[Path]) -> Iterator[Found]:
+    path, _, size = spec.partition(";")
+    if size and not SIZE_RE.match(size):
+        yield field, f"tamanho inválido '{size.strip()}' em '{spec}' (use LxA em mm, ex.: 60x40)", ERROR
+    if base_dir is not None:
+        p = Path(path.strip())
+        if not (p if p.is_absolute() else base_dir / p).exists():
+            yield field, f"imagem não encontrada: {path.strip()}", WARNING
+
+
+# ----------------- verificações -----------------
+def _check_enunciado(q, base_dir):
+    if not str(q.get("enunciado") or "").strip():
+        yield "enunciado", "enunciado vazio", ERROR
+
+
+def _alternativas(q):
+    """q["alternativas"] ou, na falta dela, a lista da chave "alternativas;K" (como no loader)."""
+    if "alternativas" in q:
+        return q["alternativas"]
+    for k, v in q.items():
+        if _extract_k_from_key(k) is not None and isinstance(v, list):
+            return v
+    return None
+
+
+def _check_alternativas(q, base_dir):
+    alts = _alternativas(q)
+    if not isinstance(alts, list):
+        yield "alternativas", "alternativas deve ser uma lista", ERROR
+    elif not [a for a in alts if str(a).strip()]:
+        yield "alternativas", "nenhuma alternativa (só a correta seria exibida)", WARNING
+
+
+def _check_correta(q, base_dir):
+    if not str(q.get("correta") or "").strip():
+        yield "correta", "correta ausente", ERROR
+
+
+def _check_images(q, base_dir):
+    for field in ("imagens", "imagem"):
+        for spec in _image_specs(q.get(field)):
+            yield from _check_image(spec, field, base_dir)
+
+
+def _check_image_alternatives(q, base_dir):
+    for spec in _image_specs(_alternativas(q)) + _image_specs(q.get("correta")):
+        if _is_image(spec):
+            yield from _check_image(spec, "alternativas", base_dir)
+
+
+def _check_afirmacoes(q, base_dir):
+    aff = q.get("afirmacoes")
+    if not isinstance(aff, dict) or not aff:
+        yield "afirmacoes", "tipo 4 requer afirmacoes (ex.: {\"I\": \"...\"})", ERROR
+
+
+def _check_variaveis(q, base_dir):
+    vs = q.get("variaveis")
+    if not isinstance(vs, dict) or not vs:
+        yield "variaveis", "tipo 3 requer variaveis", ERROR
+        return
+    for name, spec in vs.items():
+        try:
+            mn, mx, st = float(spec["min"]), float(spec["max"]), float(spec["step"])
+        except Exception:
+            yield "variaveis", f"{name}: use {{min, max, step}} numéricos", ERROR
+            continue
+        if st <= 0 or mn > mx:
+            yield "variaveis", f"{name}: faixa inválida (min={mn:g}, max={mx:g}, step={st:g})", ERROR
+    if not isinstance(q.get("resolucoes"), dict) or not q.get("resolucoes"):
+        yield "resolucoes", "tipo 3 requer resolucoes", ERROR
+
+
+def _check_placeholders(q, base_dir):
+    """<VAR>/<expr> só podem usar variáveis e resoluções conhecidas; resoluções sem ciclos."""
+    vs = q.get("variaveis") or {}
+    res = q.get("resolucoes") or {}
+    known = set(vs) | set(res)
+    try:
+        compile_resolucoes(tuple(vs), tuple((str(k), str(v)) for k, v in res.items()))
+    except ValueError as e:
+        yield "resolucoes", str(e), ERROR
+    for field in ("enunciado", "alternativas", "correta", "obs", "afirmacoes"):
+        for text in _texts(q.get(field)):
+            for inner in placeholders(text):
+                if not inner:
+                    continue
+                names = expr_names(inner)
+                if isinstance(names, str):
+                    yield field, names, ERROR
+                else:
+                    for n in sorted(names - known):
+                        yield field, f"<{inner}>: variável desconhecida '{n}'", ERROR
+
+
+def _check_distratores(q, base_dir):
+    """"distratores": k >= 1, estratégias conhecidas e correta numérica ('<R>' ou número)."""
+    from .utils.mathx import DISTRACTOR_STRATEGIES
+    from .variables import _SINGLE_ANGLE_RE, distractor_spec
+    if q.get("distratores") is None:
+        return
+    try:
+        k, strategies = distractor_spec(q)
+    except (TypeError, ValueError):
+        yield "distratores", "use um inteiro ou {\"k\": 4, \"estrategias\": [...]}", ERROR
+        return
+    if k < 1:
+        yield "distratores", "k deve ser >= 1", ERROR
+    for name in strategies or ():
+        if name not in DISTRACTOR_STRATEGIES:
+            yield "distratores", f"estratégia desconhecida '{name}' (use {', '.join(DISTRACTOR_STRATEGIES)})", ERROR
+    cor = str(q.get("correta") or "")
+    if not _SINGLE_ANGLE_RE.match(cor):
+        try:
+            float(cor.replace(",", "."))
+        except ValueError:
+            yield "correta", "com distratores gerados a correta deve ser '<RES>' ou um número", ERROR
+
+
+_RESOLVED_MAX = 4096
+_resolved_cache: Dict[str, Tuple[Found, ...]] = {}
+
+
+def _check_resolved(q, base_dir):
+    """Resolver é a verificação cara: o resultado fica em cache pela impressão digital da questão."""
+    key = fingerprint(q)
+    hit = _resolved_cache.get(key)
+    if hit is None:
+        hit = tuple(_resolved_issues(q))
+        if len(_resolved_cache) >= _RESOLVED_MAX:
+            _resolved_cache.clear()
+        _resolved_cache[key] = hit
+    return hit
+
+
+def _resolved_issues(q):
+    """Como o load_quiz faria (seed fixa): a correta precisa sobrar, distinta, entre as alternativas."""
+    from .prepare import prepare_alternativas_inplace
+    from .variables import resolve_all
+    try:
+        if q.get("variaveis") or q.get("resolucoes"):
+            c = resolve_all(q, seed=0)[0]
+        else:
+            c = {"alternativas": list(_alternativas(q) or []), "correta": q.get("correta")}
+        prepare_alternativas_inplace(c, merge_correct=True, dedup=False)
+    except Exception as e:
+        yield "resolucoes", f"erro ao resolver: {type(e).__name__}: {e}", ERROR
+        return
+    alts = [str(a).strip() for a in c.get("alternativas") or []]
+    cor = str(c.get("correta") or "").strip()
+    if cor and alts.count(cor) > 1:
+        yield "correta", f"após a resolução a correta ('{cor}') coincide com outra alternativa", WARNING
+
+
+_COMMON: Tuple[Check, ...] = (_check_enunciado, _check_alternativas, _check_correta, _check_images)
+
+# compilado uma vez: tipo -> verificações
+CHECKS: Dict[int, Tuple[Check, ...]] = {
+    1: _COMMON + (_check_resolved,),
+    2: _COMMON + (_check_image_alternatives, _check_resolved),
+    4: _COMMON + (_check_afirmacoes, _check_resolved),
+}
+_STATIC_T3: Tuple[Check, ...] = _COMMON + (_check_variaveis, _check_placeholders, _check_distratores)
+
+
+def validate_question(q: Dict[str, Any], *, file: str = "", base_dir: Union[str, Path, None] = None) -> List[Issue]:
+    if not isinstance(q, dict):
+        return [Issue(file, None, "questão", "item não é um objeto JSON")]
+    base = Path(base_dir) if base_dir is not None else None
+    qid = q.get("id")
+    try:
+        tipo = int(Question.infer_tipo(q))
+    except Exception:
+        tipo = 1
+    out: List[Issue] = []
+    if tipo == 3:
+        for check in _STATIC_T3:
+            out.extend(Issue(file, qid, f, m, s) for f, m, s in check(q, base))
+        # só resolve se a parte estática passou (senão o erro de resolução repete o mesmo problema)
+        if not any(i.severity == ERROR for i in out):
+            out.extend(Issue(file, qid, f, m, s) for f, m, s in _check_resolved(q, base))
+        return out
+    for check in CHECKS[tipo]:
+        out.extend(Issue(file, qid, f, m, s) for f, m, s in check(q, base))
+    return out
+
+
+def validate_bank(questions: Iterable[Dict[str, Any]], *, file: str = "", base_dir: Union[str, Path, None] = None) -> List[Issue]:
+    out: List[Issue] = []
+    seen: Dict[Any, int] = {}
+    for q in questions:
+        out.extend(validate_question(q, file=file, base_dir=base_dir))
+        qid = q.get("id") if isinstance(q, dict) else None
+        if qid is not None:
+            seen[qid] = seen.get(qid, 0) + 1
+    out.extend(Issue(file, qid, "id", f"id repetido ({n} questões)", WARNING) for qid, n in seen.items() if n > 1)
+    return out
+
+
+def validate_file(path: Union[str, Path], datasets=None) -> List[Issue]:
+    """Valida um arquivo; `datasets` (DatasetCache) evita reler arquivos inalterados."""
+    from .loader import QuizLoadError, _ensure_questions, _read_json_file
+    p = Path(path)
+    try:
+        data = datasets.raw(p) if datasets is not None else _read_json_file(p)
+    except QuizLoadError as e:
+        return [Issue(str(p), None, "arquivo", str(e))]
+    qs = _ensure_questions(data)
+    if not qs:
+        return [Issue(str(p), None, "arquivo", "nenhuma questão encontrada")]
+    return validate_bank(qs, file=str(p), base_dir=p.parent)
+
+
+def validate_banks(paths: Iterable[Union[str, Path]], *, workers: Optional[int] = None, datasets=None) -> List[Issue]:
+    """Todos os problemas de todos os arquivos (em processos se workers > 1), na ordem dos arquivos."""
+    paths = [str(p) for p in paths]
+    if workers and workers > 1 and len(paths) > 1:
+        with ProcessPoolExecutor(max_workers=min(workers, len(paths))) as pool:
+            parts = list(pool.map(validate_file, paths))
+    else:
+        parts = [validate_file(p, datasets) for p in paths]
+    return [i for part in parts for i in part]
+
+
+def errors(issues: Iterable[Issue]) -> List[Issue]:
+    return [i for i in issues if i.severity == ERROR]
+
+
+def format_issues(issues: List[Issue], limit: int = 20) -> str:
+    lines = [str(i) for i in issues[:limit]]
+    if len(issues) > limit:
+        lines.append(f"… e mais {len(issues) - limit} problema(s).")
+    return "\n".join(lines)
+
+
+def summarize_issues(issues: List[Issue], first: int = SUMMARY_WARNINGS) -> str:
+    """Uma linha por arquivo (nº de erros e de avisos) e só os `first` primeiros avisos."""
+    counts: Dict[str, List[int]] = {}
+    for i in issues:
+        c = counts.setdefault(i.file, [0, 0])
+        c[0 if i.severity == ERROR else 1] += 1
+    lines = [f"{Path(f).name if f else '—'}: {e} erro(s), {w} aviso(s)" for f, (e, w) in counts.items()]
+    warnings = [i for i in issues if i.severity != ERROR]
+    if warnings:
+        lines.append(format_issues(warnings, limit=first))
+    return "\n".join(lines)
+
+
+class ValidationCache:
+    """validate_file com resultado guardado por arquivo, pela marca (mtime, tamanho) do JSON."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._entries: Dict[str, Tuple[Tuple[int, int], List[Issue]]] = {}
+
+    def validate_file(self, path: Union[str, Path], datasets=None) -> List[Issue]:
+        key = str(Path(path).resolve())
+        try:
+            stamp = file_stamp(key)
+        except OSError:
+            return validate_file(path, datasets)      # vira a Issue "arquivo"; nada a guardar
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] == stamp:
+                return entry[1]
+        issues = validate_file(path, datasets)
+        with self._lock:
+            self._entries[key] = (stamp, issues)
+        return issues
+
+    def validate_banks(self, paths: Iterable[Union[str, Path]], *, datasets=None) -> List[Issue]:
+        return [i for p in paths for i in self.validate_file(p, datasets)]
@@ -2,8 +2,11 @@
 # -*- coding: utf-8 -*-
 from __future__ import annotations
 from dataclasses import dataclass
-from typing import Dict, Any, Tuple, List
-import ast, re, random, math
+from functools import lru_cache
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+import ast, heapq, re, random, math
+
+from . import jsonio, stats
 
 ANGLE_RE = re.compile(r"<([^<>]+)?>")
 
@@ -30,19 +33,26 @@ ALLOWED = {
     ast.Pow, ast.Mod  # aceitos, mesmo que pouco usados
 }
 
+_FORBIDDEN = (ast.Call, ast.Attribute, ast.Subscript, ast.Lambda, ast.NamedExpr)
+_GLOBALS = {"__builtins__": {}}
+
 def _check_ast(node: ast.AST):
     for n in ast.walk(node):
-        if isinstance(n, ast.Call):
+        if isinstance(n, _FORBIDDEN):
             raise ValueError("Funções não permitidas nas expressões.")
         if type(n) not in ALLOWED:
             # Parênteses são apenas tokens, não nós. Outros nós não são permitidos.
             pass
 
-def safe_eval(expr: str, env: Dict[str, float]) -> float:
+@lru_cache(maxsize=8192)
+def _compile_expr(expr: str):
+    """Código compilado da expressão (analisado uma vez por texto distinto)."""
     node = ast.parse(expr, mode="eval")
     _check_ast(node)
-    code = compile(node, "<expr>", "eval")
-    return float(eval(code, {"__builtins__": {}}, dict(env)))
+    return compile(node, "<expr>", "eval")
+
+def safe_eval(expr: str, env: Dict[str, float]) -> float:
+    return float(eval(_compile_expr(expr), _GLOBALS, dict(env)))
 
 def replace_angles(template: str, env: Dict[str, float]) -> str:
     def repl(m: re.Match) -> str:
@@ -54,29 +64,115 @@ def replace_angles(template: str, env: Dict[str, float]) -> str:
             val = env[inner]
             return _fmt(val)
         # expressão (pode ser VAR, ou operação usando VAR/RES)
+        stats.count("expressoes")
         val = safe_eval(inner, env)
         return _fmt(val)
     return ANGLE_RE.sub(repl, template)
 
-def resolve_all(question: Dict[str, Any], seed: int|None) -> Tuple[Dict[str, Any], Dict[str, float]]:
-    """Gera valores para variáveis (intervalo fechado, múltiplos de step), avalia resoluções na ordem
-    e substitui <...> em enunciado, alternativas, correta, obs e resoluções posteriores.
-    Retorna (question_resolved, env_final)."""
-    rng = random.Random(seed)
-    q = json_clone(question)
+# ---------- resoluções compiladas (grafo de dependências -> uma função) ----------
 
-    env: Dict[str, float] = {}
-    # 1) variáveis
-    vars_def = (q.get("variaveis") or {})
-    for name, spec in vars_def.items():
-        min_v = float(spec["min"]); max_v = float(spec["max"]); step = float(spec["step"])
-        env[name] = choose_value(min_v, max_v, step, rng)
+def _angles_to_parens(expr: str) -> str:
+    """'<A> * 2' -> '(A) * 2': o valor entra com precisão total (sem passar por _fmt)."""
+    return ANGLE_RE.sub(lambda m: f"({(m.group(1) or '0').strip()})", expr)
 
-    # 2) resoluções (na ordem declarada)
-    res_def = (q.get("resolucoes") or {})
-    for key, expr in res_def.items():
-        expr_r = replace_angles(str(expr), env)
-        env[key] = safe_eval(expr_r, env)
+class _Rename(ast.NodeTransformer):
+    def __init__(self, names: Dict[str, str]):
+        self.names = names
+
+    def visit_Name(self, node: ast.Name) -> ast.AST:
+        return ast.copy_location(ast.Name(id=self.names[node.id], ctx=ast.Load()), node)
+
+@dataclass(frozen=True)
+class CompiledResolucoes:
+    """Resoluções de uma questão prontas para avaliar: ordem topológica + uma função gerada."""
+    order: Tuple[str, ...]
+    inputs: Tuple[str, ...]
+    source: str
+    fn: Callable[[Dict[str, float]], Dict[str, float]]
+
+    def __call__(self, env: Dict[str, float]) -> Dict[str, float]:
+        return self.fn(env)
+
+def _topological(keys: List[str], deps: Dict[str, List[str]]) -> List[str]:
+    """Kahn, desempatando pela ordem declarada; ciclo -> ValueError com os nomes envolvidos."""
+    pending = {k: len(deps[k]) for k in keys}
+    users: Dict[str, List[str]] = {k: [] for k in keys}
+    for k in keys:
+        for d in deps[k]:
+            users[d].append(k)
+    pos = {k: i for i, k in enumerate(keys)}
+    ready = [(pos[k], k) for k in keys if not pending[k]]   # já em ordem: é um heap válido
+    order: List[str] = []
+    while ready:
+        _, k = heapq.heappop(ready)
+        order.append(k)
+        for u in users[k]:
+            pending[u] -= 1
+            if not pending[u]:
+                heapq.heappush(ready, (pos[u], u))
+    if len(order) < len(keys):
+        cycle = ", ".join(k for k in keys if pending[k])
+        raise ValueError(f"Dependência circular entre resoluções: {cycle}")
+    return order
+
+@lru_cache(maxsize=2048)
+def compile_resolucoes(var_names: Tuple[str, ...], resolucoes: Tuple[Tuple[str, str], ...]) -> CompiledResolucoes:
+    """
+    Monta o grafo variáveis/resoluções da questão (uma resolução pode usar variáveis e outras
+    resoluções, declaradas antes ou depois), ordena topologicamente e gera UMA função Python que
+    calcula todas as resoluções de uma vez, em float sem arredondar. Cache por (variáveis, resoluções).
+    """
+    keys = [k for k, _ in resolucoes]
+    res_set = set(keys)
+    var_set = set(var_names)
+    trees: Dict[str, ast.Expression] = {}
+    deps: Dict[str, List[str]] = {}
+    inputs: List[str] = []
+    for key, expr in resolucoes:
+        try:
+            tree = ast.parse(_angles_to_parens(expr).strip(), mode="eval")
+        except SyntaxError as e:
+            raise ValueError(f"Resolução {key}: expressão inválida '{expr}': {e.msg}") from None
+        _check_ast(tree)
+        names = {n.id for n in ast.walk(tree) if isinstance(n, ast.Name)}
+        # o próprio nome só pode ser lido se for também uma variável (a resolução a redefine)
+        own = {key} if key in var_set else set()
+        unknown = sorted(names - res_set - var_set)
+        if unknown:
+            raise ValueError(f"Resolução {key}: nome desconhecido '{unknown[0]}'")
+        deps[key] = sorted((names & res_set) - own, key=keys.index)
+        inputs.extend(n for n in sorted(names - set(deps[key])) if n not in inputs)
+        trees[key] = tree
+    order = _topological(keys, deps)
+
+    # nomes locais seguros (_v0, _v1, ...): entradas primeiro, depois cada resolução na ordem
+    lines = ["def _resolve(env):"]
+    local: Dict[str, str] = {}
+    for i, name in enumerate(inputs):
+        local[name] = f"_v{i}"
+        lines.append(f"    _v{i} = env[{name!r}]")
+    for key in order:
+        tree = _Rename(dict(local)).visit(trees[key])
+        local[key] = f"_v{len(local)}"
+        lines.append(f"    {local[key]} = _float({ast.unparse(tree.body)})")
+    lines.append("    return {" + ", ".join(f"{k!r}: {local[k]}" for k in keys) + "}")
+    source = "\n".join(lines)
+    ns: Dict[str, Any] = {"__builtins__": {}, "_float": float}
+    exec(compile(source, "<resolucoes>", "exec"), ns)
+    return CompiledResolucoes(tuple(order), tuple(inputs), source, ns["_resolve"])
+
+def resolve_all(question: Dict[str, Any], seed: int|None, variant: int = 0,
+                unique: bool = False) -> Tuple[Dict[str, Any], Dict[str, float]]:
+    """Gera valores para variáveis (intervalo fechado, múltiplos de step), calcula as resoluções
+    (compiladas: ordem das dependências, precisão total) e substitui <...> em enunciado,
+    alternativas, correta, obs e resoluções — a formatação (_fmt) só acontece nessa substituição.
+    Os valores dependem só de (seed, variant, id da questão): cada questão/variante é independente.
+    `unique=True`: as variáveis vêm da grade permutada (core.grid) — variantes distintas nunca
+    repetem a combinação; GridExhausted se a variante passar do tamanho da grade.
+    Retorna (question_resolved, env_final)."""
+    q = json_clone(question)
+    # 1) variáveis e 2) resoluções
+    env = _env_for(q, seed, variant, unique)
 
     # 3) substituição em todos os campos de texto
     def sub(x):
@@ -102,8 +198,98 @@ def resolve_all(question: Dict[str, Any], seed: int|None) -> Tuple[Dict[str, Any
         elif isinstance(q["obs"], str):
             q["obs"] = sub(q["obs"]) 
 
+    # 4) distratores gerados (campo "distratores"): completam as alternativas escritas à mão
+    spec = distractor_spec(question)
+    value = _correct_value(question.get("correta"), env) if spec else None
+    if value is not None:
+        from .rng import rng_for_question
+        from .utils.mathx import distractors
+        k, strategies = spec
+        key = rng_for_question(seed, variant, question, "distratores").getrandbits(64)
+        gen = distractors([value], k, strategies=strategies, keys=[key])[0]
+        q["alternativas"] = _fill_alternatives(q.get("alternativas") or [], str(q.get("correta") or ""), gen, k)
+
     return q, env
 
-def json_clone(x):  # simples cópia profunda via JSON
-    import json
-    return json.loads(json.dumps(x))
+def _env_for(q: Dict[str, Any], seed: int|None, variant: int, unique: bool = False) -> Dict[str, float]:
+    vars_def = (q.get("variaveis") or {})
+    if unique and vars_def:
+        from .grid import UniqueSampler
+        from .rng import question_key
+        env: Dict[str, float] = UniqueSampler(vars_def, seed, q.get("id"), key=question_key(q))[variant]
+    else:
+        from .rng import rng_for_question
+        rng = rng_for_question(seed, variant, q, "variaveis")
+        env = {}
+        for name, spec in vars_def.items():
+            min_v = float(spec["min"]); max_v = float(spec["max"]); step = float(spec["step"])
+            env[name] = choose_value(min_v, max_v, step, rng)
+    # resoluções: uma chamada da função compilada para a questão
+    res_def = (q.get("resolucoes") or {})
+    if res_def:
+        compiled = compile_resolucoes(tuple(vars_def), tuple((str(k), str(v)) for k, v in res_def.items()))
+        env.update(compiled(env))
+        stats.count("expressoes", len(res_def))
+    return env
+
+# ---------- distratores numéricos ----------
+
+_SINGLE_ANGLE_RE = re.compile(r"^\s*<([^<>]+)>\s*$")
+
+def distractor_spec(q: Dict[str, Any]) -> Optional[Tuple[int, Optional[Tuple[str, ...]]]]:
+    """"distratores": 4 ou {"k": 4, "estrategias": ["erro_comum", "unidade"]} -> (k, estratégias)."""
+    spec = q.get("distratores")
+    if spec is None or spec is False:
+        return None
+    if isinstance(spec, dict):
+        strategies = spec.get("estrategias")
+        return int(spec.get("k", 4)), (tuple(strategies) if strategies else None)
+    return int(spec), None
+
+def _correct_value(template: Any, env: Dict[str, float]) -> Optional[float]:
+    """Valor numérico da correta em precisão total ('<R>' ou um número), ou None."""
+    if not isinstance(template, (str, int, float)):
+        return None
+    m = _SINGLE_ANGLE_RE.match(str(template))
+    if m:
+        inner = m.group(1).strip()
+        return env[inner] if inner in env else safe_eval(inner, env)
+    try:
+        return float(str(template).replace(",", "."))
+    except ValueError:
+        return None
+
+def _fill_alternatives(manual: List[Any], correta: str, generated: List[float], k: int) -> List[str]:
+    """Alternativas à mão que não coincidem com a correta (nem entre si), completadas até k."""
+    seen = {correta.strip()}
+    out: List[str] = []
+    for a in [*manual, *(_fmt(x) for x in generated)]:
+        key = str(a).strip()
+        if key and key not in seen:
+            seen.add(key)
+            out.append(str(a))
+    return out[:max(k, len(manual))]
+
+def variant_distractors(question: Dict[str, Any], seed: int|None, variants: Iterable[int],
+                        k: Optional[int] = None) -> List[List[str]]:
+    """
+    Distratores (já formatados) de várias variantes da questão numa única chamada vetorizada.
+    Por variante só se calcula o valor correto (variáveis + função compilada das resoluções).
+    """
+    from .rng import question_key, rng_for
+    from .utils.mathx import distractors
+    qkey = question_key(question)
+    k_spec, strategies = distractor_spec(question) or (4, None)
+    variants = list(variants)
+    values, keys = [], []
+    for v in variants:
+        value = _correct_value(question.get("correta"), _env_for(question, seed, v))
+        if value is None:
+            raise ValueError("A correta precisa ser numérica ('<R>' ou número) para gerar distratores.")
+        values.append(value)
+        keys.append(rng_for(seed, v, qkey, "distratores").getrandbits(64))
+    rows = distractors(values, k or k_spec, strategies=strategies, keys=keys)
+    return [[_fmt(x) for x in row] for row in rows]
+
+def json_clone(x):  # cópia profunda via JSON (core.jsonio: orjson quando instalado)
+    return jsonio.clone(x)
@@ -0,0 +1,132 @@
+# -*- coding: utf-8 -*-
+"""
+Observação de arquivos para regerar saídas automaticamente (modo "watch").
+- FileWatcher: polling por (mtime, tamanho) numa thread própria, com debounce (uma rajada de
+  salvamentos vira um único aviso). Polling funciona igual em Windows/Linux/macOS, sem dependências.
+- referenced_images: imagens usadas pelas questões (enunciado e alternativas), para observar também.
+- outputs_affected: dado o conjunto de arquivos alterados, quais saídas (.tex/.pdf/.docx) refazer.
+"""
+from __future__ import annotations
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Mapping, Optional, Set, Tuple, Union
+import logging, threading, time
+
+from .cache import file_stamp
+
+logger = logging.getLogger(__name__)
+
+POLL_INTERVAL = 0.25  # s
+DEBOUNCE = 0.3        # s sem novas mudanças antes de avisar
+
+IMG_EXTS = ('.png', '.jpg', '.jpeg', '.gif', '.bmp', '.svg', '.pdf')
+
+Stamp = Optional[Tuple[int, int]]
+
+
+def _stamp(p: Path) -> Stamp:
+    try:
+        return file_stamp(p)
+    except OSError:
+        return None
+
+
+def _image_path(spec: Any) -> Optional[str]:
+    """'caminho;LxA' -> 'caminho' se for imagem; senão None."""
+    if not isinstance(spec, str):
+        return None
+    p = spec.split(";", 1)[0].strip()
+    return p if p.lower().endswith(IMG_EXTS) else None
+
+
+def referenced_images(questions: Iterable[Dict[str, Any]], base_dir: Union[str, Path, None]) -> Set[Path]:
+    out: Set[Path] = set()
+    base = Path(base_dir) if base_dir else None
+    for q in questions:
+        imgs = q.get("imagens") or q.get("imagem") or []
+        if isinstance(imgs, str):
+            imgs = [imgs]
+        alts = q.get("alternativas") if isinstance(q.get("alternativas"), list) else []
+        for spec in list(imgs) + list(alts):
+            p = _image_path(spec)
+            if p:
+                out.add((base / p) if base else Path(p))
+    return out
+
+
+def outputs_affected(changed: Iterable[Path], deps: Mapping[str, Iterable[Path]]) -> List[str]:
+    """Saídas cujo conjunto de dependências contém algum arquivo alterado (ordem de `deps`)."""
+    changed_set = {Path(p).resolve() for p in changed}
+    return [name for name, files in deps.items() if any(Path(f).resolve() in changed_set for f in files)]
+
+
+class FileWatcher:
+    """
+    Observa um conjunto de arquivos. `poll()` é puro (útil em testes); `start()` roda o polling
+    numa thread e chama `on_change(arquivos)` — NA THREAD DO WATCHER (quem usa Tk deve repassar
+    o evento para a thread da interface).
+    """
+
+    def __init__(
+        self,
+        on_change: Optional[Callable[[Set[Path]], None]] = None,
+        *,
+        interval: float = POLL_INTERVAL,
+        debounce: float = DEBOUNCE,
+    ):
+        self.on_change = on_change
+        self.interval = interval
+        self.debounce = debounce
+        self._lock = threading.Lock()
+        self._stamps: Dict[Path, Stamp] = {}
+        self._pending: Set[Path] = set()
+        self._last_change = 0.0
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def set_files(self, paths: Iterable[Union[str, Path]]) -> None:
+        """Troca o conjunto observado; arquivos que já estavam mantêm o carimbo anterior."""
+        wanted = {Path(p).resolve() for p in paths}
+        with self._lock:
+            self._stamps = {p: (self._stamps[p] if p in self._stamps else _stamp(p)) for p in wanted}
+            self._pending &= wanted
+
+    @property
+    def files(self) -> Set[Path]:
+        return set(self._stamps)
+
+    def poll(self, now: Optional[float] = None) -> Set[Path]:
+        """Retorna os arquivos alterados quando a rajada de mudanças "assenta" (debounce)."""
+        now = time.monotonic() if now is None else now
+        with self._lock:
+            for p, old in list(self._stamps.items()):
+                cur = _stamp(p)
+                if cur != old:
+                    self._stamps[p] = cur
+                    self._pending.add(p)
+                    self._last_change = now
+            if self._pending and now - self._last_change >= self.debounce:
+                out, self._pending = self._pending, set()
+                return out
+        return set()
+
+    def start(self) -> None:
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._loop, name="file-watcher", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=2)
+            self._thread = None
+
+    def _loop(self) -> None:
+        while not self._stop.wait(self.interval):
+            changed = self.poll()
+            if changed and self.on_change is not None:
+                try:
+                    self.on_change(changed)
+                except Exception:
+                    logger.exception("Falha ao tratar mudança em %s", sorted(map(str, changed)))
@@ -0,0 +1,224 @@
+# -*- coding: utf-8 -*-
+"""
+Navegador virtualizado de questões para o editor.
+- QuestionIndex: índice leve (id, tipo, dificuldade, início do enunciado), montado uma vez por banco.
+- VirtualQuestionList: Treeview que materializa apenas as linhas visíveis (linhas recicladas).
+Rolagem, salto por id e filtros (tipo/dificuldade) não dependem do tamanho do banco.
+"""
+from __future__ import annotations
+from bisect import bisect_left
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+from tkinter import ttk
+
+from .question_utils import tipo_of
+
+SNIPPET_LEN = 80
+ROW_HEIGHT = 22
+
+Row = Tuple[Any, int, str, str]  # (id, tipo, dificuldade, trecho do enunciado)
+
+
+def _snippet(text: Any) -> str:
+    s = " ".join(str(text or "").split())
+    return s[:SNIPPET_LEN]
+
+
+class QuestionIndex:
+    """
+    Índice leve sobre a lista de questões do editor.
+    - rows[pos] = (id, tipo, dificuldade, trecho)
+    - position_of_id(id) em O(1)
+    - view(tipo, dificuldade) devolve posições filtradas; cada combinação é calculada
+      uma única vez e reaproveitada até o próximo rebuild().
+    """
+
+    def __init__(self, questions: Sequence[Dict[str, Any]] = ()):
+        self.rows: List[Row] = []
+        self._pos_by_id: Dict[Any, int] = {}
+        self._views: Dict[Tuple[Optional[int], Optional[str]], List[int]] = {}
+        self.rebuild(questions)
+
+    def rebuild(self, questions: Sequence[Dict[str, Any]]) -> None:
+        rows: List[Row] = []
+        pos_by_id: Dict[Any, int] = {}
+        for pos, q in enumerate(questions):
+            try:
+                t = tipo_of(q)
+            except Exception:
+                t = 1
+            qid = q.get("id")
+            rows.append((qid, t, str(q.get("dificuldade") or ""), _snippet(q.get("enunciado"))))
+            pos_by_id.setdefault(str(qid), pos)
+        self.rows = rows
+        self._pos_by_id = pos_by_id
+        self._views = {(None, None): list(range(len(rows)))}
+
+    def __len__(self) -> int:
+        return len(self.rows)
+
+    def position_of_id(self, qid: Any) -> Optional[int]:
+        return self._pos_by_id.get(str(qid).strip())
+
+    def difficulties(self) -> List[str]:
+        return sorted({r[2] for r in self.rows if r[2]})
+
+    def view(self, tipo: Optional[int] = None, dificuldade: Optional[str] = None) -> List[int]:
+        key = (tipo, dificuldade or None)
+        cached = self._views.get(key)
+        if cached is None:
+            cached = [
+                pos for pos, r in enumerate(self.rows)
+                if (tipo is None or r[1] == tipo) and (key[1] is None or r[2] == key[1])
+            ]
+            self._views[key] = cached
+        return cached
+
+
+class VirtualQuestionList(ttk.Frame):
+    """
+    Lista virtualizada: mantém um número fixo de itens no Treeview (os visíveis) e apenas
+    troca seus valores ao rolar. `on_select(pos)` recebe a posição da questão na lista original.
+    """
+
+    COLUMNS = ("id", "tipo", "dif", "enunciado")
+
+    def __init__(self, master, index: QuestionIndex, on_select: Callable[[int], None], **kwargs):
+        super().__init__(master, **kwargs)
+        self.index = index
+        self.on_select = on_select
+        self._positions: List[int] = index.view()
+        self._first = 0
+        self._slots: List[str] = []
+        self._selected_pos: Optional[int] = None
+
+        self.columnconfigure(0, weight=1)
+        self.rowconfigure(0, weight=1)
+
+        style = ttk.Style(self)
+        style.configure("Nav.Treeview", rowheight=ROW_HEIGHT)
+        self.tree = ttk.Treeview(self, columns=self.COLUMNS, show="headings",
+                                 selectmode="browse", style="Nav.Treeview", height=1)
+        for col, text, width, stretch in (
+            ("id", "ID", 50, False),
+            ("tipo", "Tipo", 40, False),
+            ("dif", "Dificuldade", 80, False),
+            ("enunciado", "Enunciado", 260, True),
+        ):
+            self.tree.heading(col, text=text)
+            self.tree.column(col, width=width, stretch=stretch, anchor="w")
+        self.tree.grid(row=0, column=0, sticky="nsew")
+
+        self.vsb = ttk.Scrollbar(self, orient="vertical", command=self._on_scrollbar)
+        self.vsb.grid(row=0, column=1, sticky="ns")
+
+        self.tree.bind("<<TreeviewSelect>>", self._on_tree_select)
+        self.tree.bind("<Configure>", self._on_configure)
+        self.tree.bind("<MouseWheel>", self._on_mousewheel)
+        self.tree.bind("<Button-4>", lambda e: (self.scroll_by(-3), "break")[1])
+        self.tree.bind("<Button-5>", lambda e: (self.scroll_by(3), "break")[1])
+        self.tree.bind("<Prior>", lambda e: (self.scroll_by(-self._visible()), "break")[1])
+        self.tree.bind("<Next>", lambda e: (self.scroll_by(self._visible()), "break")[1])
+
+    # ----------------- visão/filtro -----------------
+    def set_view(self, positions: List[int]) -> None:
+        self._positions = positions
+        self._first = 0
+        if self._selected_pos is not None:
+            self._scroll_to(self._selected_pos)
+        self._refresh()
+
+    def reload(self) -> None:
+        """Chamar após index.rebuild(): volta para a visão completa."""
+        self.set_view(self.index.view())
+
+    def select_pos(self, pos: int) -> None:
+        self._selected_pos = pos
+        self._scroll_to(pos)
+        self._refresh()
+
+    # ----------------- rolagem -----------------
+    def _visible(self) -> int:
+        return max(1, len(self._slots))
+
+    def _max_first(self) -> int:
+        return max(0, len(self._positions) - self._visible())
+
+    def _view_offset(self, pos: int) -> Optional[int]:
+        i = bisect_left(self._positions, pos)
+        if i < len(self._positions) and self._positions[i] == pos:
+            return i
+        return None
+
+    def _scroll_to(self, pos: int) -> None:
+        off = self._view_offset(pos)
+        if off is None:
+            return
+        if off < self._first or off >= self._first + self._visible():
+            self._first = min(max(0, off - self._visible() // 2), self._max_first())
+
+    def scroll_by(self, n: int) -> None:
+        self._first = min(max(0, self._first + n), self._max_first())
+        self._refresh()
+
+    def _on_scrollbar(self, action, *args):
+        if action == "moveto":
+            total = len(self._positions)
+            self._first = min(max(0, int(float(args[0]) * total)), self._max_first())
+            self._refresh()
+        elif action == "scroll":
+            n = int(args[0])
+            self.scroll_by(n * self._visible() if args[1] == "pages" else n)
+
+    def _on_mousewheel(self, event):
+        self.scroll_by(int(-1 * (event.delta / 120)) * 3)
+        return "break"
+
+    def _on_configure(self, event):
+        rows = max(1, (event.height - ROW_HEIGHT) // ROW_HEIGHT)
+        if rows == len(self._slots):
+            return
+        while len(self._slots) < rows:
+            self._slots.append(self.tree.insert("", "end", values=("", "", "", "")))
+        while len(self._slots) > rows:
+            self.tree.delete(self._slots.pop())
+        self.tree.configure(height=rows)
+        self._first = min(self._first, self._max_first())
+        self._refresh()
+
+    # ----------------- materialização -----------------
+    def _refresh(self) -> None:
+        rows = self.index.rows
+        selected_slot = None
+        for i, iid in enumerate(self._slots):
+            off = self._first + i
+            if off < len(self._positions):
+                pos = self._positions[off]
+                self.tree.item(iid, values=rows[pos], tags=())
+                if pos == self._selected_pos:
+                    selected_slot = iid
+            else:
+                self.tree.item(iid, values=("", "", "", ""), tags=("empty",))
+        if selected_slot is not None:
+            self.tree.selection_set(selected_slot)
+        elif self.tree.selection():
+            self.tree.selection_remove(*self.tree.selection())
+
+        total = len(self._positions)
+        if total:
+            lo = self._first / total
+            hi = min(1.0, (self._first + self._visible()) / total)
+            self.vsb.set(lo, hi)
+        else:
+            self.vsb.set(0.0, 1.0)
+
+    def _on_tree_select(self, _=None):
+        sel = self.tree.selection()
+        if not sel or sel[0] not in self._slots:
+            return
+        off = self._first + self._slots.index(sel[0])
+        if off >= len(self._positions):
+            return
+        pos = self._positions[off]
+        if pos != self._selected_pos:
+            self._selected_pos = pos
+            self.on_select(pos)
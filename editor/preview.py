@@ -26,12 +26,13 @@ def preview_text(questions: List[Dict[str, Any]], title: str|None=None, **kwargs
     """
     from core.variables import resolve_all
     seed = kwargs.get("seed", None)
+    variant = kwargs.get("variant", 0)
     alph = "abcdefghijklmnopqrstuvwxyz"
     lines: List[str] = []
 
     qs = sorted(questions or [], key=lambda q: int(q.get("id", 0)))
     for q in qs:
-        q_res, _ = resolve_all(q, seed=seed)
+        q_res, _ = resolve_all(q, seed=seed, variant=variant)
 
         # Título
         lines.append(f"{q_res.get('id','?')}) {q_res.get('enunciado','').strip()}")
@@ -5,7 +5,7 @@ Editor de Questões (Tk + ttk)
 - Preview integrado ao core para tipos 1/2/4; fallback do preview antigo para tipo 3.
 """
 
-import json, re, tkinter as tk
+import re, threading, tkinter as tk
 from codecs import decode as _dec
 from tkinter import ttk, messagebox
 from pathlib import Path
@@ -23,9 +23,14 @@ from copy import deepcopy
 
 # ==== utilitários existentes do seu projeto ====
 from .question_utils import ensure_lists, tipo_of
+from .navigator import QuestionIndex, VirtualQuestionList
+from core import jsonio
+from core.fingerprint import FINGERPRINT_KEY, compute_fingerprint, strip_fingerprint
+from core.search import SearchIndex
+from core.validate import errors, validate_question
 
 # ==== core preview (para tipos 1/2/4) ====
-#  -> editor.preview.preview_text chama core.parsers.to_ir internamente
+#  -> editor.preview.preview_text resolve cada questão com core.variables.resolve_all
 try:
     from editor.preview import preview_text as core_preview_text
     _HAS_CORE_PREVIEW = True
@@ -33,11 +38,12 @@ except Exception:
     _HAS_CORE_PREVIEW = False
 
 APP_TITLE = "Editor de Questões (JSON)"
+VALIDATE_DEBOUNCE_MS = 300
 ALPH = "abcdefghijklmnopqrstuvwxyz"
 
 
 class QuestionEditor(tk.Toplevel):
-    def __init__(self, master, json_path, on_saved=None):
+    def __init__(self, master, json_path, on_saved=None, profiler=None, on_profiled=None):
         super().__init__(master)
         self.title(APP_TITLE)
         self.geometry("1100x720")
@@ -45,6 +51,9 @@ class QuestionEditor(tk.Toplevel):
 
         self.json_path = Path(json_path)
         self.on_saved = on_saved
+        # core.profiling.ProfileNext da janela principal: se armado, o próximo preview roda sob cProfile
+        self.profiler = profiler
+        self.on_profiled = on_profiled
         self._loading = False
 
         # carrega JSON
@@ -82,6 +91,7 @@ class QuestionEditor(tk.Toplevel):
         self.protocol("WM_DELETE_WINDOW", self._on_close)
 
         self.load_current()
+        self._start_search_index()
 
     # ----------------- UI -----------------
     def _build_topbar(self):
@@ -92,10 +102,10 @@ class QuestionEditor(tk.Toplevel):
         ttk.Button(bar, text="◀", width=3, command=self.prev).grid(row=0, column=0, padx=(0, 4))
         ttk.Button(bar, text="▶", width=3, command=self.next).grid(row=0, column=1, padx=(0, 10))
 
-        ttk.Label(bar, text="Ir para questão:").grid(row=0, column=2, sticky="e")
-        self.cmb_go = ttk.Combobox(bar, state="readonly", width=40)
-        self.cmb_go.grid(row=0, column=3, sticky="ew", padx=(6, 10))
-        self.cmb_go.bind("<<ComboboxSelected>>", self.on_go_selected)
+        ttk.Label(bar, text="Ir para ID:").grid(row=0, column=2, sticky="e")
+        self.ent_go = ttk.Entry(bar, width=10)
+        self.ent_go.grid(row=0, column=3, sticky="w", padx=(6, 10))
+        self.ent_go.bind("<Return>", self.on_go_selected)
 
         ttk.Button(bar, text="Novo", command=self.new_after_current).grid(row=0, column=4, padx=4)
         ttk.Button(bar, text="Salvar (Ctrl+S)", command=self.save).grid(row=0, column=5, padx=4)
@@ -105,9 +115,83 @@ class QuestionEditor(tk.Toplevel):
         self.lbl_pos = ttk.Label(bar, text="—")
         self.lbl_pos.grid(row=0, column=8, padx=(10, 0))
 
+        self._validate_job = None
+        self.lbl_issues = ttk.Label(bar, text="", anchor="w")
+        self.lbl_issues.grid(row=1, column=0, columnspan=9, sticky="ew", pady=(6, 0))
+
+    def _build_navigator(self, parent):
+        """Lista virtualizada (id, tipo, dificuldade, enunciado) + filtros por tipo/dificuldade."""
+        self.nav_index = QuestionIndex(self.data)
+
+        frm = ttk.Frame(parent, padding=(10, 10, 0, 10))
+        frm.columnconfigure(0, weight=1)
+        frm.rowconfigure(1, weight=1)
+
+        flt = ttk.Frame(frm)
+        flt.grid(row=0, column=0, sticky="ew", pady=(0, 6))
+        ttk.Label(flt, text="Buscar:").pack(side="left")
+        self.var_search = tk.StringVar(value="")
+        ent_search = ttk.Entry(flt, textvariable=self.var_search, width=18)
+        ent_search.pack(side="left", padx=(4, 10))
+        ent_search.bind("<KeyRelease>", self._schedule_search, add="+")
+        ttk.Label(flt, text="Tipo:").pack(side="left")
+        self.cmb_f_tipo = ttk.Combobox(flt, values=["Todos", "1", "2", "3", "4"], state="readonly", width=6)
+        self.cmb_f_tipo.set("Todos")
+        self.cmb_f_tipo.pack(side="left", padx=(4, 10))
+        ttk.Label(flt, text="Dificuldade:").pack(side="left")
+        self.cmb_f_diff = ttk.Combobox(flt, state="readonly", width=10)
+        self.cmb_f_diff.pack(side="left", padx=(4, 0))
+        self._refresh_diff_filter()
+        for cmb in (self.cmb_f_tipo, self.cmb_f_diff):
+            cmb.bind("<<ComboboxSelected>>", lambda e: self._apply_nav_filter(), add="+")
+
+        self.nav = VirtualQuestionList(frm, self.nav_index, on_select=self._on_nav_select)
+        self.nav.grid(row=1, column=0, sticky="nsew")
+        return frm
+
+    def _refresh_diff_filter(self):
+        self.cmb_f_diff["values"] = ["Todas"] + self.nav_index.difficulties()
+        if self.cmb_f_diff.get() not in self.cmb_f_diff["values"]:
+            self.cmb_f_diff.set("Todas")
+
+    def _apply_nav_filter(self):
+        t = self.cmb_f_tipo.get()
+        d = self.cmb_f_diff.get()
+        tipo = int(t) if t.isdigit() else None
+        dif = None if d in ("", "Todas") else d
+        query = self.var_search.get().strip()
+        if query:
+            keys = self.search_index.search(query, tipo=tipo, dificuldade=dif)
+            pos_of = self._pos_by_key
+            self.nav.set_view(sorted(pos_of[k] for k in keys if k in pos_of))
+        else:
+            self.nav.set_view(self.nav_index.view(tipo=tipo, dificuldade=dif))
+
+    # ----------------- busca -----------------
+    def _start_search_index(self):
+        """Monta o índice invertido em segundo plano; a busca funciona (parcial) enquanto isso."""
+        self.search_index = SearchIndex()
+        self._pos_by_key = {id(q): i for i, q in enumerate(self.data)}
+        self._search_job = None
+        snapshot = [(id(q), q) for q in self.data]
+        threading.Thread(target=self.search_index.build, args=(snapshot,), daemon=True).start()
+
+    def _schedule_search(self, _=None):
+        if self._search_job is not None:
+            self.after_cancel(self._search_job)
+        self._search_job = self.after(120, self._run_search)
+
+    def _run_search(self):
+        self._search_job = None
+        self._apply_nav_filter()
+
     def _build_notebook(self):
-        self.nb = ttk.Notebook(self, padding=(10, 10, 10, 10))
-        self.nb.grid(row=1, column=0, sticky="nsew")
+        body = ttk.PanedWindow(self, orient="horizontal")
+        body.grid(row=1, column=0, sticky="nsew")
+        body.add(self._build_navigator(body), weight=1)
+
+        self.nb = ttk.Notebook(body, padding=(10, 10, 10, 10))
+        body.add(self.nb, weight=3)
 
         # formulário
         self.tab_form = ttk.Frame(self.nb)
@@ -219,21 +303,33 @@ class QuestionEditor(tk.Toplevel):
         if getattr(self, "_loading", False):
             return
         self.var_dirty.set(True)
+        self._schedule_validate()
+
+    def _rebuild_index(self):
+        """Recalcula o índice leve após mudanças estruturais (salvar, inserir, excluir)."""
+        self.nav_index.rebuild(self.data)
+        self._pos_by_key = {id(q): i for i, q in enumerate(self.data)}
+        self._refresh_diff_filter()
+        self._apply_nav_filter()
+
+    def _go_to(self, new_idx):
+        if new_idx == self.idx:
+            return
+        if not self._confirm_unsaved():
+            self.nav.select_pos(self.idx)
+            return
+        self.idx = new_idx
+        self.load_current()
 
-    def _populate_dropdown(self):
-        items = [f"{q.get('id')} – {q.get('enunciado','')[:40].replace('\n',' ')}" for q in self.data]
-        self.cmb_go["values"] = items
-        if items:
-            self.cmb_go.current(self.idx)
+    def _on_nav_select(self, pos):
+        self._go_to(pos)
 
     def on_go_selected(self, _=None):
-        new_idx = self.cmb_go.current()
-        if new_idx != -1 and new_idx != self.idx:
-            if not self._confirm_unsaved():
-                self._populate_dropdown()
-                return
-            self.idx = new_idx
-            self.load_current()
+        pos = self.nav_index.position_of_id(self.ent_go.get())
+        if pos is None:
+            messagebox.showwarning(APP_TITLE, f"ID não encontrado: {self.ent_go.get().strip()}", parent=self)
+            return
+        self._go_to(pos)
 
     def prev(self):
         if self.idx <= 0:
@@ -300,8 +396,9 @@ class QuestionEditor(tk.Toplevel):
 
             self._toggle_panels(int(self.cmb_tipo.get()))
             self.lbl_pos.configure(text=f"Questão {self.idx+1} de {len(self.data)}")
-            self._populate_dropdown()
+            self.nav.select_pos(self.idx)
             self.var_dirty.set(False)
+            self._schedule_validate()
 
             self.update_preview()
         finally:
@@ -322,8 +419,9 @@ class QuestionEditor(tk.Toplevel):
     def _on_id_focusout(self):
         self._mark_dirty()
 
-    def collect_form(self):
-        q = self.data[self.idx]
+    def collect_form(self, commit=True):
+        """Lê o formulário; com commit=False trabalha numa cópia (para validar sem alterar os dados)."""
+        q = self.data[self.idx] if commit else dict(self.data[self.idx])
 
         # id
         try:
@@ -391,19 +489,37 @@ class QuestionEditor(tk.Toplevel):
             q.pop("resolucoes", None)
             q.pop("afirmacoes", None)
 
+        # conteúdo mudou: a impressão digital vinda do load_quiz precisa acompanhar (chave dos caches)
+        q[FINGERPRINT_KEY] = compute_fingerprint(q)
         return q
 
     def validate_question(self, q):
-        if not q.get("enunciado"):
-            raise ValueError("Enunciado não pode ser vazio.")
-        if not isinstance(q.get("alternativas"), list):
-            raise ValueError("Alternativas deve ser uma lista.")
-        if q.get("tipo") == 3:
-            if not q.get("variaveis") or not q.get("resolucoes"):
-                raise ValueError("Tipo 3: requer variaveis e resolucoes.")
-        if q.get("tipo") == 4:
-            if not q.get("afirmacoes"):
-                raise ValueError("Tipo 4: requer afirmacoes.")
+        """Levanta ValueError com TODOS os erros da questão (avisos não impedem salvar)."""
+        errs = errors(validate_question(q, file=str(self.json_path), base_dir=self.json_path.parent))
+        if errs:
+            raise ValueError("\n".join(f"[{i.field}] {i.message}" for i in errs))
+
+    def _schedule_validate(self):
+        if self._validate_job is not None:
+            self.after_cancel(self._validate_job)
+        self._validate_job = self.after(VALIDATE_DEBOUNCE_MS, self._run_validate)
+
+    def _run_validate(self):
+        """Validação ao digitar (com debounce): mostra os problemas da questão atual sem salvar nada."""
+        self._validate_job = None
+        try:
+            q = self.collect_form(commit=False)
+        except ValueError as e:
+            self.lbl_issues.configure(text=f"⚠ {e}", foreground="#b00020")
+            return
+        issues = validate_question(q, file=str(self.json_path), base_dir=self.json_path.parent)
+        if not issues:
+            self.lbl_issues.configure(text="✓ sem problemas", foreground="#2e7d32")
+            return
+        first = issues[0]
+        more = f" (+{len(issues) - 1})" if len(issues) > 1 else ""
+        color = "#b00020" if errors(issues) else "#8a6d00"
+        self.lbl_issues.configure(text=f"⚠ [{first.field}] {first.message}{more}", foreground=color)
 
     def _normalize_and_reorder_ids(self):
         self.data.sort(key=lambda q: int(q.get("id", 1)))
@@ -424,18 +540,20 @@ class QuestionEditor(tk.Toplevel):
         except Exception:
             new_pos = self.idx
 
+        self.search_index.update(id(current), current)
         item = self.data.pop(self.idx)
         self.data.insert(max(0, min(new_pos, len(self.data))), item)
         self._normalize_and_reorder_ids()
         self.idx = min(max(0, new_pos), len(self.data) - 1)
 
         try:
-            self.json_path.write_text(json.dumps(self.data, ensure_ascii=False, indent=2), encoding="utf-8")
+            data = [strip_fingerprint(q) for q in self.data]
+            jsonio.write(self.json_path, data, pretty=True)
             self.var_dirty.set(False)
             if self.on_saved:
                 self.on_saved()
             messagebox.showinfo(APP_TITLE, "Questão salva e JSON atualizado.", parent=self)
-            self._populate_dropdown()
+            self._rebuild_index()
             self.load_current()
         except Exception as e:
             messagebox.showerror(APP_TITLE, f"Erro ao salvar JSON:\n{e}", parent=self)
@@ -443,6 +561,7 @@ class QuestionEditor(tk.Toplevel):
     def delete_current(self):
         if not messagebox.askyesno(APP_TITLE, "Excluir esta questão? A operação não pode ser desfeita.", parent=self):
             return
+        self.search_index.remove(id(self.data[self.idx]))
         del self.data[self.idx]
         if not self.data:
             messagebox.showinfo(APP_TITLE, "Todas as questões foram removidas.", parent=self)
@@ -455,6 +574,7 @@ class QuestionEditor(tk.Toplevel):
     def clone_current(self):
         clone = deepcopy(self.data[self.idx])
         self.data.insert(self.idx + 1, clone)
+        self.search_index.update(id(clone), clone)
         self._normalize_and_reorder_ids()
         self.idx = self.idx + 1
         self.save()
@@ -471,8 +591,10 @@ class QuestionEditor(tk.Toplevel):
             "obs": [],
         }
         self.data.insert(self.idx + 1, new_q)
+        self.search_index.update(id(new_q), new_q)
         self._normalize_and_reorder_ids()
         self.idx = self.idx + 1
+        self._rebuild_index()
         self.var_dirty.set(True)
         self.load_current()
 
@@ -500,8 +622,16 @@ class QuestionEditor(tk.Toplevel):
         lines = []
 
         # Renderização unificada via core (todos os tipos 1/2/3/4)
+        directory = self.profiler.take() if self.profiler is not None else None
         try:
-            text_core = core_preview_text(qs, title="Pré-visualização")
+            if directory is not None:
+                from core.profiling import profile, profile_path
+                with profile(profile_path(directory, "preview_editor")) as result:
+                    text_core = core_preview_text(qs, title="Pré-visualização")
+                if self.on_profiled is not None:
+                    self.on_profiled(result)
+            else:
+                text_core = core_preview_text(qs, title="Pré-visualização")
             lines = [text_core.strip()]
         except Exception as e:
             lines = [f"[preview via core falhou]: {e}"]
@@ -7,9 +7,6 @@ Janela principal com abas (Beamer / Test).
 - O botão **Salvar Preferências** aparece nas duas abas.
 - A lista de JSONs (tabela) continua no topo (fora das abas), válida para ambas.
 """
-import io
-import json
-import shutil
 import subprocess
 from pathlib import Path
 from datetime import datetime
@@ -17,8 +14,8 @@ import tkinter as tk
 from tkinter import ttk, filedialog, messagebox, colorchooser
 import tkinter.font as tkfont
 import sys
-import threading
 import importlib.util
+from collections import deque
 
 # DnD opcional (gracioso)
 try:
@@ -28,12 +25,18 @@ except Exception:
     _HAS_DND = False
 
 from config.preferences import APP_NAME, get_ini_path, FONT_SIZES, DEFAULTS, load_prefs, save_prefs
-from beamer.generator import json2beamer
-from testgen.generator import jsons_to_docx
-from editor.question_editor import QuestionEditor
+# Geradores, o loader do core (cache, validação, observação de arquivos), python-docx/lxml e o
+# editor são importados sob demanda, no primeiro uso: a janela abre sem pagar essas importações.
+# Na abertura entram só módulos leves do core (stats, cancel, profiling), que não puxam o loader.
+from beamer.pdflatex import find_pdflatex
 from gui.scrollable_frame import ScrollableFrame
+from gui.jobs import JobScheduler, MAX_WORKERS, DONE, CANCELLED, FAILED
+from core.cancel import JobCancelled
+from core.profiling import ProfileNext
 
 TREE_HEIGHT_ROWS = 3
+LOG_MAX_LINES = 2000     # o widget de log guarda só as últimas N linhas
+LOG_FLUSH_MS = 50        # linhas pendentes são inseridas em lote a cada ~50 ms
 
 class App(ttk.Frame):
     def __init__(self, master):
@@ -86,6 +89,25 @@ class App(ttk.Frame):
         self.var_placeholder = tk.StringVar(value="{{QUESTOES}}")
         self.var_seed_test = tk.StringVar(value="")
         self.var_output_docx = tk.StringVar(value="")
+        self.var_skip_dups = tk.BooleanVar(value=False)
+
+        # cProfile da próxima ação (tarefa ou preview do editor): .pstats em <dir. do INI>/perfis
+        self.var_profile_next = tk.BooleanVar(value=False)
+        self.profile_next = ProfileNext()
+        self.jobs = JobScheduler(self, on_event=self._on_job_event, max_workers=MAX_WORKERS)
+        self.jobs.profiler = self.profile_next
+        # JSONs decodificados nesta sessão (core.cache.DatasetCache, criado no primeiro uso: ver datasets)
+        self._datasets = None
+        # problemas de validação por arquivo (core.validate.ValidationCache, criado no primeiro uso)
+        self.validations = None
+        # modo observação: refaz as saídas já geradas na sessão quando os arquivos mudam
+        self.var_watch = tk.BooleanVar(value=False)
+        # relatório de etapas (core.stats) no log ao fim de cada tarefa
+        self.var_stage_report = tk.BooleanVar(value=False)
+        # perfil de memória (core.memprof, tracemalloc): relatório no log e em <saída>.memoria.txt
+        self.var_memory_profile = tk.BooleanVar(value=False)
+        self.watcher = None
+        self._watch_outputs = set()
 
         self._build_top()
         self._build_tabs()
@@ -93,6 +115,24 @@ class App(ttk.Frame):
         self._bind_events()
 
         self.after_idle(self._apply_pane_constraints_and_place_sash)
+        self.master.protocol("WM_DELETE_WINDOW", self._on_close)
+
+    @property
+    def datasets(self):
+        """JSONs decodificados nesta sessão, por (caminho, mtime, tamanho)."""
+        if self._datasets is None:
+            from core.cache import DatasetCache
+            self._datasets = DatasetCache()
+        return self._datasets
+
+    def _on_close(self):
+        if self.jobs.active():
+            if not messagebox.askyesno(APP_NAME, "Há tarefas em andamento. Cancelar e sair?"):
+                return
+        if self.watcher is not None:
+            self.watcher.stop()
+        self.jobs.shutdown()
+        self.master.destroy()
 
     def _style(self):
         style = ttk.Style()
@@ -131,6 +171,8 @@ class App(ttk.Frame):
         self.btn_delete.pack(side="left", padx=(6,0))
         self.btn_editor = ttk.Button(btns, text="Revisar/Editar Questões…", command=self.open_editor, state="disabled")
         self.btn_editor.pack(side="left", padx=(10,0))
+        ttk.Checkbutton(btns, text="Observar alterações (regerar automaticamente)",
+                        variable=self.var_watch, command=self._toggle_watch).pack(side="right")
 
         if _HAS_DND and hasattr(self.tbl, "drop_target_register"):
             try:
@@ -190,10 +232,18 @@ class App(ttk.Frame):
         ttk.Button(actions, text="Gerar PDF", command=self.on_run_pdf, style="Accent.TButton").pack(side="left", padx=12)
         ttk.Button(actions, text="Salvar Preferências", command=self.on_save).pack(side="right")
 
-        # --- TAB TEST ---
+        # --- TAB TEST (conteúdo montado na primeira vez que a aba é exibida) ---
         self.tab_test = ttk.Frame(nb, padding=6)
         nb.add(self.tab_test, text="Test")
+        self._pending_tabs = {str(self.tab_test): self._build_test_tab}
+        nb.bind("<<NotebookTabChanged>>", self._on_tab_changed, add="+")
 
+    def _on_tab_changed(self, _=None):
+        build = self._pending_tabs.pop(self.nb.select(), None)
+        if build is not None:
+            build()
+
+    def _build_test_tab(self):
         t_files = ttk.LabelFrame(self.tab_test, text="Template e Saída", padding=8)
         t_files.grid(row=0, column=0, sticky="ew", pady=(0,10))
         t_files.columnconfigure(1, weight=1)
@@ -215,10 +265,13 @@ class App(ttk.Frame):
         ttk.Entry(t_opts, textvariable=self.var_seed_test, width=12).grid(row=0, column=3, sticky="w")
         ttk.Label(t_opts, text="Placeholder no template:").grid(row=1, column=0, sticky="w", padx=(6,2))
         ttk.Entry(t_opts, textvariable=self.var_placeholder).grid(row=1, column=1, columnspan=3, sticky="ew")
+        ttk.Checkbutton(t_opts, text="Evitar quase duplicatas na prova (uma por grupo)",
+                        variable=self.var_skip_dups).grid(row=2, column=0, columnspan=4, sticky="w", padx=(6,2), pady=(6,0))
 
         t_actions = ttk.Frame(self.tab_test, padding=(0,8,0,0))
         t_actions.grid(row=2, column=0, sticky="ew")
         ttk.Button(t_actions, text="Gerar Prova (.docx)", command=self.on_run_docx, style="Accent.TButton").pack(side="left")
+        ttk.Button(t_actions, text="Procurar Duplicatas", command=self.on_find_duplicates).pack(side="left", padx=(8,0))
         ttk.Button(t_actions, text="Salvar Preferências", command=self.on_save).pack(side="right")
 
     def _build_bottom(self):
@@ -231,6 +284,8 @@ class App(ttk.Frame):
         self.txt_log.configure(yscrollcommand=vbar.set)
 
         self.txt_log.configure(state="disabled")
+        self._log_pending = deque(maxlen=LOG_MAX_LINES)
+        self.after(LOG_FLUSH_MS, self._flush_log)
         self.txt_log.bind("<Key>", lambda e: "break")
         self.txt_log.bind("<Control-v>", lambda e: "break")
         self.txt_log.bind("<Button-2>", lambda e: "break")
@@ -240,8 +295,25 @@ class App(ttk.Frame):
         self._log_menu.add_command(label="Copiar tudo", command=self._copy_all_log)
         self.txt_log.bind("<Button-3>", self._show_log_menu)
 
+        jobs = ttk.Frame(self.bottom)
+        jobs.grid(row=1, column=2, sticky="ns", padx=(8,0), pady=6)
+        jobs.rowconfigure(0, weight=1)
+        self.tbl_jobs = ttk.Treeview(jobs, columns=("tarefa", "estado", "progresso"), show="headings",
+                                     selectmode="browse", height=4)
+        for col, text, width in (("tarefa", "Tarefa", 150), ("estado", "Estado", 90), ("progresso", "Progresso", 80)):
+            self.tbl_jobs.heading(col, text=text)
+            self.tbl_jobs.column(col, width=width, stretch=(col == "tarefa"), anchor="w")
+        self.tbl_jobs.grid(row=0, column=0, sticky="ns")
+        ttk.Button(jobs, text="Cancelar tarefa", command=self.cancel_selected_job).grid(row=1, column=0, sticky="ew", pady=(4,0))
+        ttk.Checkbutton(jobs, text="Medir etapas", variable=self.var_stage_report,
+                        command=self._toggle_stage_report).grid(row=2, column=0, sticky="w", pady=(4,0))
+        ttk.Checkbutton(jobs, text="Perfil de memória", variable=self.var_memory_profile,
+                        command=self._toggle_memory_profile).grid(row=3, column=0, sticky="w")
+        ttk.Checkbutton(jobs, text="Perfilar próxima ação", variable=self.var_profile_next,
+                        command=self._toggle_profile_next).grid(row=4, column=0, sticky="w")
+
         status = ttk.Frame(self.bottom)
-        status.grid(row=2, column=0, columnspan=2, sticky="ew")
+        status.grid(row=2, column=0, columnspan=3, sticky="ew")
         ttk.Label(status, textvariable=self.var_status).grid(row=0, column=0, sticky="w")
 
     def _apply_pane_constraints_and_place_sash(self):
@@ -340,6 +412,7 @@ class App(ttk.Frame):
         self._update_buttons_state()
         self._update_scrollbar_visibility()
         self.update_output_docx_path()
+        self._refresh_watch_files()
 
     def browse_jsons(self):
         sel = filedialog.askopenfilenames(
@@ -359,6 +432,7 @@ class App(ttk.Frame):
         self._update_buttons_state()
         self._update_scrollbar_visibility()
         self.update_output_docx_path()
+        self._refresh_watch_files()
 
     def _update_buttons_state(self):
         sel = self.tbl.selection()
@@ -434,58 +508,147 @@ class App(ttk.Frame):
             self.var_alert.set(hexcolor)
 
     def log(self, text):
+        """Enfileira uma linha de log (seguro de qualquer thread); `_flush_log` insere em lote."""
         ts = datetime.now().strftime("%H:%M:%S")
-        line = f"[{ts}] {text}\n"
-        self.txt_log.configure(state="normal")
+        self._log_pending.append(f"[{ts}] {text}\n")
+
+    def _flush_log(self):
         try:
-            self.txt_log.insert("end", line)
-            self.txt_log.see("end")
+            if self._log_pending:
+                chunk = []
+                while self._log_pending:
+                    chunk.append(self._log_pending.popleft())
+                self.txt_log.configure(state="normal")
+                try:
+                    self.txt_log.insert("end", "".join(chunk))
+                    # anel: descarta as linhas mais antigas acima de LOG_MAX_LINES
+                    lines = int(self.txt_log.index("end-1c").split(".")[0])
+                    if lines > LOG_MAX_LINES:
+                        self.txt_log.delete("1.0", f"{lines - LOG_MAX_LINES + 1}.0")
+                    self.txt_log.see("end")
+                finally:
+                    self.txt_log.configure(state="disabled")
         finally:
-            self.txt_log.configure(state="disabled")
+            self.after(LOG_FLUSH_MS, self._flush_log)
+
+    # ----------------- fila de tarefas -----------------
+    def _on_job_event(self, kind, job, payload):
+        """Chamado na thread do Tk (drenagem da fila do JobScheduler)."""
+        if kind == "log":
+            self.log(payload if job is None else f"[{job.name}] {payload}")
+        elif kind == "watch":
+            self._on_watched_change(payload)
+        elif kind == "status":
+            self.var_status.set(payload)
+        elif kind in ("state", "progress"):
+            self._update_job_row(job)
+            self.var_profile_next.set(self.profile_next.armed)
+            if kind == "state" and job.state == CANCELLED:
+                self.log(f"⏹ {job.name}: cancelada.")
+                self.var_status.set(f"{job.name}: cancelada.")
+            elif kind == "state" and job.state == FAILED:
+                self.log(f"❌ {job.name}: {job.error}")
+                self.var_status.set(f"{job.name}: erro (veja o log).")
+            elif kind == "state" and job.state == DONE:
+                self.log(f"{job.name}: concluída em {job.elapsed:.2f}s.")
+            if kind == "state" and job.state in (DONE, FAILED) and job.report is not None:
+                self.log(job.report.format())
+                self._save_memory_report(job)
+            if kind == "state" and job.state in (DONE, FAILED, CANCELLED) and job.profile is not None:
+                self._log_profile(job.profile)
+
+    def _toggle_stage_report(self):
+        self.jobs.collect_stats = bool(self.var_stage_report.get())
+
+    def _toggle_profile_next(self):
+        if self.var_profile_next.get():
+            directory = get_ini_path().parent / "perfis"
+            self.profile_next.arm(directory)
+            self.log(f"A próxima ação (slides, PDF, prova ou preview do editor) será perfilada; .pstats em {directory}.")
+        else:
+            self.profile_next.disarm()
 
-    def _load_and_merge_jsons(self, paths):
-        all_qs = []
-        for p in paths:
-            if not Path(p).exists():
-                raise FileNotFoundError(f"Arquivo não encontrado: {p}")
-            from core import load_quiz
-            ds = load_quiz(p)
-            data = ds.get('questions', [])
-            if not isinstance(data, list):
-                raise ValueError(f'O JSON precisa conter questões após normalização: {p}')
-            all_qs.extend(data)
-        all_qs.sort(key=lambda q: q.get("id", 0))
-        for i, q in enumerate(all_qs, start=1):
-            q["id"] = int(i)
-        return all_qs
-
-    def _prepare_combined_json(self, paths):
-        if len(paths)==1:
-            return paths[0], False
-        combined = self._load_and_merge_jsons(paths)
-        first = Path(paths[0]).resolve()
-        out_path = first.with_name(first.stem + "_combined.json")
-        with open(out_path, "w", encoding="utf-8") as f:
-            json.dump(combined, f, ensure_ascii=False, indent=2)
-        return str(out_path), True
-
-    def validate_inputs(self):
-        paths = self._get_json_paths()
-        if not paths:
-            messagebox.showerror("Geração", "Adicione pelo menos um arquivo JSON.")
-            return False
-        try:
-            self._load_and_merge_jsons(paths)
-        except Exception as e:
-            messagebox.showerror("Geração", f"Erro validando JSONs:\n{e}")
+    def _log_profile(self, result):
+        """Chamado na thread do Tk: resumo do cProfile no log (e desmarca o interruptor, já consumido)."""
+        self.var_profile_next.set(self.profile_next.armed)
+        if result.skipped:
+            self.log(f"Perfil (cProfile) não capturado: {result.skipped}. A ação rodou sem perfil; marque de novo para tentar outra vez.")
+            return
+        self.log(f"Perfil (cProfile) salvo em: {result.path}")
+        self.log(result.summary)
+
+    def _toggle_memory_profile(self):
+        self.jobs.memory_profile = bool(self.var_memory_profile.get())
+        if self.jobs.memory_profile:
+            self.log("Perfil de memória ligado: as próximas tarefas rodam com tracemalloc (mais lentas).")
+
+    def _save_memory_report(self, job):
+        from core.memprof import MemoryReport, report_path
+        path = report_path(job.resource)
+        if isinstance(job.report, MemoryReport) and path is not None:
+            try:
+                self.log(f"Relatório de memória: {job.report.save(path)}")
+            except OSError as e:
+                self.log(f"⚠️ Não foi possível gravar o relatório de memória: {e}")
+
+    def _update_job_row(self, job):
+        iid = f"job{job.id}"
+        prog = f"{job.done}/{job.total}" if job.total else ""
+        values = (job.name, job.state, prog)
+        if self.tbl_jobs.exists(iid):
+            self.tbl_jobs.item(iid, values=values)
+        else:
+            self.tbl_jobs.insert("", 0, iid=iid, values=values)
+
+    def cancel_selected_job(self):
+        sel = self.tbl_jobs.selection()
+        if not sel:
+            messagebox.showinfo("Tarefas", "Selecione uma tarefa na lista para cancelar.")
+            return
+        self.jobs.cancel(int(sel[0][3:]))
+
+    @staticmethod
+    def _session_questions(datasets, paths, renumber=False):
+        """Roda na thread da tarefa: cópias das questões cruas (do cache da sessão) para o gerador."""
+        return datasets.merged_questions(paths, renumber=renumber and len(paths) > 1)
+
+    def _report_error(self, title, msg, quiet=False):
+        """Erro em diálogo; no modo observação (quiet) vai só para o log."""
+        if quiet:
+            self.log(f"❌ {title}: {msg}")
+        else:
+            messagebox.showerror(title, msg)
+
+    def validate_inputs(self, quiet=False):
+        """Checagem rápida na thread do Tk; a validação dos bancos roda na tarefa (_check_banks)."""
+        if not self._get_json_paths():
+            self._report_error("Geração", "Adicione pelo menos um arquivo JSON.", quiet)
             return False
+        if self.validations is None:
+            from core.validate import ValidationCache
+            self.validations = ValidationCache()
         return True
 
-    def on_run(self):
-        if not self.validate_inputs():
+    def _check_banks(self, job, paths, quiet=False):
+        """Roda na thread da tarefa, antes de gerar: valida os JSONs (resultado guardado por arquivo
+        até ele mudar), resume no log e falha a tarefa se houver erros."""
+        from core.validate import errors, format_issues, summarize_issues
+        job.status("Validando JSONs…")
+        issues = self.validations.validate_banks(paths, datasets=self.datasets)
+        if issues:
+            job.log(summarize_issues(issues))
+        errs = errors(issues)
+        if errs:
+            msg = f"{len(errs)} erro(s) nos JSONs:\n{format_issues(errs)}"
+            if not quiet:
+                job.call_in_ui(messagebox.showerror, "Geração", msg)
+            raise ValueError(msg)
+
+    def on_run(self, quiet=False):
+        if not self.validate_inputs(quiet):
             return
+        self._watch_outputs.add("tex")
         paths = self._get_json_paths()
-        temp_json, is_temp = self._prepare_combined_json(paths)
 
         out = self.var_output.get().strip()
         title = self.var_title.get().strip() or DEFAULTS["title"]
@@ -497,12 +660,8 @@ class App(ttk.Frame):
         self.var_status.set("Gerando .tex…")
         self.log(f"Iniciando geração para {len(paths)} JSON(s).")
 
-        t = threading.Thread(
-            target=self._run_json2beamer,
-            args=(temp_json, out, seed, title, fsq, fsa, alert, is_temp),
-            daemon=True
-        )
-        t.start()
+        self.jobs.submit("Slides .tex", self._run_json2beamer,
+                         paths, self.datasets, out, seed, title, fsq, fsa, alert, quiet, resource=out)
 
     def on_save(self):
         values = {
@@ -516,50 +675,38 @@ class App(ttk.Frame):
         self.log(f"Preferências salvas em {get_ini_path()}")
         self.var_status.set("Preferências salvas.")
 
-    def _run_json2beamer(self, json_in, out, seed, title, fsq, fsa, alert, is_temp):
-        old_stdout = sys.stdout
-        buf = io.StringIO()
-        sys.stdout = buf
-        try:
-            rc = json2beamer(
-                input_json=json_in,
-                output_tex=out,
-                shuffle_seed=seed,
-                title=title,
-                fsq=fsq,
-                fsa=fsa,
-                alert_color=alert
-            )
-        except Exception as e:
-            sys.stdout = old_stdout
-            self.var_status.set("Erro.")
-            self.log(f"❌ Erro: {e}")
-            return
-        finally:
-            try:
-                if is_temp:
-                    Path(json_in).unlink(missing_ok=True)
-            except Exception:
-                pass
-        sys.stdout = old_stdout
-        out_text = buf.getvalue().strip()
-        if out_text:
-            self.log(out_text)
+    def _run_json2beamer(self, job, paths, datasets, out, seed, title, fsq, fsa, alert, quiet=False):
+        """Roda numa thread do JobScheduler: só fala com a UI via `job`."""
+        from beamer.generator import json2beamer
+        self._check_banks(job, paths, quiet)
+        questions = self._session_questions(datasets, paths, renumber=True)
+        rc = json2beamer(
+            input_json=paths,
+            output_tex=out,
+            shuffle_seed=seed,
+            title=title,
+            fsq=fsq,
+            fsa=fsa,
+            alert_color=alert,
+            cancel=job.token,
+            progress=job.progress,
+            questions=questions,
+        )
         if rc == 0:
-            self.var_status.set("Concluído com sucesso.")
-            self.log(f"✅ Arquivo gerado em: {out}")
+            job.status("Concluído com sucesso.")
+            job.log(f"✅ Arquivo gerado em: {out}")
         else:
-            self.var_status.set("Falhou (veja o log).")
-            self.log(f"❌ Retorno: {rc}")
+            job.status("Falhou (veja o log).")
+            job.log(f"❌ Retorno: {rc}")
 
-    def on_run_pdf(self):
-        if not self.validate_inputs():
+    def on_run_pdf(self, quiet=False):
+        if not self.validate_inputs(quiet):
             return
-        if shutil.which("pdflatex") is None:
-            messagebox.showerror("PDF", "pdflatex não encontrado no PATH. Verifique a instalação do LaTeX.")
+        if find_pdflatex() is None:
+            self._report_error("PDF", "pdflatex não encontrado no PATH. Verifique a instalação do LaTeX.", quiet)
             return
+        self._watch_outputs.add("pdf")
         paths = self._get_json_paths()
-        temp_json, is_temp = self._prepare_combined_json(paths)
 
         out = self.var_output.get().strip()
         title = self.var_title.get().strip() or DEFAULTS["title"]
@@ -569,124 +716,109 @@ class App(ttk.Frame):
         seed = self.var_seed.get().strip() or None
         self.var_status.set("Gerando .tex e compilando PDF…")
         self.log(f"Iniciando geração e compilação para {len(paths)} JSON(s).")
-        t = threading.Thread(
-            target=self._run_json2beamer_and_pdflatex,
-            args=(temp_json, out, seed, title, fsq, fsa, alert, is_temp),
-            daemon=True
+        self.jobs.submit("Slides PDF", self._run_json2beamer_and_pdflatex,
+                         paths, self.datasets, out, seed, title, fsq, fsa, alert, quiet, resource=out)
+
+    def _run_json2beamer_and_pdflatex(self, job, paths, datasets, out, seed, title, fsq, fsa, alert, quiet=False):
+        """Roda numa thread do JobScheduler: só fala com a UI via `job`."""
+        import subprocess, os
+        from beamer.generator import json2beamer
+        from beamer.pdflatex import compile_pdf
+        self._check_banks(job, paths, quiet)
+        questions = self._session_questions(datasets, paths, renumber=True)
+
+        # --- executar json2beamer ---
+        rc = json2beamer(
+            input_json=paths,
+            output_tex=out,
+            shuffle_seed=seed,
+            title=title,
+            fsq=fsq,
+            fsa=fsa,
+            alert_color=alert,
+            cancel=job.token,
+            progress=job.progress,
+            questions=questions,
         )
-        t.start()
-
-    def _run_json2beamer_and_pdflatex(self, json_in, out, seed, title, fsq, fsa, alert, is_temp):
-        import io, sys, subprocess, os
-        from pathlib import Path
-
-        # --- executar json2beamer com captura de stdout ---
-        old_stdout = sys.stdout
-        buf = io.StringIO()
-        sys.stdout = buf
-        try:
-            rc = json2beamer(
-                input_json=json_in,
-                output_tex=out,
-                shuffle_seed=seed,
-                title=title,
-                fsq=fsq,
-                fsa=fsa,
-                alert_color=alert
-            )
-        except Exception as e:
-            sys.stdout = old_stdout
-            self.var_status.set("Erro.")
-            self.log(f"❌ Erro gerando .tex: {e}")
-            return
-        finally:
-            try:
-                if is_temp:
-                    Path(json_in).unlink(missing_ok=True)
-            except Exception:
-                pass
-        sys.stdout = old_stdout
-        out_text = buf.getvalue().strip()
-        if out_text:
-            self.log(out_text)
         if rc != 0:
-            self.var_status.set("Falhou ao gerar .tex (veja o log).")
-            self.log(f"❌ Retorno: {rc}")
+            job.status("Falhou ao gerar .tex (veja o log).")
+            job.log(f"❌ Retorno: {rc}")
             return
 
-        self.log(f"✅ .tex gerado: {out}")
+        job.log(f"✅ .tex gerado: {out}")
 
-        # --- compilar com pdflatex, forçando UTF-8 e tolerando bytes inválidos ---
-        try:
-            tex_path = Path(out).resolve()
-            workdir = tex_path.parent
-            pdf_name = tex_path.with_suffix(".pdf").name
-            log_name = tex_path.with_suffix(".log").name
-
-            cmd = ["pdflatex", "-interaction=nonstopmode", "-halt-on-error", tex_path.name]
-
-            # Ambiente (opcional, ajuda a padronizar I/O)
-            env = os.environ.copy()
-            env.setdefault("PYTHONIOENCODING", "utf-8")
-
-            for i in range(2):
-                self.log(f"Compilando (passagem {i+1}/2)…")
-                proc = subprocess.run(
-                    cmd,
-                    cwd=str(workdir),
-                    env=env,
-                    capture_output=True,
-                    text=True,
-                    encoding="utf-8",   # <- chave para não usar CP-1252
-                    errors="replace"    # <- nunca quebrar por byte inválido (ex.: 0x81)
-                )
-
-                # Log da passagem (limito para não poluir)
-                if proc.stdout:
-                    tail = proc.stdout.strip()
-                    if len(tail) > 4000:
-                        tail = tail[-4000:]
-                    if tail:
-                        self.log(tail)
-
-                if proc.returncode != 0:
-                    if proc.stderr:
-                        self.log(proc.stderr.strip())
-
-                    # Tenta mostrar o fim do .log do LaTeX (ajuda a debugar)
-                    try:
-                        log_path = workdir / log_name
-                        if log_path.exists():
-                            with open(log_path, "r", encoding="utf-8", errors="ignore") as f:
-                                tail_lines = f.readlines()[-80:]
-                            self.log("[pdflatex .log - últimas linhas]")
-                            self.log("".join(tail_lines))
-                    except Exception as _e:
-                        self.log(f"(não consegui ler o .log: {_e})")
-
-                    raise RuntimeError(f"pdflatex retornou código {proc.returncode}")
-
-            pdf_path = workdir / pdf_name
-            if pdf_path.exists():
-                self.var_status.set("PDF gerado com sucesso.")
-                self.log(f"✅ PDF gerado em: {pdf_path}")
-                try:
-                    if os.name == "nt":
-                        os.startfile(str(pdf_path))
-                    else:
-                        opener = "open" if sys.platform == "darwin" else "xdg-open"
-                        subprocess.Popen([opener, str(pdf_path)], stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
-                    self.log("📂 PDF aberto no visualizador padrão.")
-                except Exception as e:
-                    self.log(f"⚠️ Não foi possível abrir automaticamente o PDF: {e}")
-            else:
-                self.var_status.set("Compilação terminou, mas o PDF não foi localizado.")
-                self.log("⚠️ pdflatex executou, mas o arquivo .pdf não foi encontrado.")
-        except Exception as e:
-            self.var_status.set("Erro na compilação do PDF.")
-            self.log(f"❌ Erro no pdflatex: {e}")
+        # --- compilar com pdflatex (saída transmitida linha a linha para o log) ---
+        pdf_path = compile_pdf(out, passes=2, on_line=job.log, cancel=job.token)
+        if pdf_path.exists():
+            job.status("PDF gerado com sucesso.")
+            job.log(f"✅ PDF gerado em: {pdf_path}")
+            if quiet:       # modo observação: o visualizador já aberto recarrega; não abre outro
+                return
+            try:
+                if os.name == "nt":
+                    os.startfile(str(pdf_path))
+                else:
+                    opener = "open" if sys.platform == "darwin" else "xdg-open"
+                    subprocess.Popen([opener, str(pdf_path)], stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+                job.log("📂 PDF aberto no visualizador padrão.")
+            except Exception as e:
+                job.log(f"⚠️ Não foi possível abrir automaticamente o PDF: {e}")
+        else:
+            job.status("Compilação terminou, mas o PDF não foi localizado.")
+            job.log("⚠️ pdflatex executou, mas o arquivo .pdf não foi encontrado.")
 
 
+    # ----------------- modo observação -----------------
+    def _watch_deps(self):
+        """Saída -> arquivos observados (JSONs, imagens referenciadas e template da prova)."""
+        from core.watch import referenced_images
+        paths = self._get_json_paths()
+        files = {Path(p) for p in paths}
+        for p in paths:
+            try:
+                files |= referenced_images(self.datasets.questions(p), Path(p).parent)
+            except Exception:
+                pass  # JSON inválido no momento: observa só o próprio arquivo
+        deps = {"tex": files, "pdf": files}
+        template = self.var_template.get().strip()
+        deps["docx"] = files | ({Path(template)} if template else set())
+        return deps
+
+    def _refresh_watch_files(self):
+        if self.watcher is None:
+            return
+        deps = self._watch_deps()
+        self.watcher.set_files(set().union(*deps.values()))
+
+    def _toggle_watch(self):
+        if self.var_watch.get():
+            from core.watch import FileWatcher
+            # o callback roda na thread do watcher: repassa para a fila drenada pelo Tk
+            self.watcher = FileWatcher(on_change=lambda changed: self.jobs.post("watch", changed))
+            self._refresh_watch_files()
+            self.watcher.start()
+            done = ", ".join(sorted(self._watch_outputs)) or "nenhuma ainda (gere uma vez para ativar)"
+            self.log(f"👀 Observando {len(self.watcher.files)} arquivo(s). Saídas regeradas: {done}.")
+        elif self.watcher is not None:
+            self.watcher.stop()
+            self.watcher = None
+            self.log("Observação desativada.")
+
+    def _on_watched_change(self, changed):
+        if self.watcher is None:
+            return
+        from core.watch import outputs_affected
+        deps = {k: v for k, v in self._watch_deps().items() if k in self._watch_outputs}
+        affected = outputs_affected(changed, deps)
+        self.log("Alterado(s): " + ", ".join(sorted(Path(p).name for p in changed)))
+        if "pdf" in affected:
+            self.on_run_pdf(quiet=True)     # a tarefa de PDF já regera o .tex
+        elif "tex" in affected:
+            self.on_run(quiet=True)
+        if "docx" in affected:
+            self.on_run_docx(quiet=True)
+        self._refresh_watch_files()
+
     def browse_template(self):
         sel = filedialog.askopenfilename(
             title="Escolher template .docx",
@@ -695,8 +827,8 @@ class App(ttk.Frame):
         if sel:
             self.var_template.set(sel)
 
-    def on_run_docx(self):
-        if not self.validate_inputs():
+    def on_run_docx(self, quiet=False):
+        if not self.validate_inputs(quiet):
             return
         template = self.var_template.get().strip() or "assets/template_prova.docx"
         out_docx = self.var_output_docx.get().strip()
@@ -704,8 +836,9 @@ class App(ttk.Frame):
             self.update_output_docx_path()
             out_docx = self.var_output_docx.get().strip()
         if not out_docx:
-            messagebox.showerror("Prova", "Defina arquivos JSON para que possamos sugerir a saída .docx.")
+            self._report_error("Prova", "Defina arquivos JSON para que possamos sugerir a saída .docx.", quiet)
             return
+        self._watch_outputs.add("docx")
 
         total = int(self.var_total_q.get() or 10)
         placeholder = self.var_placeholder.get().strip() or "{{QUESTOES}}"
@@ -715,25 +848,59 @@ class App(ttk.Frame):
         jsons = self._get_json_paths()
         self.var_status.set("Gerando prova .docx…")
         self.log(f"Prova: template={template}, questões={total}, placeholder={placeholder}")
-        def _job():
-            try:
-                jsons_to_docx(
-                    jsons,                 # primeiro: lista de JSONs
-                    template,              # segundo: template .docx
-                    out_docx,
-                    title=self.var_title.get().strip() or "Prova",
-                    num=total,
-                    seed=seed,
-                    placeholder=placeholder
-                )
-                self.var_status.set("Prova gerada com sucesso.")
-                self.log(f"✅ Prova gerada em: {out_docx}")
-                self._open_folder(str(Path(out_docx).resolve().parent))
-            except Exception as e:
-                self.var_status.set("Erro gerando prova.")
-                self.log(f"❌ Erro gerando prova: {e}")
-                messagebox.showerror("Prova", f"Erro gerando prova:\n{e}")
-        threading.Thread(target=_job, daemon=True).start()
+        title = self.var_title.get().strip() or "Prova"
+        self.jobs.submit("Prova .docx", self._run_json2docx,
+                         jsons, self.datasets, template, out_docx, title, total, seed, placeholder,
+                         self.var_skip_dups.get(), quiet, resource=out_docx)
+
+    def _run_json2docx(self, job, jsons, datasets, template, out_docx, title, total, seed, placeholder, skip_dups,
+                       quiet=False):
+        """Roda numa thread do JobScheduler: só fala com a UI via `job`."""
+        from testgen.generator import jsons_to_docx
+        self._check_banks(job, jsons, quiet)
+        questions = self._session_questions(datasets, jsons)
+        try:
+            jsons_to_docx(
+                jsons,                 # primeiro: lista de JSONs
+                template,              # segundo: template .docx
+                out_docx,
+                title=title,
+                num=total,
+                seed=seed,
+                placeholder=placeholder,
+                cancel=job.token,
+                progress=job.progress,
+                questions=questions,
+                exclude_duplicates=skip_dups,
+            )
+        except JobCancelled:
+            raise
+        except Exception as e:
+            if not quiet:   # no modo observação o erro vai só para o log (estado FAILED)
+                job.call_in_ui(messagebox.showerror, "Prova", f"Erro gerando prova:\n{e}")
+            raise
+        job.status("Prova gerada com sucesso.")
+        job.log(f"✅ Prova gerada em: {out_docx}")
+        if not quiet:
+            job.call_in_ui(self._open_folder, str(Path(out_docx).resolve().parent))
+
+    def on_find_duplicates(self):
+        paths = self._get_json_paths()
+        if not paths:
+            messagebox.showinfo("Duplicatas", "Adicione pelo menos um arquivo JSON.")
+            return
+        self.var_status.set("Procurando quase duplicatas…")
+        self.jobs.submit("Quase duplicatas", self._run_find_duplicates, paths, self.datasets)
+
+    def _run_find_duplicates(self, job, paths, datasets):
+        """Roda numa thread do JobScheduler: relatório dos grupos vai para o log."""
+        from core.neardup import format_clusters, scan_banks
+        questions, sources, clusters = scan_banks(paths, datasets=datasets)
+        if not clusters:
+            job.status(f"Nenhuma quase duplicata em {len(questions)} questões.")
+            return
+        job.log(format_clusters(questions, clusters, sources))
+        job.status(f"{len(clusters)} grupo(s) de quase duplicatas (veja o log).")
 
     def open_editor(self):
         sel = self.tbl.selection()
@@ -745,6 +912,8 @@ class App(ttk.Frame):
             messagebox.showerror("Editor", "O arquivo JSON indicado não existe.")
             return
         try:
-            QuestionEditor(self.master, path, on_saved=lambda: self.log("JSON atualizado pelo editor."))
+            from editor.question_editor import QuestionEditor
+            QuestionEditor(self.master, path, on_saved=lambda: self.log("JSON atualizado pelo editor."),
+                           profiler=self.profile_next, on_profiled=self._log_profile)
         except Exception as e:
             messagebox.showerror("Editor", f"Não foi possível abrir o editor:\n{e}")
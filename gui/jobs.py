@@ -0,0 +1,190 @@
+# -*- coding: utf-8 -*-
+"""
+Fila de tarefas da GUI (geração de slides, PDF e prova).
+- Pool limitado de threads; cada tarefa recebe um CancelToken próprio.
+- Tarefas que escrevem no mesmo arquivo (`resource`) nunca rodam ao mesmo tempo.
+- Threads de trabalho NUNCA tocam no Tk: publicam eventos numa fila que é drenada
+  na thread da interface via `after()`.
+- Com `collect_stats`, cada tarefa roda dentro de core.stats.collect(): o relatório de etapas e
+  contadores fica em job.report. Com `memory_profile`, o relatório é um core.memprof.MemoryReport
+  (tracemalloc por etapa; bem mais lento, só para diagnóstico).
+- `profiler` (core.profiling.ProfileNext): se armado, a próxima tarefa submetida roda sob cProfile;
+  o resultado (.pstats + resumo) fica em job.profile.
+"""
+from __future__ import annotations
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Optional, Tuple
+import itertools, queue, threading, time
+
+from core import stats
+from core.profiling import ProfileNext, ProfileResult, profile, profile_path
+from core.cancel import CancelToken, JobCancelled
+
+MAX_WORKERS = 2
+POLL_MS = 50
+
+QUEUED = "na fila"
+RUNNING = "executando"
+DONE = "concluído"
+CANCELLED = "cancelado"
+FAILED = "erro"
+FINISHED_STATES = (DONE, CANCELLED, FAILED)
+
+
+@dataclass(eq=False)
+class Job:
+    id: int
+    name: str
+    resource: Optional[str] = None
+    state: str = QUEUED
+    done: int = 0
+    total: int = 0
+    error: Optional[BaseException] = None
+    started: float = 0.0
+    finished: float = 0.0
+    token: CancelToken = field(default_factory=CancelToken)
+    report: Optional[stats.StageReport] = None
+    profile_dir: Optional[str] = None
+    profile: Optional[ProfileResult] = None
+    _events: Optional["queue.Queue"] = field(default=None, repr=False)
+
+    # ---- chamadas seguras a partir da thread de trabalho ----
+    def log(self, text: str) -> None:
+        self._events.put(("log", self, text))
+
+    def status(self, text: str) -> None:
+        self._events.put(("status", self, text))
+
+    def progress(self, done: int, total: int) -> None:
+        self.done, self.total = done, total
+        self._events.put(("progress", self, None))
+
+    def call_in_ui(self, fn: Callable[..., Any], *args) -> None:
+        self._events.put(("call", self, (fn, args)))
+
+    @property
+    def elapsed(self) -> float:
+        if not self.started:
+            return 0.0
+        return (self.finished or time.perf_counter()) - self.started
+
+
+class JobScheduler:
+    """
+    submit(name, fn, *args, resource=...) -> Job; `fn(job, *args)` roda numa thread do pool.
+    `on_event(kind, job, payload)` é chamado SEMPRE na thread do Tk (kinds: state, progress,
+    log, status).
+    """
+
+    def __init__(self, widget, on_event: Callable[[str, Job, Any], None], max_workers: int = MAX_WORKERS):
+        self.widget = widget
+        self.on_event = on_event
+        self.events: "queue.Queue[Tuple[str, Optional[Job], Any]]" = queue.Queue()
+        self.jobs: Dict[int, Job] = {}
+        self._ids = itertools.count(1)
+        self._pool = ThreadPoolExecutor(max_workers=max(1, int(max_workers)), thread_name_prefix="job")
+        self._locks: Dict[str, threading.Lock] = {}
+        self._locks_guard = threading.Lock()
+        self._closed = False
+        self.collect_stats = False
+        self.memory_profile = False
+        self.profiler: Optional[ProfileNext] = None
+        self.widget.after(POLL_MS, self._drain)
+
+    # ----------------- API -----------------
+    def submit(self, name: str, fn: Callable[..., Any], *args, resource: Optional[str] = None) -> Job:
+        job = Job(id=next(self._ids), name=name, resource=resource, _events=self.events)
+        if self.profiler is not None:
+            directory = self.profiler.take()
+            job.profile_dir = str(directory) if directory is not None else None
+        self.jobs[job.id] = job
+        self.events.put(("state", job, None))
+        self._pool.submit(self._run, job, fn, args)
+        return job
+
+    def cancel(self, job_id: int) -> None:
+        job = self.jobs.get(job_id)
+        if job is not None and job.state not in FINISHED_STATES:
+            job.token.cancel()
+
+    def cancel_all(self) -> None:
+        for job_id in list(self.jobs):
+            self.cancel(job_id)
+
+    def active(self) -> int:
+        return sum(1 for j in self.jobs.values() if j.state not in FINISHED_STATES)
+
+    def post(self, kind: str, payload: Any) -> None:
+        """Evento sem tarefa associada (ex.: log vindo de outra thread)."""
+        self.events.put((kind, None, payload))
+
+    def shutdown(self) -> None:
+        self._closed = True
+        self.cancel_all()
+        self._pool.shutdown(wait=False, cancel_futures=True)
+
+    # ----------------- execução -----------------
+    def _resource_lock(self, resource: str) -> threading.Lock:
+        with self._locks_guard:
+            return self._locks.setdefault(resource, threading.Lock())
+
+    def _set_state(self, job: Job, state: str) -> None:
+        job.state = state
+        self.events.put(("state", job, None))
+
+    def _collector(self):
+        if self.memory_profile:
+            from core.memprof import collect_memory
+            return collect_memory()
+        return stats.collect() if self.collect_stats else None
+
+    def _call(self, job: Job, fn: Callable[..., Any], args: tuple) -> None:
+        collector = self._collector()
+        if collector is not None:
+            with collector as job.report:
+                fn(job, *args)
+        else:
+            fn(job, *args)
+
+    def _run(self, job: Job, fn: Callable[..., Any], args: tuple) -> None:
+        lock = self._resource_lock(job.resource) if job.resource else None
+        try:
+            if lock is not None:
+                lock.acquire()
+            try:
+                job.token.check()
+                job.started = time.perf_counter()
+                self._set_state(job, RUNNING)
+                if job.profile_dir:
+                    with profile(profile_path(job.profile_dir, job.name)) as job.profile:
+                        self._call(job, fn, args)
+                else:
+                    self._call(job, fn, args)
+                job.finished = time.perf_counter()
+                self._set_state(job, DONE)
+            finally:
+                if lock is not None:
+                    lock.release()
+        except JobCancelled:
+            job.finished = time.perf_counter()
+            self._set_state(job, CANCELLED)
+        except Exception as e:
+            job.finished = time.perf_counter()
+            job.error = e
+            self._set_state(job, FAILED)
+
+    def _drain(self) -> None:
+        try:
+            while True:
+                kind, job, payload = self.events.get_nowait()
+                if kind == "call":
+                    fn, args = payload
+                    fn(*args)
+                else:
+                    self.on_event(kind, job, payload)
+        except queue.Empty:
+            pass
+        finally:
+            if not self._closed:
+                self.widget.after(POLL_MS, self._drain)
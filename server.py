@@ -0,0 +1,308 @@
+# -*- coding: utf-8 -*-
+"""
+Serviço HTTP local (somente 127.0.0.1, só biblioteca padrão) para gerar provas e slides pelo navegador.
+
+- Os bancos são carregados na inicialização e mantidos em memória (DatasetCache em cada processo
+  do pool; um arquivo alterado no disco é relido automaticamente).
+- Os templates .docx ficam em memória (bytes) e o documento é gerado num BytesIO, sem arquivos temporários.
+- A geração roda num pool de processos; a resposta é enviada em blocos.
+- Respostas determinísticas (com `seed`) vão para um cache LRU indexado por endpoint + parâmetros +
+  carimbo (mtime, tamanho) dos bancos/template: pedidos idênticos não geram de novo.
+
+Endpoints:
+    GET  /banks                                     -> lista de bancos e nº de questões
+    POST /exam   {"bank": "nome" | [...], "num": 10, "seed": 42, "variant": 0, "title": "Prova", "template": "nome"}
+    POST /slides {"bank": "nome" | [...], "seed": 42, "title": "...", "pdf": false}
+
+Uso (na raiz do projeto):
+    python -m server bancos/*.json [--template assets/template_prova.docx] [--port 8765] [--jobs 2]
+"""
+from __future__ import annotations
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from io import BytesIO
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+import argparse, tempfile, threading
+
+from core import jsonio
+from core.cache import DatasetCache, file_stamp
+
+HOST = "127.0.0.1"
+PORT = 8765
+CACHE_ENTRIES = 64
+CHUNK = 64 * 1024
+MAX_BODY = 1 << 20
+
+DOCX_MIME = "application/vnd.openxmlformats-officedocument.wordprocessingml.document"
+
+
+class RequestError(ValueError):
+    """Pedido inválido (vira HTTP 400)."""
+    def __init__(self, msg: str, status: int = 400):
+        super().__init__(msg)
+        self.status = status
+
+
+# ----------------- lado do processo do pool -----------------
+_datasets: Optional[DatasetCache] = None
+_templates: Dict[str, Tuple[Tuple[int, int], bytes]] = {}
+
+
+def _init_worker(banks: List[str], templates: List[str]) -> None:
+    """Pré-carrega bancos e templates no processo do pool (uma vez por processo)."""
+    global _datasets
+    _datasets = DatasetCache()
+    for p in banks:
+        try:
+            _datasets.raw(p)
+        except Exception:
+            pass  # o erro reaparece (com mensagem) no primeiro pedido que usar o banco
+    for t in templates:
+        try:
+            _template_bytes(t)
+        except OSError:
+            pass
+
+
+def _template_bytes(path: str) -> bytes:
+    stamp = file_stamp(path)
+    entry = _templates.get(path)
+    if entry is None or entry[0] != stamp:
+        entry = (stamp, Path(path).read_bytes())
+        _templates[path] = entry
+    return entry[1]
+
+
+def _questions(paths: List[str]) -> List[Dict[str, Any]]:
+    global _datasets
+    if _datasets is None:
+        _datasets = DatasetCache()
+    out: List[Dict[str, Any]] = []
+    for p in paths:
+        for q in _datasets.questions(p):
+            q.setdefault("_base_dir", str(Path(p).parent.resolve()))  # imagens relativas ao banco
+            out.append(q)
+    return out
+
+
+def render_exam(paths: List[str], template: str, opts: Dict[str, Any]) -> bytes:
+    from testgen.generator import json2docx
+    buf = BytesIO()
+    json2docx(paths, BytesIO(_template_bytes(template)), buf, title=opts.get("title") or "Prova",
+              num=opts.get("num"), seed=opts.get("seed"), questions=_questions(paths),
+              variant=opts.get("variant") or 0, exclude_duplicates=bool(opts.get("exclude_duplicates")))
+    return buf.getvalue()
+
+
+def render_slides(paths: List[str], opts: Dict[str, Any]) -> bytes:
+    from beamer.generator import json2beamer
+    qs = _questions(paths)
+    if len(paths) > 1:
+        qs.sort(key=lambda q: q.get("id", 0))
+        for i, q in enumerate(qs, start=1):
+            q["id"] = i
+    with tempfile.TemporaryDirectory(prefix="slides_") as tmp:
+        tex = Path(tmp) / (Path(paths[0]).stem + "_slides.tex")
+        json2beamer(input_json=paths, output_tex=str(tex), shuffle_seed=opts.get("seed"),
+                    title=opts.get("title") or "Exercícios – Apresentação", questions=qs,
+                    variant=opts.get("variant") or 0)
+        if opts.get("pdf"):
+            from beamer.pdflatex import compile_pdf
+            return compile_pdf(tex, passes=2).read_bytes()
+        return tex.read_bytes()
+
+
+# ----------------- lado do servidor -----------------
+class ResponseCache:
+    """LRU simples e thread-safe: chave -> (content_type, nome do arquivo, bytes)."""
+
+    def __init__(self, max_entries: int = CACHE_ENTRIES):
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        self._data: "OrderedDict[Any, Tuple[str, str, bytes]]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key):
+        with self._lock:
+            val = self._data.get(key)
+            if val is None:
+                self.misses += 1
+                return None
+            self._data.move_to_end(key)
+            self.hits += 1
+            return val
+
+    def put(self, key, val) -> None:
+        with self._lock:
+            self._data[key] = val
+            self._data.move_to_end(key)
+            while len(self._data) > self.max_entries:
+                self._data.popitem(last=False)
+
+
+class GenerationService:
+    """Registro dos bancos/templates, pool de processos e cache de respostas."""
+
+    def __init__(self, banks: List[str], templates: List[str], *, jobs: int = 2, cache_entries: int = CACHE_ENTRIES):
+        self.banks: Dict[str, str] = {}
+        for p in banks:
+            path = Path(p)
+            for f in (sorted(path.glob("*.json")) if path.is_dir() else [path]):
+                self.banks[f.stem] = str(f.resolve())
+        self.templates: Dict[str, str] = {Path(t).stem: str(Path(t).resolve()) for t in templates}
+        self.default_template = next(iter(self.templates), None)
+        self.datasets = DatasetCache()  # só para /banks e validação
+        self.cache = ResponseCache(cache_entries)
+        self.pool = ProcessPoolExecutor(max_workers=max(1, jobs), initializer=_init_worker,
+                                        initargs=(list(self.banks.values()), list(self.templates.values())))
+
+    def close(self) -> None:
+        self.pool.shutdown(wait=False, cancel_futures=True)
+
+    def list_banks(self) -> List[Dict[str, Any]]:
+        out = []
+        for name, path in self.banks.items():
+            try:
+                out.append({"name": name, "questions": len(self.datasets.questions(path))})
+            except Exception as e:
+                out.append({"name": name, "error": str(e)})
+        return out
+
+    def _bank_paths(self, spec: Any) -> List[str]:
+        names = [spec] if isinstance(spec, str) else spec
+        if not names or not isinstance(names, list):
+            raise RequestError("Informe 'bank' (nome ou lista de nomes).")
+        try:
+            return [self.banks[n] for n in names]
+        except (KeyError, TypeError):
+            raise RequestError(f"Banco desconhecido: {names!r}. Disponíveis: {sorted(self.banks)}", 404)
+
+    @staticmethod
+    def _int(body: Dict[str, Any], key: str) -> Optional[int]:
+        v = body.get(key)
+        if v is None:
+            return None
+        if isinstance(v, bool) or not isinstance(v, int):
+            raise RequestError(f"'{key}' deve ser inteiro.")
+        return v
+
+    def handle(self, endpoint: str, body: Dict[str, Any]) -> Tuple[str, str, bytes, bool]:
+        """Gera (ou busca no cache) -> (content_type, nome do arquivo, bytes, veio_do_cache)."""
+        paths = self._bank_paths(body.get("bank"))
+        opts = {"seed": self._int(body, "seed"), "variant": self._int(body, "variant") or 0,
+                "title": body.get("title")}
+        if endpoint == "exam":
+            opts["num"] = self._int(body, "num")
+            opts["exclude_duplicates"] = bool(body.get("exclude_duplicates"))
+            tname = body.get("template") or self.default_template
+            if tname not in self.templates:
+                raise RequestError(f"Template desconhecido: {tname!r}.", 404)
+            template = self.templates[tname]
+            deps = paths + [template]
+        else:
+            opts["pdf"] = bool(body.get("pdf"))
+            deps = paths
+
+        # sem seed a saída é aleatória: não entra no cache
+        key = None
+        if opts["seed"] is not None:
+            key = (endpoint, jsonio.canonical(opts), tuple((p, file_stamp(p)) for p in deps))
+            hit = self.cache.get(key)
+            if hit is not None:
+                return hit + (True,)
+
+        stem = Path(paths[0]).stem + ("_combined" if len(paths) > 1 else "")
+        if endpoint == "exam":
+            data = self.pool.submit(render_exam, paths, template, opts).result()
+            val = (DOCX_MIME, stem + "_prova.docx", data)
+        else:
+            data = self.pool.submit(render_slides, paths, opts).result()
+            val = ("application/pdf", stem + "_slides.pdf", data) if opts["pdf"] \
+                else ("text/x-tex; charset=utf-8", stem + "_slides.tex", data)
+        if key is not None:
+            self.cache.put(key, val)
+        return val + (False,)
+
+
+class Handler(BaseHTTPRequestHandler):
+    service: GenerationService  # definido em make_server
+    server_version = "QuestoesServer/1.0"
+
+    def _send(self, status: int, ctype: str, data: bytes, headers: Optional[Dict[str, str]] = None) -> None:
+        self.send_response(status)
+        self.send_header("Content-Type", ctype)
+        self.send_header("Content-Length", str(len(data)))
+        for k, v in (headers or {}).items():
+            self.send_header(k, v)
+        self.end_headers()
+        view = memoryview(data)
+        for i in range(0, len(view), CHUNK):
+            self.wfile.write(view[i:i + CHUNK])
+
+    def _send_json(self, status: int, obj: Any) -> None:
+        self._send(status, "application/json; charset=utf-8", jsonio.dumps_bytes(obj))
+
+    def do_GET(self):
+        if self.path.rstrip("/") == "/banks":
+            self._send_json(200, {"banks": self.service.list_banks(),
+                                  "templates": sorted(self.service.templates),
+                                  "cache": {"hits": self.service.cache.hits, "misses": self.service.cache.misses}})
+        else:
+            self._send_json(404, {"error": "Use GET /banks, POST /exam ou POST /slides."})
+
+    def do_POST(self):
+        endpoint = self.path.strip("/")
+        if endpoint not in ("exam", "slides"):
+            return self._send_json(404, {"error": f"Endpoint desconhecido: /{endpoint}"})
+        try:
+            length = int(self.headers.get("Content-Length") or 0)
+            if length > MAX_BODY:
+                raise RequestError("Corpo do pedido grande demais.", 413)
+            body = jsonio.loads(self.rfile.read(length) or b"{}")
+            if not isinstance(body, dict):
+                raise RequestError("O corpo deve ser um objeto JSON.")
+            ctype, fname, data, cached = self.service.handle(endpoint, body)
+        except RequestError as e:
+            return self._send_json(e.status, {"error": str(e)})
+        except jsonio.JSONDecodeError as e:
+            return self._send_json(400, {"error": f"JSON inválido: {e}"})
+        except Exception as e:
+            return self._send_json(500, {"error": f"{type(e).__name__}: {e}"})
+        self._send(200, ctype, data, {"Content-Disposition": f'attachment; filename="{fname}"',
+                                      "X-Cache": "HIT" if cached else "MISS"})
+
+
+def make_server(service: GenerationService, port: int = PORT) -> ThreadingHTTPServer:
+    """Servidor ligado só em 127.0.0.1 (porta 0 = escolhida pelo sistema)."""
+    handler = type("BoundHandler", (Handler,), {"service": service})
+    return ThreadingHTTPServer((HOST, port), handler)
+
+
+def main(argv=None) -> int:
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("banks", nargs="+", help="bancos JSON (ou diretórios com *.json)")
+    ap.add_argument("--template", action="append", default=None, help="template(s) .docx da prova")
+    ap.add_argument("--port", type=int, default=PORT)
+    ap.add_argument("--jobs", type=int, default=2, help="processos de geração")
+    ap.add_argument("--cache", type=int, default=CACHE_ENTRIES, help="respostas mantidas em cache")
+    args = ap.parse_args(argv)
+
+    service = GenerationService(args.banks, args.template or ["assets/template_prova.docx"],
+                                jobs=args.jobs, cache_entries=args.cache)
+    httpd = make_server(service, args.port)
+    print(f"Servindo {len(service.banks)} banco(s) em http://{HOST}:{httpd.server_address[1]}/ (Ctrl+C para sair)", flush=True)
+    try:
+        httpd.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        httpd.server_close()
+        service.close()
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
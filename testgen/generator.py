@@ -1,11 +1,11 @@
 # -*- coding: utf-8 -*-
 from __future__ import annotations
-from typing import List, Dict, Any, Optional, Tuple
+from typing import List, Dict, Any, BinaryIO, Optional, Tuple, Union
 from pathlib import Path
-import json, random
+import json
+from core.rng import rng_for, rng_for_question
 from core.variables import resolve_all  # <-- necessário para q_res, _env = resolve_all(...)
-from docx import Document
-from docx.shared import Inches
+# python-docx/lxml são importados só dentro de json2docx (carga pesada; não atrasa o início da GUI)
 
 def mm_to_inches(mm: float) -> float:
     return (mm or 0) / 25.4
@@ -25,6 +25,10 @@ def _parse_img_spec(s: str):
         return path.strip(), None, None
     return s.strip(), None, None
 
+def _exists(p: Path) -> bool:
+    stats.count("imagens")
+    return p.exists()
+
 def _is_image_path(s: str) -> bool:
     if not isinstance(s, str):
         return False
@@ -38,10 +42,12 @@ def _read_text_any(p: Path) -> str:
         except Exception: pass
     return b.decode("utf-8", errors="replace")
 
-from core import load_quiz
+from core import load_quiz, stats
+from core.cancel import check_cancel, report_progress
 
 def _load_json_list(p: str) -> list[dict]:
-    return load_quiz(p).get('questions', [])
+    # variáveis ficam para o passo 2 (com a seed/variante); aqui só normaliza
+    return load_quiz(p, resolve_vars=False).get('questions', [])
 
 def _alts_with_correct(q: Dict[str, Any]) -> List[str]:
     """Garante a presença da correta e remove duplicatas preservando a ordem."""
@@ -87,7 +93,7 @@ def _compose_docx_block(q: Dict[str, Any], seq: int) -> List[Dict[str, Any]]:
     for img in imgs:
         spec_p, wmm, hmm = _parse_img_spec(img)
         p = Path(base_dir, spec_p) if base_dir else Path(spec_p)
-        if p.exists():
+        if _exists(p):
             runs.append({"type":"image","path": str(p), "width_mm": wmm, "height_mm": hmm})
         else:
             # se preferir, deixe um marcador textual
@@ -118,7 +124,7 @@ def _compose_docx_block(q: Dict[str, Any], seq: int) -> List[Dict[str, Any]]:
             spec_p, wmm, hmm = _parse_img_spec(s)
             p = Path(base_dir, spec_p) if base_dir else Path(spec_p)
             runs.append({"type":"text","text": f"  {label} "})
-            if p.exists():
+            if _exists(p):
                 runs.append({"type":"image","path": str(p), "width_mm": wmm, "height_mm": hmm})
             else:
                 runs.append({"type":"text","text": "[imagem]\n"})
@@ -135,13 +141,19 @@ def _render_blocks_for_docx(resolved: List[Dict[str, Any]]) -> List[List[Dict[st
 
 def json2docx(
     json_paths: List[str],
-    template: str,
-    out_docx: str,
+    template: Union[str, BinaryIO],
+    out_docx: Union[str, BinaryIO],
     placeholder: str = "{{QUESTOES}}",
     title: str = "Prova",
     num: Optional[int] = None,
     seed: Optional[int] = None,
     shuffle: bool = True,
+    cancel=None,
+    progress=None,
+    questions: Optional[List[Dict[str, Any]]] = None,
+    variant: int = 0,
+    exclude_duplicates: bool = False,
+    unique_variants: bool = False,
 ) -> int:
     """
     Gera a prova DOCX:
@@ -149,17 +161,46 @@ def json2docx(
     - Embaralha questões (se 'shuffle=True'), mas numera 1..N.
     - Embaralha alternativas e garante a correta presente.
     - Tipo 2 com imagens (caminho relativo ao JSON) e placeholder quando não existir.
+    - `cancel` (CancelToken) é verificado entre questões; `progress(feitas, total)` é opcional.
+    - `questions`: questões já carregadas (cruas, modificadas in-place); evita reler `json_paths`.
+    - `template` e `out_docx` também podem ser arquivos em memória (BytesIO), sem tocar o disco.
+    - `variant`: com a mesma seed, cada variante é uma prova diferente (core.rng); a variante k
+      sai igual sendo gerada sozinha ou no meio de um lote.
+    - `exclude_duplicates`: no máximo uma questão de cada grupo de quase duplicatas (core.neardup)
+      entra na prova; qual delas depende do embaralhamento.
+    - `unique_variants`: cada variante recebe uma combinação de variáveis do tipo 3 que nenhuma outra
+      variante recebe (core.grid); GridExhausted se a grade da questão for menor que a variante.
+    - Com um core.stats.collect() ativo, registra as etapas carga/resolução/seleção/docx/escrita.
     """
+    seq = stats.sequence()
+    seq.next("carga")
     # 1) Carregar
     raw: List[Dict[str, Any]] = []
-    for p in json_paths:
-        raw.extend(_load_json_list(p))
+    if questions is not None:
+        raw = load_quiz(questions, cancel=cancel, resolve_vars=False).get("questions", [])
+    else:
+        for p in json_paths:
+            check_cancel(cancel)
+            raw.extend(_load_json_list(p))
+
+    if unique_variants:
+        from core.grid import check_unique_capacity
+        check_unique_capacity(raw, variant + 1)
+
+    groups = None
+    if exclude_duplicates:
+        from core.neardup import cluster_labels, find_near_duplicates
+        groups = cluster_labels(len(raw), find_near_duplicates(raw))
 
     # 2) Resolver T3 (variáveis/resoluções e substituições <...>) mantendo _base_dir
+    seq.next("resolução")
     resolved: List[Dict[str, Any]] = []
-    for q in raw:
+    total = len(raw)
+    for n_done, q in enumerate(raw):
+        check_cancel(cancel)
+        report_progress(progress, n_done, total)
         base = q.get("_base_dir")
-        q_res, _env = resolve_all(q, seed=seed)
+        q_res, _env = resolve_all(q, seed=seed, variant=variant, unique=unique_variants)
         q_res["_base_dir"] = base
         # Tipo 4: preparar linha de afirmativas para reuso (preview-like)
         line = _afirm_line(q_res)
@@ -167,26 +208,37 @@ def json2docx(
             q_res.setdefault("extra", {})["afirmacoes_line"] = line
         resolved.append(q_res)
 
-    rng = random.Random(seed)
-
     # 3) Embaralhar questões (apenas na prova)
+    seq.next("seleção")
+    order = list(range(len(resolved)))
     if shuffle:
-        rng.shuffle(resolved)
+        rng_for(seed, variant, None, "questoes").shuffle(order)
 
-    # 4) Seleção (num)
+    # 4) Seleção (num), pulando quase duplicatas de questões já escolhidas
+    if groups is not None:
+        taken, kept = set(), []
+        for i in order:
+            if groups[i] not in taken:
+                taken.add(groups[i])
+                kept.append(i)
+        order = kept
     if isinstance(num, int) and num > 0:
-        resolved = resolved[:num]
+        order = order[:num]
+    resolved = [resolved[i] for i in order]
 
     # 5) Embaralhar alternativas por questão, garantindo correta presente
     for q in resolved:
         alts = _alts_with_correct(q)
-        rng.shuffle(alts)
+        rng_for_question(seed, variant, q, "prova").shuffle(alts)
         q["alternativas"] = alts
 
     # 6) Renderizar no DOCX (substituição do placeholder)
+    seq.next("docx")
+    from docx import Document
+    from docx.shared import Inches
     doc = Document(template)
 
-    def replace_placeholder(document: Document, placeholder_text: str, blocks: List[List[Dict[str, Any]]]) -> bool:
+    def replace_placeholder(document, placeholder_text: str, blocks: List[List[Dict[str, Any]]]) -> bool:
         for para in document.paragraphs:
             if placeholder_text in para.text:
                 p = para._p
@@ -213,6 +265,7 @@ def json2docx(
                 return True
         return False
 
+    check_cancel(cancel)
     blocks = _render_blocks_for_docx(resolved)
     if not replace_placeholder(doc, placeholder, blocks):
         # Se placeholder não encontrado, adiciona ao final
@@ -231,10 +284,16 @@ def json2docx(
                     except Exception:
                         pr.add_run("[imagem]")
 
-    Path(out_docx).parent.mkdir(parents=True, exist_ok=True)
+    seq.next("escrita")
+    if isinstance(out_docx, (str, Path)):
+        Path(out_docx).parent.mkdir(parents=True, exist_ok=True)
     doc.save(out_docx)
+    if stats.active() is not None:
+        stats.count("bytes", Path(out_docx).stat().st_size if isinstance(out_docx, (str, Path)) else out_docx.tell())
+    seq.end()
+    report_progress(progress, total, total)
     return 0
 
 # Backward compat para seu GUI
-def jsons_to_docx(json_paths, template, out_docx, placeholder='{{QUESTOES}}', title='Prova', num=None, seed=None, shuffle=True):
-    return json2docx(json_paths, template, out_docx, placeholder=placeholder, title=title, num=num, seed=seed, shuffle=shuffle)
\ No newline at end of file
+def jsons_to_docx(json_paths, template, out_docx, placeholder='{{QUESTOES}}', title='Prova', num=None, seed=None, shuffle=True, cancel=None, progress=None, questions=None, variant=0, exclude_duplicates=False, unique_variants=False):
+    return json2docx(json_paths, template, out_docx, placeholder=placeholder, title=title, num=num, seed=seed, shuffle=shuffle, cancel=cancel, progress=progress, questions=questions, variant=variant, exclude_duplicates=exclude_duplicates, unique_variants=unique_variants)
\ No newline at end of file
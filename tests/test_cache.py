@@ -0,0 +1,34 @@
+import json, os
+from core.cache import DatasetCache
+
+def test_dataset_cache_parses_once_and_hands_out_copies(tmp_path):
+    p = tmp_path / "banco.json"
+    p.write_text(json.dumps([{"id": 2, "enunciado": "B", "alternativas": ["x"], "correta": "y"},
+                             {"id": 1, "enunciado": "A", "alternativas": ["x"], "correta": "x"}]), encoding="utf-8")
+    cache = DatasetCache()
+    ds = cache.load(p)
+    assert len(ds["questions"]) == 2
+    qs = cache.merged_questions([p, p], renumber=True)
+    assert [q["id"] for q in qs] == [1, 2, 3, 4]
+    assert cache.misses == 1 and cache.hits == 2
+    qs[0]["enunciado"] = "alterado"
+    assert cache.questions(p)[1]["enunciado"] == "A"
+
+    p.write_text(json.dumps([{"id": 1, "enunciado": "novo"}]), encoding="utf-8")
+    st = os.stat(p)
+    os.utime(p, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+    assert not cache.is_fresh(p)
+    assert cache.questions(p)[0]["enunciado"] == "novo"
+    assert cache.misses == 2
+
+
+def test_cached_banks_share_repeated_strings(tmp_path):
+    p = tmp_path / "banco.json"
+    p.write_text(json.dumps([{"id": i, "enunciado": f"Q{i}", "alternativas": ["Apenas I e II", "Apenas I"],
+                              "correta": "Todas estão corretas"} for i in range(3)]), encoding="utf-8")
+    cache = DatasetCache()
+    a, b = cache.raw(p)[0], cache.raw(p)[2]
+    assert a["alternativas"][0] is b["alternativas"][0] and a["correta"] is b["correta"]
+    qs = cache.merged_questions([p, p])
+    assert qs[0]["correta"] is qs[5]["correta"] is a["correta"]
+    assert cache.load(p)["questions"][1]["correct_index"] == 2
@@ -0,0 +1,26 @@
+# -*- coding: utf-8 -*-
+import json
+import shutil
+from pathlib import Path
+
+import cli
+
+ASSETS = Path(__file__).resolve().parent.parent / "assets"
+
+
+def test_preview_batch_summary(tmp_path, capsys):
+    for name in ("a.json", "b.json"):
+        shutil.copy(ASSETS / "questoes_template.json", tmp_path / name)
+    rc = cli.main(["preview", str(tmp_path / "a.json"), str(tmp_path / "b.json"), "--out-dir", str(tmp_path / "out")])
+    summary = json.loads(capsys.readouterr().out)
+    assert rc == 0 and summary["ok"] == 2 and summary["failed"] == 0
+    outs = [r["output"] for r in summary["results"]]
+    assert outs == [str(tmp_path / "out" / "a_preview.txt"), str(tmp_path / "out" / "b_preview.txt")]
+    assert all(Path(o).read_text(encoding="utf-8") for o in outs)
+
+
+def test_failed_job_sets_exit_code(tmp_path, capsys):
+    rc = cli.main(["preview", str(tmp_path / "nao_existe.json")])
+    summary = json.loads(capsys.readouterr().out)
+    assert rc == cli.EXIT_FAILED
+    assert summary["results"][0]["status"] == "error"
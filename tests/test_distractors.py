@@ -0,0 +1,39 @@
+# -*- coding: utf-8 -*-
+import pytest
+
+from core.utils import mathx
+from core.utils.mathx import distractors
+from core.variables import resolve_all, variant_distractors
+
+Q = {
+    "id": 3, "tipo": 3, "enunciado": "Quanto é <A> × <B>?",
+    "variaveis": {"A": {"min": 0, "max": 20, "step": 1}, "B": {"min": 0, "max": 20, "step": 1}},
+    "resolucoes": {"R": "A * B"}, "correta": "<R>", "alternativas": ["<R>", "<R*1>"], "distratores": 4,
+}
+
+
+def test_k_distinct_wrong_answers_always():
+    values = [0, 1, -1, 0.5, 1 / 3, 12, 1e6, -0.004, 99.995]
+    for k in (1, 4, 9):
+        for x, row in zip(values, distractors(values, k, strategies=["sinal"])):
+            assert len(row) == k == len(set(row))
+            assert round(x, 2) not in row
+
+
+def test_single_variant_matches_batch():
+    rows = variant_distractors(Q, seed=7, variants=range(50))
+    for v in (0, 13, 49):
+        q, env = resolve_all(Q, seed=7, variant=v)
+        assert q["correta"] not in q["alternativas"]          # colisão à mão foi descartada
+        assert len(q["alternativas"]) == 4 and sorted(q["alternativas"]) == sorted(rows[v])
+
+
+def test_numpy_path_matches_fallback():
+    pytest.importorskip("numpy")
+    # empates na 2ª casa (303.195, 1.115...): np.round e round(x, 2) do Python discordam neles
+    values = [3.0, 0.0, -2.5, 1 / 7, 1234.5, 303.195, -731.295, 1.005, 2.675, 1.115, 0.045, 1e17, -3e-310]
+    values += [round(x / 1000, 3) + 0.0005 for x in range(-20000, 20000, 7)]
+    keys = list(range(11, 11 + len(values)))
+    for strategies in (None, ["arredondamento"]):
+        transforms = mathx._transforms(strategies)
+        assert mathx._distractors_np(values, 4, transforms, keys) == mathx._distractors_py(values, 4, transforms, keys)
@@ -0,0 +1,42 @@
+# -*- coding: utf-8 -*-
+import json
+import unicodedata
+
+from core import load_quiz
+from core.cache import DatasetCache
+from core.fingerprint import compute_fingerprint, strip_fingerprint
+
+Q = {"id": 1, "enunciado": "Qual é a capital?", "alternativas": ["Rio", "Recife"], "correta": "Brasília"}
+
+
+def test_fingerprint_is_canonical():
+    fp = compute_fingerprint(Q)
+    reordered = {"correta": "Brasília", "alternativas": ["Rio", "Recife"], "id": 42,
+                 "enunciado": "  Qual  " + unicodedata.normalize("NFD", "é") + " a\ncapital? "}
+    assert compute_fingerprint(reordered) == fp
+    assert compute_fingerprint(dict(Q, _base_dir="/x")) == fp
+    assert compute_fingerprint(dict(Q, correta="Salvador")) != fp
+    assert compute_fingerprint(dict(Q, alternativas=["Recife", "Rio"])) != fp
+
+
+def test_load_quiz_keeps_fingerprint_and_dedups_across_files(tmp_path):
+    (tmp_path / "a.json").write_text(json.dumps([Q, dict(Q, id=2, enunciado="Outra?")]), encoding="utf-8")
+    (tmp_path / "b.json").write_text(json.dumps([dict(Q, id=9)]), encoding="utf-8")
+    qs = load_quiz(tmp_path)["questions"]
+    assert len(qs) == 3 and qs[0]["_fingerprint"] == qs[2]["_fingerprint"] == compute_fingerprint(Q)
+    assert [q["id"] for q in load_quiz(tmp_path, dedup_questions=True)["questions"]] == [1, 2]
+    assert "_fingerprint" not in strip_fingerprint(qs[0])
+
+    merged = DatasetCache().merged_questions([tmp_path / "a.json", tmp_path / "b.json"], dedup_questions=True)
+    assert [q["id"] for q in merged] == [1, 2]
+
+
+def test_merged_dedup_fingerprints_after_normalizing(tmp_path):
+    alt_k = {"id": 5, "enunciado": "Grade?", "alternativas;2": ["a", "b", "c"], "correta": "d"}
+    plain = {"id": 6, "enunciado": "Grade?", "alternativas": ["a", "b", "c"], "alternativas_firstrow": 2, "correta": "d"}
+    (tmp_path / "a.json").write_text(json.dumps([alt_k]), encoding="utf-8")
+    (tmp_path / "b.json").write_text(json.dumps([plain]), encoding="utf-8")
+    assert [q["id"] for q in load_quiz(tmp_path, dedup_questions=True)["questions"]] == [5]
+    merged = DatasetCache().merged_questions([tmp_path / "a.json", tmp_path / "b.json"], dedup_questions=True)
+    assert [q["id"] for q in merged] == [5]
+    assert merged[0]["_fingerprint"] == load_quiz(tmp_path)["questions"][0]["_fingerprint"]
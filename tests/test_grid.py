@@ -0,0 +1,77 @@
+# -*- coding: utf-8 -*-
+import itertools
+
+import pytest
+
+from core.grid import GridExhausted, UniqueSampler, VariableGrid, check_unique_capacity
+from core.permute import FeistelPermutation
+from core.variables import resolve_all
+
+VARS = {"A": {"min": 1, "max": 5, "step": 1}, "B": {"min": 0, "max": 1, "step": 0.5}, "C": {"min": 10, "max": 30, "step": 10}}
+
+
+def test_permutation_covers_range():
+    for n in (0, 1, 2, 7, 100, 1000):
+        assert sorted(FeistelPermutation(n, key=123)) == list(range(n))
+    assert list(FeistelPermutation(100, 1)) != list(FeistelPermutation(100, 2))
+
+
+def test_grid_is_lazy_cartesian_product():
+    grid = VariableGrid(VARS)
+    assert len(grid) == 5 * 3 * 3
+    expected = [dict(zip("ABC", t)) for t in itertools.product([1, 2, 3, 4, 5], [0, 0.5, 1], [10, 20, 30])]
+    assert list(grid) == expected
+    huge = VariableGrid({f"X{i}": {"min": 0, "max": 999, "step": 1} for i in range(8)})
+    assert huge.size == 1000 ** 8 and huge[huge.size - 1] == {f"X{i}": 999 for i in range(8)}
+
+
+def test_unique_sampler_hands_out_distinct_combinations():
+    s = UniqueSampler(VARS, seed=3, qid=7)
+    combos = [tuple(c.values()) for c in s.take(len(s))]
+    assert len(set(combos)) == len(s) == 45
+    assert s[10] == dict(zip("ABC", combos[10]))
+    with pytest.raises(GridExhausted):
+        list(s.take(46))
+    with pytest.raises(GridExhausted):
+        check_unique_capacity([{"id": 7, "variaveis": VARS}], 46)
+
+
+def test_resolve_all_unique_variants():
+    q = {"id": 2, "tipo": 3, "enunciado": "<A> e <B>", "variaveis": VARS, "resolucoes": {"R": "A + B"},
+         "correta": "<R>", "alternativas": []}
+    envs = {tuple(resolve_all(q, seed=1, variant=v, unique=True)[1].values()) for v in range(45)}
+    assert len(envs) == 45
+    with pytest.raises(GridExhausted):
+        resolve_all(q, seed=1, variant=45, unique=True)
+
+
+def test_axes_hold_distinct_in_range_values():
+    odd = {"A": {"min": 0.1, "max": 0.5, "step": 0.2}, "B": {"min": 0, "max": 11, "step": 3}}
+    grid = VariableGrid(odd)
+    assert grid.size == 3 * 4
+    assert sorted({c["A"] for c in grid}) == [0.1, 0.3, 0.5]
+    assert sorted({c["B"] for c in grid}) == [0, 3, 6, 9]
+    s = UniqueSampler(odd, seed=1, qid=1)
+    assert len({tuple(c.values()) for c in s.take(len(s))}) == 12
+
+
+def test_zero_step_names_the_variable():
+    with pytest.raises(ValueError, match="'B'"):
+        VariableGrid({"A": {"min": 0, "max": 3, "step": 1}, "B": {"min": 0, "max": 1, "step": 0}})
+
+
+def test_cli_checks_unique_capacity_before_running(tmp_path, capsys):
+    import json
+    import cli
+    bank = tmp_path / "banco.json"
+    bank.write_text(json.dumps([{"id": 4, "tipo": 3, "enunciado": "<A>", "variaveis": {"A": {"min": 1, "max": 3, "step": 1}},
+                                 "resolucoes": {"R": "A"}, "correta": "<R>", "alternativas": []}]), encoding="utf-8")
+    rc = cli.main(["json2docx", str(bank), "--seed", "1", "--variants", "4", "--unique-variants"])
+    out = capsys.readouterr()
+    assert rc == cli.EXIT_FAILED and out.out == ""
+    assert "Questão 4: 4 variantes pedidas" in out.err
+    assert not list(tmp_path.glob("*.docx"))
+
+    from testgen.generator import json2docx
+    with pytest.raises(GridExhausted):
+        json2docx([str(bank)], "nao_usado.docx", str(tmp_path / "p.docx"), seed=1, variant=3, unique_variants=True)
@@ -0,0 +1,89 @@
+import threading, time
+from gui.jobs import JobScheduler, DONE, CANCELLED, FAILED
+
+class _FakeWidget:
+    def after(self, ms, fn):
+        pass
+
+def _wait(job):
+    for _ in range(200):
+        if job.state in (DONE, CANCELLED, FAILED):
+            return
+        time.sleep(0.01)
+
+def test_scheduler_states_and_cancellation():
+    events = []
+    sched = JobScheduler(_FakeWidget(), on_event=lambda k, j, p: events.append((k, j.name if j else None, p)))
+    gate = threading.Event()
+
+    def work(job, n):
+        for i in range(n):
+            job.token.check()
+            job.progress(i + 1, n)
+            gate.wait(0.01)
+        job.log("fim")
+
+    ok = sched.submit("ok", work, 3)
+    _wait(ok)
+    slow = sched.submit("lento", work, 10_000)
+    sched.cancel(slow.id)
+    _wait(slow)
+    bad = sched.submit("ruim", lambda job: 1 / 0)
+    _wait(bad)
+    sched._drain()
+    assert (ok.state, slow.state, bad.state) == (DONE, CANCELLED, FAILED)
+    assert ok.done == ok.total == 3
+    assert ("log", "ok", "fim") in events
+    sched.shutdown()
+
+def test_profile_next_wraps_only_the_next_job(tmp_path):
+    from core.profiling import ProfileNext
+    sched = JobScheduler(_FakeWidget(), on_event=lambda k, j, p: None)
+    sched.profiler = ProfileNext()
+    sched.profiler.arm(tmp_path)
+    sched.collect_stats = True
+
+    def work(job):
+        from core import stats
+        with stats.stage("trabalho"):
+            sum(i * i for i in range(10_000))
+
+    first = sched.submit("Slides .tex", work)
+    second = sched.submit("Prova .docx", work)
+    _wait(first)
+    _wait(second)
+    assert first.profile is not None and first.profile.path.exists()
+    assert first.profile.path.name.startswith("slides_tex_") and "work" in first.profile.summary
+    assert second.profile is None and not sched.profiler.armed
+    assert list(first.report.stages) == list(second.report.stages) == ["trabalho"]
+    sched.shutdown()
+
+def test_app_window_builds(monkeypatch, tmp_path):
+    import pytest
+    tk = pytest.importorskip("tkinter")
+    try:
+        root = tk.Tk()
+    except tk.TclError:
+        pytest.skip("sem display")
+    monkeypatch.chdir(tmp_path)
+    from gui.app_window import App
+    try:
+        app = App(root)
+        root.update_idletasks()
+        assert app.jobs.profiler is app.profile_next
+        app.jobs.shutdown()
+    finally:
+        root.destroy()
+
+def test_profile_refuses_concurrent_capture(tmp_path):
+    from core.profiling import profile
+    ran = []
+    with profile(tmp_path / "a.pstats") as outer:
+        with profile(tmp_path / "b.pstats") as inner:
+            ran.append("inner")
+    assert ran == ["inner"]
+    assert not outer.skipped and outer.path.exists()
+    assert inner.skipped and not inner.path.exists()
+    with profile(tmp_path / "c.pstats") as again:      # o lock foi liberado
+        pass
+    assert not again.skipped and again.path.exists()
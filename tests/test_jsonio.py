@@ -0,0 +1,48 @@
+# -*- coding: utf-8 -*-
+import pytest
+
+from core import jsonio
+from core.loader import load_quiz
+
+DATA = [{"id": 1, "enunciado": "Ação em °C — ok", "alternativas": ["a", "b"], "variaveis": {"A": {"min": 1.5}}}]
+
+
+@pytest.fixture(params=sorted(jsonio.BACKENDS))
+def backend(request):
+    previous = jsonio.use(request.param)
+    yield request.param
+    jsonio.use(previous)
+
+
+def test_roundtrip_and_output_modes(backend):
+    compact = jsonio.dumps(DATA)
+    assert "Ação" in compact and ": " not in compact and jsonio.loads(compact) == DATA
+    assert jsonio.loads(jsonio.dumps_bytes(DATA)) == DATA
+    pretty = jsonio.dumps(DATA, pretty=True)
+    assert pretty.splitlines()[1] == "  {" and jsonio.loads(pretty) == DATA
+    assert jsonio.dumps({"b": 1, "a": 2}, sort_keys=True) == '{"a":2,"b":1}'
+    assert jsonio.loads(jsonio.dumps({"n": 2 ** 70})) == {"n": 2 ** 70}     # fora do orjson: stdlib
+    with pytest.raises(jsonio.JSONDecodeError):
+        jsonio.loads("{nope")
+
+
+def test_clone_bom_and_loader(backend, tmp_path):
+    c = jsonio.clone(DATA)
+    assert c == DATA and c[0] is not DATA[0] and c[0]["alternativas"] is not DATA[0]["alternativas"]
+    p = tmp_path / "banco.json"
+    p.write_bytes(b"\xef\xbb\xbf" + jsonio.dumps_bytes(DATA, pretty=True))   # salvo pelo Bloco de Notas
+    assert load_quiz(str(p), resolve_vars=False)["questions"][0]["enunciado"] == DATA[0]["enunciado"]
+
+
+def test_canonical_does_not_depend_on_backend():
+    assert jsonio.canonical({"b": [1.0, 1e16], "a": "é"}) == '{"a":"é","b":[1.0,1e+16]}'
+
+
+def test_non_finite_floats_behave_like_stdlib(backend):
+    import math
+    data = jsonio.loads(b'{"x": NaN, "y": [Infinity, -Infinity], "z": null}')
+    assert math.isnan(data["x"]) and data["y"] == [math.inf, -math.inf] and data["z"] is None
+    c = jsonio.clone(data)
+    assert math.isnan(c["x"]) and c["y"] == [math.inf, -math.inf] and c["z"] is None
+    assert jsonio.dumps(data) == '{"x":NaN,"y":[Infinity,-Infinity],"z":null}'
+    assert jsonio.dumps({"z": None, "w": 1.5}) == '{"z":null,"w":1.5}'
@@ -0,0 +1,24 @@
+# -*- coding: utf-8 -*-
+import tracemalloc
+
+from beamer.generator import json2beamer
+from benchmarks.synth import write_bank
+from core import memprof, stats
+
+
+def test_memory_report_per_stage(tmp_path):
+    bank = write_bank(tmp_path / "banco.json", 50, seed=1)
+    out = tmp_path / "slides.tex"
+    with memprof.collect_memory(top=3) as rep:
+        json2beamer(input_json=str(bank), output_tex=str(out), shuffle_seed=1)
+        with stats.stage("pico"):
+            blob = bytearray(4 * 2 ** 20)
+            del blob
+    assert not tracemalloc.is_tracing()
+    mem = rep.memory
+    assert list(mem)[:2] == ["carga", "carga/leitura"]
+    assert mem["carga"]["peak_bytes"] >= mem["carga/normalização"]["peak_bytes"] > 0
+    assert mem["carga"]["top"] and len(mem["latex"]["top"]) <= 3
+    assert not mem["carga/normalização/resolução"]["top"]        # repetida por questão: sem snapshot
+    assert mem["pico"]["peak_bytes"] >= 4 * 2 ** 20 and rep.peak_bytes >= mem["pico"]["peak_bytes"]
+    assert "Memória (tracemalloc)" in rep.save(memprof.report_path(out)).read_text(encoding="utf-8")
@@ -0,0 +1,30 @@
+# -*- coding: utf-8 -*-
+import dataclasses
+
+import pytest
+
+from core.models import EMPTY, EMPTY_MAP, Question
+
+QS = [
+    {"id": 1, "enunciado": " Quanto é 2+2? ", "alternativas": ["4", "5"], "correta": "4", "dificuldade": "fácil"},
+    {"id": 2, "enunciado": "Figura", "imagens": ["fig.png;40x30"], "alternativas": ["a.png", "b.png"], "correta": "a.png"},
+    {"id": 3, "enunciado": "x = <x>", "variaveis": {"x": [1, 2]}, "resolucoes": {"y": "x*2"},
+     "alternativas": ["<y>"], "correta": "<y>", "obs": ["nota"]},
+]
+
+
+def test_question_is_slotted_frozen_and_shares_sentinels():
+    a, b = Question.from_dict(QS[0]), Question.from_dict(QS[1])
+    assert not hasattr(a, "__dict__")
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        a.id = 9
+    assert a.imagens is EMPTY and a.obs is b.obs is EMPTY
+    assert a.variaveis is b.variaveis is EMPTY_MAP
+    assert a.to_dict()["imagens"] == [] and a.to_dict()["alternativas"] == ["4", "5"]
+
+
+def test_sentinels_survive_pickle():
+    import pickle
+    q = pickle.loads(pickle.dumps(Question.from_dict(QS[0])))
+    assert q.variaveis is EMPTY_MAP and q.imagens is EMPTY
+    assert q == Question.from_dict(QS[0])
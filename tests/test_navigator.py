@@ -0,0 +1,18 @@
+from editor.navigator import QuestionIndex, SNIPPET_LEN
+
+def test_question_index_views_and_jump():
+    qs = [
+        {"id": 1, "tipo": 1, "dificuldade": "fácil", "enunciado": "A" * 200},
+        {"id": 2, "tipo": 3, "dificuldade": "média", "enunciado": "Valor <X>", "variaveis": {"X": {}}},
+        {"id": 3, "tipo": 1, "dificuldade": "média", "enunciado": "linha\nquebrada"},
+    ]
+    idx = QuestionIndex(qs)
+    assert len(idx) == 3
+    assert len(idx.rows[0][3]) == SNIPPET_LEN
+    assert idx.rows[2][3] == "linha quebrada"
+    assert idx.position_of_id(" 3 ") == 2
+    assert idx.position_of_id(99) is None
+    assert idx.view(tipo=1) == [0, 2]
+    assert idx.view(tipo=1, dificuldade="média") == [2]
+    assert idx.view() == [0, 1, 2]
+    assert idx.difficulties() == ["fácil", "média"]
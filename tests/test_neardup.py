@@ -0,0 +1,44 @@
+# -*- coding: utf-8 -*-
+import json
+import random
+
+import cli
+from core.neardup import drop_near_duplicates, find_near_duplicates, shingles
+
+WORDS = "massa energia força velocidade tempo corpo carga campo onda raio".split()
+
+
+def _bank(n, seed=1):
+    rnd = random.Random(seed)
+    return [{"id": i, "enunciado": " ".join(f"{rnd.choice(WORDS)}{rnd.randrange(500)}" for _ in range(20)),
+             "alternativas": ["10 N", "20 N", "30 N"], "correta": "40 N"} for i in range(1, n + 1)]
+
+
+def test_reworded_copy_is_clustered():
+    qs = _bank(500)
+    copy = dict(qs[10], id=999, alternativas=["30 N", "10 N", "20 N"])
+    words = copy["enunciado"].split()
+    words[4] = "Cálculo"
+    copy["enunciado"] = " ".join(words).upper()
+    qs.append(copy)
+    clusters = find_near_duplicates(qs)
+    assert [c.members for c in clusters] == [(10, 500)]
+    assert 0.6 <= clusters[0].similarity < 1
+    assert len(drop_near_duplicates(qs, clusters)) == 500
+
+
+def test_normalization_ignores_accents_and_case():
+    a = {"enunciado": "Qual é a velocidade média?", "alternativas": ["Fácil"]}
+    b = {"enunciado": "qual E A VELOCIDADE media", "alternativas": ["facil"]}
+    assert shingles(a) == shingles(b)
+
+
+def test_cli_duplicates_report(tmp_path, capsys):
+    qs = _bank(30)
+    (tmp_path / "a.json").write_text(json.dumps({"questions": qs[:20]}), encoding="utf-8")
+    (tmp_path / "b.json").write_text(json.dumps({"questions": qs[15:] + [dict(qs[3], id=77)]}), encoding="utf-8")
+    rc = cli.main(["duplicates", str(tmp_path / "a.json"), str(tmp_path / "b.json")])
+    report = json.loads(capsys.readouterr().out)
+    assert rc == 0 and report["questions"] == 36
+    files = sorted({m["file"] for c in report["clusters"] for m in c["members"]})
+    assert len(report["clusters"]) == 6 and files == ["a.json", "b.json"]
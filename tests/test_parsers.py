@@ -0,0 +1,19 @@
+# -*- coding: utf-8 -*-
+import core.parsers as parsers
+from core.models import QuestionKind
+
+RAW = [
+    {"tipo": 1, "enunciado": "a", "alternativas": ["x", "y ", " z"], "correta": "z"},
+    {"tipo": 4, "enunciado": "b", "afirmacoes": {"I": "u", "II": "v"}, "alternativas": ["Apenas I"], "correta": "Apenas II"},
+    {"type": "type2", "prompt": "p", "answer": "V"},
+    {"tipo": 3, "enunciado": "c", "alternativas": ["1", " 2 "], "correta": "2"},
+]
+
+
+def test_to_ir_dispatches_each_kind():
+    ir = parsers.to_ir(RAW, title="T")
+    assert [q.id for q in ir.questions] == [1, 2, 3, 4]
+    assert [q.kind for q in ir.questions] == [QuestionKind.TYPE1, QuestionKind.TYPE4, QuestionKind.TYPE2, QuestionKind.TYPE3]
+    assert [c.is_correct for c in ir.questions[0].choices] == [False, False, True]
+    assert [c.text for c in ir.questions[1].choices] == ["Apenas I", "Apenas II"]
+    assert [c.is_correct for c in ir.questions[3].choices] == [False, True]
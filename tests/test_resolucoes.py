@@ -0,0 +1,35 @@
+# -*- coding: utf-8 -*-
+import pytest
+
+from core.validate import validate_question
+from core.variables import compile_resolucoes, resolve_all
+
+Q = {
+    "id": 1, "tipo": 3, "enunciado": "Divida <A> por 3 e multiplique por 3.",
+    "variaveis": {"A": {"min": 1, "max": 1, "step": 1}},
+    # declarada fora de ordem: T depende de R, que vem depois
+    "resolucoes": {"T": "<R> * 3", "R": "<A> / 3"},
+    "correta": "<T>", "alternativas": ["<T+1>", "<R>"],
+}
+
+
+def test_resolucoes_full_precision_and_dependency_order():
+    q, env = resolve_all(Q, seed=1)
+    assert env["R"] == pytest.approx(1 / 3) and env["T"] == pytest.approx(1.0)
+    assert q["correta"] == "1" and q["alternativas"] == ["2", "0.33"]   # formata só na substituição
+    assert list(env) == ["A", "T", "R"]
+
+
+def test_compiled_once_per_definition():
+    key = (("A",), (("R", "A/3"), ("T", "R*3")))
+    c = compile_resolucoes(*key)
+    assert c is compile_resolucoes(*key) and c.order == ("R", "T")
+    assert c({"A": 6.0}) == {"R": 2.0, "T": 6.0}
+
+
+def test_cycles_and_unknown_names_are_reported():
+    with pytest.raises(ValueError, match="circular"):
+        compile_resolucoes(("A",), (("X", "Y + A"), ("Y", "X * 2")))
+    bad = dict(Q, resolucoes={"X": "<Y> + 1", "Y": "X * 2"})
+    assert any("circular" in i.message for i in validate_question(bad))
+    assert not validate_question(Q)
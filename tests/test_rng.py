@@ -0,0 +1,77 @@
+# -*- coding: utf-8 -*-
+from core import load_quiz
+from core.models import RenderOptions
+from core.pipeline import render_all
+from core.rng import CounterRandom, derive_key, rng_for
+from core.variables import resolve_all
+
+T3 = {
+    "id": 7, "tipo": 3, "enunciado": "Quanto é <A> + <B>?",
+    "variaveis": {"A": {"min": 1, "max": 1000, "step": 1}, "B": {"min": 1, "max": 1000, "step": 1}},
+    "resolucoes": {"R": "A + B"}, "correta": "<R>", "alternativas": ["<R+1>", "<R-1>", "<R+2>"],
+}
+
+
+def test_counter_random_is_addressable():
+    a = CounterRandom(derive_key(42, 3, 7, "x"))
+    seq = [a.random() for _ in range(10)]
+    b = CounterRandom(derive_key(42, 3, 7, "x"))
+    b.jump(6)
+    assert b.random() == seq[6] and b.counter == 7
+    st = a.getstate()
+    x = a.getrandbits(100)
+    a.setstate(st)
+    assert a.getrandbits(100) == x and x < (1 << 100)
+
+
+def test_streams_are_independent():
+    base = [rng_for(1, 0, 7, "a").random() for _ in range(3)]
+    assert base == [rng_for(1, 0, 7, "a").random() for _ in range(3)]
+    for other in (rng_for(1, 1, 7, "a"), rng_for(1, 0, 8, "a"), rng_for(1, 0, 7, "b"), rng_for(2, 0, 7, "a")):
+        assert other.random() != base[0]
+    items = list(range(50))
+    rng_for(9, 4, None, "ordem").shuffle(items)
+    assert sorted(items) == list(range(50)) and items != list(range(50))
+
+
+def test_variants_differ_under_same_seed():
+    r0 = resolve_all(T3, seed=5, variant=0)[1]
+    assert r0 == resolve_all(T3, seed=5, variant=0)[1]
+    assert any(resolve_all(T3, seed=5, variant=v)[1] != r0 for v in range(1, 4))
+
+    qs = lambda v: load_quiz({"questions": [dict(T3)]}, shuffle_seed=5, variant=v)["questions"][0]
+    assert qs(2) == qs(2)
+    assert any(qs(v)["enunciado"] != qs(0)["enunciado"] for v in range(1, 4))
+
+
+def test_variant_is_independent_of_batch():
+    raw = [dict(T3, id=i) for i in range(1, 21)]
+    opts = RenderOptions(target="testgen", shuffle_questions=True, shuffle_alternatives=True, seed=3, variant=2)
+    full = {rq.id: rq for rq in render_all(raw, opts)}
+    # a questão 5 sai igual renderizada sozinha: não depende das que vieram antes
+    alone = render_all([raw[4]], opts)[0]
+    assert alone == full[5]
+
+
+def test_questions_without_or_sharing_ids_get_their_own_streams():
+    mcq = lambda: [{"tipo": 1, "enunciado": f"Pergunta {i}?", "correta": "a", "alternativas": ["b", "c", "d"]}
+                   for i in range(6)]
+    orders = lambda: [q["alternativas"] for q in load_quiz({"questions": mcq()}, shuffle_seed=1)["questions"]]
+    assert len({tuple(o) for o in orders()}) > 1
+    assert orders() == orders()
+
+    t3 = [dict(T3, id=1, enunciado=f"Questão {i}: quanto é <A> + <B>?") for i in range(6)]
+    values = [resolve_all(q, seed=5)[1]["A"] for q in t3]
+    assert len(set(values)) > 1
+
+
+def test_pipeline_matches_load_quiz():
+    # enunciado com espaço nas pontas + distratores: o que o to_dict() da Question perdia
+    raw = lambda: dict(T3, enunciado="  Quanto é <A> + <B>?  ", alternativas=["<R+1>"], distratores=3)
+    for v in range(4):
+        opts = RenderOptions(target="testgen", shuffle_alternatives=True, seed=5, variant=v)
+        rq = render_all([raw()], opts)[0]
+        lq = load_quiz({"questions": [raw()]}, shuffle_seed=5, variant=v)["questions"][0]
+        assert rq.enunciado == lq["enunciado"].strip()
+        assert rq.correta == lq["correta"]
+        assert list(rq.alternativas) == lq["alternativas"] and len(rq.alternativas) == 4
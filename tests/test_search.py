@@ -0,0 +1,26 @@
+from core.search import SearchIndex, fold
+
+def test_fold_and_prefix_search():
+    assert fold("Pressão Hidrostática") == "pressao hidrostatica"
+    idx = SearchIndex()
+    idx.build([
+        ("a", {"tipo": 1, "dificuldade": "fácil", "enunciado": "Pressão hidrostática", "alternativas": ["Termopar"]}),
+        ("b", {"tipo": 4, "dificuldade": "média", "enunciado": "Analise", "afirmacoes": {"I": "Pressão absoluta"}}),
+        ("c", {"tipo": 1, "dificuldade": "média", "enunciado": "Sensores", "obs": ["termistor NTC"]}),
+    ])
+    assert idx.search("pressao") == {"a", "b"}
+    assert idx.search("PRESS abs") == {"b"}
+    assert idx.search("term") == {"a", "c"}
+    assert idx.search("term", tipo=1, dificuldade="média") == {"c"}
+    assert idx.search("inexistente") == set()
+
+def test_incremental_update_and_remove():
+    idx = SearchIndex()
+    q = {"enunciado": "velocidade"}
+    idx.update(1, q)
+    q["enunciado"] = "aceleração"
+    idx.update(1, q)
+    assert idx.search("veloc") == set()
+    assert idx.search("acelera") == {1}
+    idx.remove(1)
+    assert idx.search("") == set() and len(idx) == 0
@@ -0,0 +1,50 @@
+# -*- coding: utf-8 -*-
+import json
+import threading
+import urllib.error
+import urllib.request
+from pathlib import Path
+
+import pytest
+
+import server
+
+ASSETS = Path(__file__).resolve().parent.parent / "assets"
+
+
+@pytest.fixture()
+def base_url():
+    service = server.GenerationService([str(ASSETS / "questoes_template.json")],
+                                       [str(ASSETS / "template_prova.docx")], jobs=1)
+    httpd = server.make_server(service, port=0)
+    t = threading.Thread(target=httpd.serve_forever, daemon=True)
+    t.start()
+    yield f"http://{server.HOST}:{httpd.server_address[1]}"
+    httpd.shutdown()
+    httpd.server_close()
+    service.close()
+
+
+def _post(url, body):
+    req = urllib.request.Request(url, data=json.dumps(body).encode(), method="POST",
+                                 headers={"Content-Type": "application/json"})
+    with urllib.request.urlopen(req, timeout=30) as r:
+        return r.headers, r.read()
+
+
+def test_banks_and_cached_slides(base_url):
+    with urllib.request.urlopen(base_url + "/banks", timeout=10) as r:
+        info = json.loads(r.read())
+    assert info["banks"][0]["name"] == "questoes_template"
+
+    h1, tex1 = _post(base_url + "/slides", {"bank": "questoes_template", "seed": 7})
+    h2, tex2 = _post(base_url + "/slides", {"bank": "questoes_template", "seed": 7})
+    assert b"\\documentclass" in tex1
+    assert tex1 == tex2
+    assert (h1["X-Cache"], h2["X-Cache"]) == ("MISS", "HIT")
+
+
+def test_unknown_bank_is_404(base_url):
+    with pytest.raises(urllib.error.HTTPError) as ei:
+        _post(base_url + "/exam", {"bank": "nao_existe", "seed": 1})
+    assert ei.value.code == 404
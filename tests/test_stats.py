@@ -0,0 +1,38 @@
+# -*- coding: utf-8 -*-
+from beamer.generator import json2beamer
+from benchmarks.synth import write_bank
+from core import stats
+from core.loader import load_quiz
+
+
+def test_disabled_is_a_no_op():
+    assert stats.active() is None
+    with stats.stage("x"):
+        stats.count("questoes")
+    seq = stats.sequence()
+    seq.next("a")
+    seq.end()
+    assert stats.active() is None
+
+
+def test_json2beamer_report(tmp_path):
+    bank = write_bank(tmp_path / "banco.json", 60, seed=2, images=True)
+    out = tmp_path / "slides.tex"
+    with stats.collect() as rep:
+        json2beamer(input_json=str(bank), output_tex=str(out), shuffle_seed=1)
+    assert list(rep.stages)[:1] == ["carga"] and {"latex", "escrita"} <= set(rep.stages)
+    assert "carga/normalização/resolução" in rep.stages and rep.calls["carga/normalização/resolução"] == 60
+    assert rep.counters["questoes"] == 60 and rep.counters["bytes"] == out.stat().st_size
+    assert rep.counters["imagens"] > 0 and rep.counters["expressoes"] > 0
+    assert "latex" in rep.format() and stats.active() is None
+
+
+def test_nested_collect_and_load_quiz(tmp_path):
+    bank = write_bank(tmp_path / "banco.json", 10)
+    with stats.collect() as outer:
+        with stats.stage("tarefa"):
+            with stats.collect() as inner:
+                load_quiz(str(bank))
+    assert set(inner.stages) == {"leitura", "normalização", "normalização/resolução"}
+    assert list(outer.stages) == ["tarefa"] and not outer.counters
+    assert inner.to_dict()["counters"]["questoes"] == 10
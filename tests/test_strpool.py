@@ -0,0 +1,33 @@
+# -*- coding: utf-8 -*-
+import json
+
+from core.loader import load_quiz
+from core.strpool import StringPool
+
+ALTS = ["Apenas I e II", "Apenas I e III", "Todas estão corretas"]
+
+
+def _bank(n):
+    # json.loads garante instâncias distintas para textos iguais
+    return json.loads(json.dumps([
+        {"id": i, "enunciado": f"Q{i}", "dificuldade": "média", "afirmacoes": {"I": "a", "II": "b"},
+         "alternativas": ALTS + [" Apenas I e II "], "correta": "Apenas I e II"}
+        for i in range(1, n + 1)
+    ]))
+
+
+def test_pool_shares_instances_and_keys():
+    pool = StringPool()
+    a, b = pool.intern("".join(["x", " "])), pool.intern("x ")
+    assert a is b and pool.hits == 1
+    assert pool.key(" Apenas I ") == "Apenas I"
+    assert pool.key(" Apenas I ") is pool.key(pool.intern(" Apenas I "))
+
+
+def test_load_quiz_interned_matches_plain():
+    plain = load_quiz(_bank(20))["questions"]
+    interned = load_quiz(_bank(20), intern_strings=True)["questions"]
+    assert plain == interned
+    assert interned[0]["alternativas"][0] is interned[1]["alternativas"][0]
+    assert interned[0]["dificuldade"] is interned[19]["dificuldade"]
+    assert len(interned[0]["alternativas"]) == 3   # " Apenas I e II " deduplicada pela chave stripped
@@ -0,0 +1,19 @@
+# -*- coding: utf-8 -*-
+from collections import Counter
+
+from benchmarks.synth import synthetic_bank, write_bank
+from core.loader import load_quiz
+from core.validate import errors, validate_bank
+
+
+def test_synthetic_bank_is_valid_and_mixed(tmp_path):
+    qs = synthetic_bank(400, seed=5)
+    assert qs == synthetic_bank(400, seed=5)
+    assert set(Counter(q["tipo"] for q in qs)) == {1, 2, 3, 4}
+    assert any(k.startswith("alternativas;") for q in qs for k in q)
+    assert not errors(validate_bank(qs, base_dir=tmp_path))    # imagens ainda não existem: só avisos
+
+    bank = write_bank(tmp_path / "banco.json", 400, seed=5, images=True)
+    assert not validate_bank(qs, base_dir=tmp_path)
+    loaded = load_quiz(str(bank), shuffle_seed=1)["questions"]
+    assert len(loaded) == 400 and all(isinstance(q["alternativas"], list) for q in loaded)
@@ -0,0 +1,50 @@
+# -*- coding: utf-8 -*-
+import json
+
+from core.validate import (ERROR, WARNING, ValidationCache, errors, summarize_issues, validate_bank,
+                           validate_banks)
+
+
+def test_reports_every_problem_with_location():
+    qs = [
+        {"id": 1, "tipo": 3, "enunciado": "Valor <X> e <Z>", "variaveis": {"X": {"min": 1, "max": 2, "step": 1}},
+         "resolucoes": {"R": "X*2 + W"}, "alternativas": ["<R+>"], "correta": ""},
+        {"id": 2, "enunciado": "Figura", "imagens": ["fig.png;10y3"], "alternativas": ["x"], "correta": "x"},
+    ]
+    issues = validate_bank(qs, file="banco.json")
+    found = {(i.qid, i.field, i.severity) for i in issues}
+    assert (1, "correta", ERROR) in found                  # correta ausente
+    assert (1, "resolucoes", ERROR) in found               # W desconhecida
+    assert (1, "enunciado", ERROR) in found                # <Z> desconhecida
+    assert (1, "alternativas", ERROR) in found             # expressão inválida
+    assert (2, "imagens", ERROR) in found                  # LxA inválido
+    assert (2, "correta", WARNING) in found                # correta repete uma alternativa
+    assert all(i.file == "banco.json" for i in issues)
+
+
+def test_validate_banks_files(tmp_path):
+    ok = tmp_path / "ok.json"
+    ok.write_text(json.dumps([{"id": 1, "enunciado": "a", "imagens": ["nao_existe.png"],
+                               "alternativas": ["b"], "correta": "c"}]), encoding="utf-8")
+    bad = tmp_path / "bad.json"
+    bad.write_text("{nope", encoding="utf-8")
+    issues = validate_banks([ok, bad])
+    assert [i.severity for i in issues if i.file == str(ok)] == [WARNING]   # imagem ausente
+    assert [i.field for i in errors(issues)] == ["arquivo"]
+
+
+def test_validation_cache_and_summary(tmp_path):
+    bank = tmp_path / "banco.json"
+    qs = [{"id": i, "enunciado": "a", "imagens": [f"falta{i}.png"], "alternativas": ["b"], "correta": "c"}
+          for i in range(30)]
+    bank.write_text(json.dumps(qs), encoding="utf-8")
+    cache = ValidationCache()
+    first = cache.validate_banks([bank])
+    assert len(first) == 30
+    assert cache.validate_file(bank) is cache.validate_file(bank)          # arquivo inalterado: guardado
+    summary = summarize_issues(first, first=5)
+    assert summary.splitlines()[0] == "banco.json: 0 erro(s), 30 aviso(s)"
+    assert len(summary.splitlines()) == 1 + 5 + 1 and "mais 25" in summary
+
+    bank.write_text(json.dumps(qs[:1] + [{"id": 99, "enunciado": ""}]), encoding="utf-8")
+    assert {i.qid for i in errors(cache.validate_banks([bank]))} == {99}
@@ -0,0 +1,38 @@
+# -*- coding: utf-8 -*-
+import os
+
+from core.watch import FileWatcher, outputs_affected, referenced_images
+
+
+def _touch(p, text):
+    p.write_text(text, encoding="utf-8")
+    st = os.stat(p)
+    os.utime(p, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+
+
+def test_poll_debounces_burst(tmp_path):
+    f = tmp_path / "banco.json"
+    f.write_text("[]", encoding="utf-8")
+    w = FileWatcher(debounce=0.3)
+    w.set_files([f])
+    assert w.poll(now=0.0) == set()
+
+    _touch(f, "[1]")
+    assert w.poll(now=1.0) == set()      # mudança detectada, ainda na janela de debounce
+    _touch(f, "[1, 2]")
+    assert w.poll(now=1.2) == set()      # nova mudança reinicia a janela
+    assert w.poll(now=1.6) == {f.resolve()}
+    assert w.poll(now=2.0) == set()
+
+
+def test_outputs_affected_and_images(tmp_path):
+    qs = [{"enunciado": "x", "imagens": ["fig/a.png;5x3"], "alternativas": ["fig/b.jpg", "texto"]}]
+    imgs = referenced_images(qs, tmp_path)
+    assert imgs == {tmp_path / "fig/a.png", tmp_path / "fig/b.jpg"}
+
+    bank = tmp_path / "banco.json"
+    template = tmp_path / "t.docx"
+    deps = {"tex": {bank} | imgs, "docx": {bank, template}}
+    assert outputs_affected([tmp_path / "fig/a.png"], deps) == ["tex"]
+    assert outputs_affected([template], deps) == ["docx"]
+    assert outputs_affected([bank], deps) == ["tex", "docx"]
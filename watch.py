@@ -0,0 +1,121 @@
+# -*- coding: utf-8 -*-
+"""
+Modo "watch" sem interface: observa os JSONs (e as imagens/template que eles usam) e
+regera só as saídas afetadas a cada alteração.
+
+Uso (na raiz do projeto):
+    python watch.py banco1.json [banco2.json ...] --tex slides.tex [--pdf]
+                    [--docx prova.docx --template assets/template_prova.docx --num 10] [--seed 42]
+"""
+from __future__ import annotations
+from pathlib import Path
+from typing import Dict, List, Optional, Set
+import argparse, time
+
+from core.cache import DatasetCache
+from core.watch import FileWatcher, outputs_affected, referenced_images, POLL_INTERVAL, DEBOUNCE
+
+
+class WatchSession:
+    """Regera .tex/.pdf/.docx a partir de um DatasetCache (arquivos inalterados não são relidos)."""
+
+    def __init__(self, paths: List[str], *, tex: Optional[str] = None, pdf: bool = False,
+                 docx: Optional[str] = None, template: Optional[str] = None, num: Optional[int] = None,
+                 seed: Optional[int] = None, title: str = "Exercícios – Apresentação"):
+        self.paths = paths
+        self.tex = tex
+        self.pdf = pdf
+        self.docx = docx
+        self.template = template or "assets/template_prova.docx"
+        self.num = num
+        self.seed = seed
+        self.title = title
+        self.datasets = DatasetCache()
+
+    def deps(self) -> Dict[str, Set[Path]]:
+        """Saída -> arquivos de que depende (JSONs, imagens referenciadas e, na prova, o template)."""
+        files: Set[Path] = {Path(p) for p in self.paths}
+        for p in self.paths:
+            try:
+                files |= referenced_images(self.datasets.questions(p), Path(p).parent)
+            except Exception:
+                pass  # JSON inválido no momento: observa só o próprio arquivo
+        out: Dict[str, Set[Path]] = {}
+        if self.tex:
+            out["pdf" if self.pdf else "tex"] = files
+        if self.docx:
+            out["docx"] = files | {Path(self.template)}
+        return out
+
+    def regenerate(self, outputs: List[str]) -> None:
+        for name in outputs:
+            t0 = time.perf_counter()
+            try:
+                if name in ("tex", "pdf"):
+                    from beamer.generator import json2beamer
+                    json2beamer(input_json=self.paths, output_tex=self.tex, shuffle_seed=self.seed, title=self.title,
+                                questions=self.datasets.merged_questions(self.paths, renumber=len(self.paths) > 1))
+                    if name == "pdf":
+                        from beamer.pdflatex import compile_pdf
+                        compile_pdf(self.tex, passes=2)
+                    target = Path(self.tex).with_suffix(".pdf") if name == "pdf" else self.tex
+                else:
+                    from testgen.generator import json2docx
+                    json2docx(self.paths, self.template, self.docx, num=self.num, seed=self.seed,
+                              questions=self.datasets.merged_questions(self.paths))
+                    target = self.docx
+                print(f"[{time.strftime('%H:%M:%S')}] ✅ {name}: {target} ({(time.perf_counter() - t0)*1000:.0f} ms)", flush=True)
+            except Exception as e:
+                print(f"[{time.strftime('%H:%M:%S')}] ❌ {name}: {e}", flush=True)
+
+    def run(self, *, interval: float = POLL_INTERVAL, debounce: float = DEBOUNCE) -> None:
+        deps = self.deps()
+        self.regenerate(list(deps))
+        watcher = FileWatcher(interval=interval, debounce=debounce)
+        watcher.set_files(set().union(*deps.values()) if deps else set())
+        print(f"Observando {len(watcher.files)} arquivo(s). Ctrl+C para sair.", flush=True)
+        try:
+            while True:
+                time.sleep(interval)
+                changed = watcher.poll()
+                if not changed:
+                    continue
+                affected = outputs_affected(changed, deps)
+                print(f"[{time.strftime('%H:%M:%S')}] alterado(s): " + ", ".join(p.name for p in sorted(changed)), flush=True)
+                self.regenerate(affected)
+                deps = self.deps()  # imagens referenciadas podem ter mudado
+                watcher.set_files(set().union(*deps.values()) if deps else set())
+        except KeyboardInterrupt:
+            pass
+
+
+def build_parser(ap: Optional[argparse.ArgumentParser] = None) -> argparse.ArgumentParser:
+    ap = ap or argparse.ArgumentParser(description="Regera slides/prova quando os JSONs mudam.")
+    ap.add_argument("jsons", nargs="+", help="arquivos JSON de questões")
+    ap.add_argument("--tex", help="saída .tex (slides)")
+    ap.add_argument("--pdf", action="store_true", help="compilar o .tex com pdflatex")
+    ap.add_argument("--docx", help="saída .docx (prova)")
+    ap.add_argument("--template", default="assets/template_prova.docx", help="template .docx da prova")
+    ap.add_argument("--num", type=int, default=None, help="nº de questões da prova")
+    ap.add_argument("--seed", type=int, default=None)
+    ap.add_argument("--interval", type=float, default=POLL_INTERVAL, help="intervalo de polling (s)")
+    ap.add_argument("--debounce", type=float, default=DEBOUNCE, help="espera após a última mudança (s)")
+    return ap
+
+
+def run_from_args(args: argparse.Namespace) -> int:
+    tex = args.tex
+    if not tex and not args.docx:
+        first = Path(args.jsons[0])
+        tex = str(first.with_name(first.stem + "_slides.tex"))
+    WatchSession(args.jsons, tex=tex, pdf=args.pdf, docx=args.docx, template=args.template,
+                 num=args.num, seed=args.seed).run(interval=args.interval, debounce=args.debounce)
+    return 0
+
+
+def main(argv=None) -> int:
+    return run_from_args(build_parser().parse_args(argv))
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())